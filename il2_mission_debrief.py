@@ -39,24 +39,29 @@ class GameObject:
         self.time_of_kill = None
         self.altitude = None  # Altitude when destroyed
 
+    @staticmethod
+    def config_path():
+        """Path of the object_categories.yaml that _load_config reads."""
+        # Try external file first (for user editing), then embedded
+        import sys
+        
+        if getattr(sys, 'frozen', False):
+            # Running as EXE - check directory next to EXE first
+            exe_dir = Path(sys.executable).parent
+            cfg_path = exe_dir / "object_categories.yaml"
+            if not cfg_path.exists():
+                # Fallback to embedded
+                cfg_path = Path(sys._MEIPASS) / "object_categories.yaml"
+        else:
+            # Running as script
+            cfg_path = Path(__file__).with_name("object_categories.yaml")
+        return cfg_path
+
     @classmethod
     def _load_config(cls):
         """Load category definitions once from YAML."""
         if cls._category_config is None:
-            # Try external file first (for user editing), then embedded
-            import sys
-            cfg_path = None
-            
-            if getattr(sys, 'frozen', False):
-                # Running as EXE - check directory next to EXE first
-                exe_dir = Path(sys.executable).parent
-                cfg_path = exe_dir / "object_categories.yaml"
-                if not cfg_path.exists():
-                    # Fallback to embedded
-                    cfg_path = Path(sys._MEIPASS) / "object_categories.yaml"
-            else:
-                # Running as script
-                cfg_path = Path(__file__).with_name("object_categories.yaml")
+            cfg_path = cls.config_path()
             
             try:
                 with open(cfg_path, encoding="utf-8") as f:
@@ -17,10 +17,117 @@ Command line options:
 
 import os
 import re
+import codecs
 import json
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+# orjson is optional - it writes the same indented JSON much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Common words expected in an English campaign description - used to check
+# that a description was decoded with the right encoding
+_ENGLISH_HINT_WORDS = ('campaign', 'mission', 'pilot', 'aircraft', 'the ', 'and ')
+
+# Leading mission number of a file name or mission id ("01a" -> "01")
+_LEADING_DIGITS = re.compile(r'^(\d+)')
+
+# Banner separator line
+_SEP = "=" * 70
+
+# tkinter is only needed for the first-run folder dialog, so it is imported
+# on first use (see select_game_directory_gui) rather than at startup
+_tk = None
+_filedialog = None
+
+# Game directory picked in the folder dialog, saved as soon as it is chosen so
+# a re-run after an interrupted first scan doesn't need the dialog again
+_GAME_DIR_CACHE_FILE = ".il2_tracker_path.json"
+
+
+class _KeywordScanner:
+    """
+    Finds which of many per-country keywords occur in a text in one regex pass
+    
+    All keywords are fused into a single pattern. The leading lookahead only
+    stops at positions where some keyword starts; there, one optional lookahead
+    per keyword records every keyword matching at that spot. Nothing is consumed,
+    so overlapping keywords (e.g. "365th" inside "365th fighter") are all still
+    found - same result as searching for each keyword on its own.
+    """
+    
+    def __init__(self, keywords_by_country: Dict[str, List[str]], literal: bool = False):
+        """
+        Args:
+            keywords_by_country: Country -> list of keywords (regex or plain text)
+            literal: If True, keywords are plain substrings and get escaped
+        """
+        self.countries = list(keywords_by_country)
+        self._group_countries = {}  # regex group name -> country
+        
+        # A country can score at most its number of keywords, so a leader whose
+        # score beats every other country's keyword count can no longer be caught
+        self._winning_score = {
+            country: 1 + max((len(others) for other, others in keywords_by_country.items() if other != country),
+                             default=0)
+            for country in keywords_by_country
+        }
+        
+        alternatives = []
+        lookaheads = []
+        for country, keywords in keywords_by_country.items():
+            for keyword in keywords:
+                pattern = re.escape(keyword) if literal else keyword
+                group = f'k{len(self._group_countries)}'
+                self._group_countries[group] = country
+                alternatives.append(pattern)
+                lookaheads.append(f'(?:(?=(?P<{group}>{pattern})))?')
+        
+        self._pattern = re.compile('(?=' + '|'.join(alternatives) + ')' + ''.join(lookaheads))
+    
+    def count(self, text: str, stop_when_decided: bool = False) -> Dict[str, int]:
+        """
+        Count keywords found per country (each keyword counts once, however often it appears)
+        
+        Args:
+            text: Text to scan
+            stop_when_decided: If True, stop scanning as soon as one country has
+                an unbeatable lead. The leader is the same as with a full scan,
+                but the returned scores are then only partial.
+        """
+        found_groups = set()
+        scores = {country: 0 for country in self.countries}
+        
+        for match in self._pattern.finditer(text):
+            for group, value in match.groupdict().items():
+                if value is not None and group not in found_groups:
+                    found_groups.add(group)
+                    country = self._group_countries[group]
+                    scores[country] += 1
+                    if stop_when_decided and scores[country] >= self._winning_score[country]:
+                        return scores
+        
+        return scores
+
+
+def _read_lowered(path: Path, encoding: str, errors: str = 'strict') -> str:
+    """
+    Read a text file and return its content lowercased
+    
+    Lowercases the raw bytes before decoding instead of decoding and then
+    calling str.lower(), which saves a second full-size string allocation.
+    All detection keywords are ASCII, and bytes.lower() only touches ASCII
+    A-Z, so this gives the same matches for UTF-8, UTF-16 and Latin-1 files.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return raw.lower().decode(encoding, errors)
 
 
 class CampaignDateExtractor:
@@ -38,6 +145,17 @@ class CampaignDateExtractor:
         self.verbose = verbose
         self.exclude_ww1 = exclude_ww1
         
+        # Only the start of a campaign description is read for country detection -
+        # keywords almost always appear near the top. Raise for unusually long texts.
+        self.max_detect_bytes = 16384
+        
+        # Same for mission briefings: the "Date:" line is read from the first block
+        # and the rest of the file only if it isn't found there
+        self.briefing_head_bytes = 8192
+        
+        # Threads used to read a campaign's briefings in parallel (None = Python default)
+        self.max_workers = None
+        
         # Build stock campaigns mapping immediately
         self._load_stock_campaigns_mapping()
         
@@ -88,6 +206,226 @@ class CampaignDateExtractor:
             # French aircraft (WW1, often used by USA in WW1)
             'spad': 'France',
         }
+        
+        # Single alternation over all aircraft keys, used to scan the campaign
+        # description in one pass. Each key matches as "fw190" or "fw 190" (space
+        # before number). Longest variants first so "me 410" is not cut short by "me".
+        variants = []
+        for aircraft_key in self.aircraft_countries:
+            aircraft_with_space = re.sub(r'([a-z]+)(\d+)', r'\1 \2', aircraft_key)  # "fw190" -> "fw 190"
+            variants.append((aircraft_key, aircraft_key))
+            if aircraft_with_space != aircraft_key:
+                variants.append((aircraft_with_space, aircraft_key))
+        variants.sort(key=lambda v: len(v[0]), reverse=True)
+        
+        self._aircraft_group_keys = {}  # regex group name -> aircraft key
+        group_patterns = []
+        for index, (variant, aircraft_key) in enumerate(variants):
+            self._aircraft_group_keys[f'a{index}'] = aircraft_key
+            group_patterns.append(rf'(?P<a{index}>\b{re.escape(variant)}\b)')
+        self._aircraft_pattern = re.compile('|'.join(group_patterns))
+        
+        # Campaign/mission name keywords (plain substrings of lowercased names)
+        name_keywords = {
+            'Germany': [
+                # Luftwaffe specific
+                'luftwaffe', 'jg', 'kg', 'stg', 'nachtjagd', 'jagdgeschwader', 
+                'kampfgeschwader', 'sturzkampfgeschwader', 'zerstorergeschwader',
+                # German aircraft (very distinctive)
+                'bf109', 'bf110', 'bf-109', 'bf-110', 'me109', 'me-109', 
+                'fw190', 'fw-190', 'focke-wulf', 'me262', 'me-262',
+                'ju87', 'ju-87', 'stuka', 'ju88', 'ju-88',
+                'he111', 'he-111', 'heinkel', 'do217', 'do-217',
+                # Axis allies (use German ranks/awards in game)
+                'iar80', 'iar-80', 'iar81', 'iar-81',  # Romania
+                'mc202', 'mc-202', 'mc200', 'mc-200',  # Italy
+                # Squadron designations
+                'i./jg', 'ii./jg', 'iii./jg', 'iv./jg',
+                'i./kg', 'ii./kg', 'iii./kg', 'iv./kg',
+            ],
+            'Soviet Union': [
+                # VVS specific
+                'vvs', 'voenno-vozdushnye', 'gvardeyskiy',
+                # Soviet aircraft
+                'yak', 'yak-', 'lagg', 'lagg-', 'la-', 'lavochkin',
+                'il-2', 'il2', 'shturmovik', 'pe-2', 'pe2', 'peshka',
+                'i-16', 'i16', 'rata', 'mig-3', 'mig3',
+                # Soviet squadrons
+                'giap', 'gshap', 'iap', 'shap', 'gvap',
+            ],
+            'USA': [
+                # USAAF/USAF
+                'usaaf', 'usaf', 'usaac', 'u.s.aaf', 'u.s.af',
+                'fighter squadron', 'fighter group', 'bombardment',
+                'mighty eighth', '8th air force',
+                # US aircraft
+                'p-38', 'p38', 'lightning', 'p-39', 'p39', 'airacobra',
+                'p-40', 'p40', 'warhawk', 'tomahawk', 'kittyhawk',
+                'p-47', 'p47', 'thunderbolt', 'p-51', 'p51', 'mustang',
+                'b-17', 'b17', 'b-24', 'b24', 'b-25', 'b25',
+                'a-20', 'a20', 'havoc', 'boston',
+            ],
+            'Britain': [
+                # RAF specific
+                'raf', 'r.a.f.', 'royal air force',
+                'squadron', 'wing', 'group',
+                # RAF aircraft
+                'spitfire', 'hurricane', 'typhoon', 'tempest',
+                'mosquito', 'beaufighter', 'halifax', 'lancaster',
+                'wellington', 'blenheim',
+                # Specific RAF ops
+                'battle of britain', 'bob', 'bomber command',
+            ],
+        }
+        self._name_scanner = _KeywordScanner(name_keywords, literal=True)
+        
+        # Mission briefing keywords (last resort), checked in this priority order
+        self._briefing_scanner = _KeywordScanner({
+            'Germany': ['luftwaffe', 'wehrmacht', 'jagdgeschwader'],
+            'Soviet Union': ['vvs', 'red army', 'soviet'],
+            'Britain': ['raf', 'royal air force', 'squadron'],
+            'USA': ['usaaf', 'usaf', 'fighter group'],
+        }, literal=True)
+        
+        # Campaign description keywords (matched against lowercased text)
+        # German indicators
+        german_keywords = [
+            r'\biar[\s-]?80',        # IAR-80, IAR 80 (Romanian Axis aircraft) - STRONG INDICATOR
+            r'\biar[\s-]?80',        # Double weight for IAR80 (unique identifier)
+            r'\biar[\s-]?81',        # IAR-81 - STRONG INDICATOR
+            r'\biar[\s-]?81',        # Double weight for IAR81
+            r'\bmc[\s-]?20[02]',     # MC-200, MC-202 (Italian Axis aircraft)
+            r'\bjg\s*\d+',           # JG 52, JG 54, etc. (Jagdgeschwader)
+            r'\bkg\s*\d+',           # KG 51, etc. (Kampfgeschwader)
+            r'\bstg\s*\d+',          # StG 77, etc. (Stukageschwader)
+            r'\bzg\s*\d+',           # ZG (Zerstörergeschwader)
+            r'\bluftwaf+e',          # Luftwaffe
+            r'\bwehrmacht\b',        # Wehrmacht
+            r'\bbf[\s-]?109',        # Bf-109, Bf 109
+            r'\bfw[\s-]?190',        # Fw-190
+            r'\bme[\s-]?410',        # ME-410
+            r'\bme[\s-]?262',        # ME-262
+            r'\bmesserschmitt\b',    # Messerschmitt
+            r'\bfocke.wulf\b',       # Focke-Wulf
+            r'\bjunkers\b',          # Junkers
+            r'\bgerman\s+pilot',     # German pilot
+            r'\bgerman\s+forces',    # German forces
+            r'\bgerman\s+air\s+force', # German Air Force
+        ]
+        
+        # Soviet indicators
+        soviet_keywords = [
+            r'\biap\s*\d+',          # IAP (Fighter Aviation Regiment)
+            r'\bgvap\s*\d+',         # GVAP (Guards Fighter Aviation Regiment)
+            r'\bshap\s*\d+',         # ShAP (Ground Attack Aviation Regiment)
+            r'\bvvs\b',              # VVS (Soviet Air Force)
+            r'\bred\s+air\s+force',  # Red Air Force
+            r'\bred\s+army',         # Red Army
+            r'\bsoviet\s+pilot',     # Soviet pilot
+            r'\bsoviet\s+forces',    # Soviet forces
+            r'\byak[\s-]?[0-9]',     # Yak-1, Yak-9, etc.
+            r'\bila[\s-]?2',         # Il-2
+            r'\bla[\s-]?[0-9]',      # La-5, La-7
+            r'\blagg[\s-]?3',        # LaGG-3
+            r'\bpe[\s-]?2',          # Pe-2
+        ]
+        
+        # British indicators
+        british_keywords = [
+            r'\braf\b',              # RAF
+            r'\broyal\s+air\s+force', # Royal Air Force
+            r'\bsquadron\s+\d+',     # Squadron 601, etc.
+            r'\bbritish\s+pilot',    # British pilot
+            r'\bspitfire\b',         # Spitfire
+            r'\bhurricane\b',        # Hurricane
+            r'\btyphoon\b',          # Typhoon
+            r'\btempest\b',          # Tempest
+            r'\bmosquito\b',         # Mosquito
+        ]
+        
+        # American indicators
+        american_keywords = [
+            r'\busaaf\b',            # USAAF
+            r'\busaf\b',             # USAF
+            r'\b\d+th\s+fighter',    # 56th Fighter Group, etc.
+            r'\b\d+th\s+bomb',       # 305th Bomb Group
+            r'\b\d+fg\b',            # 366FG format (Fighter Group abbreviation)
+            r'\b365th\b',            # 365th Fighter Group (hawks campaign)
+            r'\b366th\b',            # 366th Fighter Group (hurtgen)
+            r'\bamerican\s+pilot',   # American pilot
+            r'\bus\s+air\s+force',   # US Air Force
+            r'\bp[\s-]?38',          # P-38
+            r'\bp[\s-]?47',          # P-47
+            r'\bp[\s-]?51',          # P-51
+            r'\bmustang\b',          # Mustang
+            r'\bthunderbolt\b',      # Thunderbolt
+            r'\blightning\b.*p.?38', # Lightning (with P-38 nearby)
+            r'\brepublic\s+p',       # Republic P-47
+            r'\b361st\b',            # 361st Fighter Group
+            r'\b362nd\b',            # 362nd Fighter Group  
+            r'\b368th\b',            # 368th Fighter Group
+            r'\b370th\b',            # 370th Fighter Group
+            r'\bhurtgen\b',          # Hurtgen Forest (US battle)
+            r'\baachen\b',           # Battle of Aachen (US involvement)
+            r'\bbastogne\b',         # Bastogne (US)
+            r'\bbulge\b',            # Battle of the Bulge (US)
+            r'\bninth\s+air\s+force', # Ninth Air Force (US)
+        ]
+        
+        description_keywords = {
+            'Germany': german_keywords,
+            'Soviet Union': soviet_keywords,
+            'Britain': british_keywords,
+            'USA': american_keywords,
+        }
+        
+        self._description_scanner = _KeywordScanner(description_keywords)
+        
+        # &planes= line in info.txt
+        self._planes_pattern = re.compile(r'&planes=(.+)', re.IGNORECASE)
+        
+        # Briefing date marker, one alternation for all formats:
+        # "<b>Date:</b>Sept 18th, 1942"  (colon inside tags)
+        # "<b>Date: </b>20.10.1940"      (colon outside closing tag)
+        # "<u>Date</u><br>March 1918"    (within <u>Date</u> tags)
+        # "Date: 4 November, 1943<br>"   (possible tags after)
+        # The first marker in the file wins; the tagged forms are listed first so
+        # "<b>Date:</b>" is matched as a whole rather than from "Date:" onwards.
+        self._date_pattern = re.compile(
+            r'(?:<b>Date:</b>|<b>Date:\s*</b>|<u>Date</u>\s*(?:<br>)*|Date:)'
+            r'\s*(?:</?[\w\s]+>)*\s*([^<\n\r]+)',
+            re.IGNORECASE
+        )
+        # Trailing text after the date ("... Time 10:00", "... Weather clear")
+        self._date_trailer_split = re.compile(r'\s+(Time|Weather|Airfield|Callsign|Wind)', re.IGNORECASE)
+        
+        # normalize_date helpers
+        self._ordinal_pattern = re.compile(r'(\d+)(st|nd|rd|th)')
+        self._month_abbrev = {
+            'jan': 'January', 'feb': 'February', 'mar': 'March', 'apr': 'April',
+            'may': 'May', 'jun': 'June', 'jul': 'July', 'aug': 'August',
+            'sept': 'September', 'oct': 'October', 'nov': 'November', 'dec': 'December'
+        }
+        # Word boundaries avoid partial matches ("Mar" inside "March")
+        self._month_abbrev_pattern = re.compile(
+            r'\b(' + '|'.join(self._month_abbrev) + r')\b', re.IGNORECASE
+        )
+        # "September 3 1942" / "3 September 1942" in one match instead of one
+        # strptime attempt (and ValueError) per format. Day and year follow the
+        # %d and %Y patterns strptime uses, so the same strings are accepted.
+        self._month_numbers = {
+            'january': 1, 'february': 2, 'march': 3, 'april': 4,
+            'may': 5, 'june': 6, 'july': 7, 'august': 8,
+            'september': 9, 'october': 10, 'november': 11, 'december': 12
+        }
+        month_names = '|'.join(self._month_numbers)
+        day = r'3[01]|[12]\d|0[1-9]|[1-9]'
+        self._date_tokens = re.compile(
+            rf'(?:(?P<month>{month_names})\s+(?P<day>{day})'
+            rf'|(?P<day2>{day})\s+(?P<month2>{month_names}))'
+            r'\s+(?P<year>\d{4})',
+            re.IGNORECASE
+        )
     
     def is_ww1_campaign(self, campaign_name: str, campaign_data: Dict) -> bool:
         """
@@ -137,8 +475,7 @@ class CampaignDateExtractor:
         info_file = campaign_path / 'info.txt'
         if info_file.exists():
             try:
-                with open(info_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read().lower()
+                content = _read_lowered(info_file, 'utf-8', errors='ignore')
                 
                 ww1_aircraft = ['fokker', 'albatros', 'pfalz', 'sopwith', 'spad', 
                                'se5', 'bristol', 'nieuport', 'halberstadt']
@@ -153,8 +490,7 @@ class CampaignDateExtractor:
         info_locale = campaign_path / 'info.locale=eng.txt'
         if info_locale.exists():
             try:
-                with open(info_locale, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read().lower()
+                content = _read_lowered(info_locale, 'utf-8', errors='ignore')
                 
                 # Strong WW1 indicators (not just year mentions)
                 strong_ww1_keywords = ['flying circus', 'world war 1', 'world war i', 
@@ -215,13 +551,16 @@ class CampaignDateExtractor:
         
         try:
             import yaml
+            # libyaml's C loader is much faster; PyYAML without it has only SafeLoader
+            safe_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            
             # Try UTF-8 first, fallback to ISO-8859-1 for files with umlauts
             try:
                 with open(stock_file, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=safe_loader)
             except UnicodeDecodeError:
                 with open(stock_file, 'r', encoding='iso-8859-1') as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=safe_loader)
             
             stock_campaigns = data.get('stock_campaigns', {})
             
@@ -240,6 +579,15 @@ class CampaignDateExtractor:
             print(f"\n  Building stock campaigns mapping...")
             print(f"  Scanning {len(campaign_folders)} folders...")
             
+            # Lowercase stock names once for case-insensitive lookup (first entry wins)
+            stock_lookup = {}
+            for stock_name, country in stock_campaigns.items():
+                stock_lookup.setdefault(stock_name.lower(), country)
+            
+            # Extract &name="Campaign Name" or &name=Campaign Name
+            name_quoted_pattern = re.compile(r'&name="([^"]+)"')
+            name_unquoted_pattern = re.compile(r'&name=([^\s\n;]+)')  # Some campaigns don't use quotes
+            
             matched = 0
             for folder in campaign_folders:
                 info_file = folder / "info.locale=eng.txt"
@@ -248,7 +596,6 @@ class CampaignDateExtractor:
                     continue
                 
                 try:
-                    import re
                     content = None
                     
                     # Try multiple encodings
@@ -267,22 +614,21 @@ class CampaignDateExtractor:
                     
                     # Extract &name="Campaign Name" or &name=Campaign Name
                     # Try quoted version first
-                    match = re.search(r'&name="([^"]+)"', content)
+                    match = name_quoted_pattern.search(content)
                     if not match:
                         # Try unquoted version (some campaigns don't use quotes)
-                        match = re.search(r'&name=([^\s\n;]+)', content)
+                        match = name_unquoted_pattern.search(content)
                     
                     if match:
                         display_name = match.group(1)
                         
                         # Check if this matches any stock campaign (case-insensitive)
-                        for stock_name, country in stock_campaigns.items():
-                            if stock_name.lower() == display_name.lower():
-                                self._stock_folder_mapping[folder.name] = country
-                                matched += 1
-                                if self.verbose:
-                                    print(f"    ✓ {folder.name} → '{display_name}' → {country}")
-                                break
+                        country = stock_lookup.get(display_name.lower())
+                        if country is not None:
+                            self._stock_folder_mapping[folder.name] = country
+                            matched += 1
+                            if self.verbose:
+                                print(f"    ✓ {folder.name} → '{display_name}' → {country}")
                     else:
                         if self.verbose:
                             print(f"    ✗ {folder.name}: No &name= found in first 1000 chars")
@@ -350,8 +696,12 @@ class CampaignDateExtractor:
         elif self.verbose:
             print(f"    Method 0 (Names): No match")
         
-        # Method 1: Check aircraft from info.txt
+        # Method 1: Check aircraft from info.txt, then from the description.
+        # The description is read once here and reused by Method 2 below.
         country = self._detect_from_aircraft(campaign_path)
+        if not country:
+            description = self._read_description(campaign_path)
+            country = self._detect_aircraft_in_description(description)
         if country:
             if self.verbose:
                 print(f"    Detection method: Aircraft type")
@@ -360,7 +710,7 @@ class CampaignDateExtractor:
             print(f"    Method 1 (Aircraft): No match")
         
         # Method 2: Check campaign description
-        country, scores = self._detect_from_description(campaign_path)
+        country, scores = self._detect_from_description(description)
         if country:
             if self.verbose:
                 print(f"    Detection method: Campaign description keywords")
@@ -387,58 +737,6 @@ class CampaignDateExtractor:
         Detect country from campaign name and mission filenames
         HIGHEST PRIORITY - names often contain clear indicators
         """
-        name_keywords = {
-            'Germany': [
-                # Luftwaffe specific
-                'luftwaffe', 'jg', 'kg', 'stg', 'nachtjagd', 'jagdgeschwader', 
-                'kampfgeschwader', 'sturzkampfgeschwader', 'zerstorergeschwader',
-                # German aircraft (very distinctive)
-                'bf109', 'bf110', 'bf-109', 'bf-110', 'me109', 'me-109', 
-                'fw190', 'fw-190', 'focke-wulf', 'me262', 'me-262',
-                'ju87', 'ju-87', 'stuka', 'ju88', 'ju-88',
-                'he111', 'he-111', 'heinkel', 'do217', 'do-217',
-                # Axis allies (use German ranks/awards in game)
-                'iar80', 'iar-80', 'iar81', 'iar-81',  # Romania
-                'mc202', 'mc-202', 'mc200', 'mc-200',  # Italy
-                # Squadron designations
-                'i./jg', 'ii./jg', 'iii./jg', 'iv./jg',
-                'i./kg', 'ii./kg', 'iii./kg', 'iv./kg',
-            ],
-            'Soviet Union': [
-                # VVS specific
-                'vvs', 'voenno-vozdushnye', 'gvardeyskiy',
-                # Soviet aircraft
-                'yak', 'yak-', 'lagg', 'lagg-', 'la-', 'lavochkin',
-                'il-2', 'il2', 'shturmovik', 'pe-2', 'pe2', 'peshka',
-                'i-16', 'i16', 'rata', 'mig-3', 'mig3',
-                # Soviet squadrons
-                'giap', 'gshap', 'iap', 'shap', 'gvap',
-            ],
-            'USA': [
-                # USAAF/USAF
-                'usaaf', 'usaf', 'usaac', 'u.s.aaf', 'u.s.af',
-                'fighter squadron', 'fighter group', 'bombardment',
-                'mighty eighth', '8th air force',
-                # US aircraft
-                'p-38', 'p38', 'lightning', 'p-39', 'p39', 'airacobra',
-                'p-40', 'p40', 'warhawk', 'tomahawk', 'kittyhawk',
-                'p-47', 'p47', 'thunderbolt', 'p-51', 'p51', 'mustang',
-                'b-17', 'b17', 'b-24', 'b24', 'b-25', 'b25',
-                'a-20', 'a20', 'havoc', 'boston',
-            ],
-            'Britain': [
-                # RAF specific
-                'raf', 'r.a.f.', 'royal air force',
-                'squadron', 'wing', 'group',
-                # RAF aircraft
-                'spitfire', 'hurricane', 'typhoon', 'tempest',
-                'mosquito', 'beaufighter', 'halifax', 'lancaster',
-                'wellington', 'blenheim',
-                # Specific RAF ops
-                'battle of britain', 'bob', 'bomber command',
-            ],
-        }
-        
         # Combine campaign name and mission names for analysis
         text_to_check = campaign_name.lower()
         
@@ -448,11 +746,8 @@ class CampaignDateExtractor:
             text_to_check += ' ' + mission_file.stem.lower()
         
         # Count keyword matches per country
-        scores = {}
-        for country, keywords in name_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text_to_check)
-            if score > 0:
-                scores[country] = score
+        scores = {country: score for country, score in self._name_scanner.count(text_to_check).items()
+                  if score > 0}
         
         if not scores:
             return None
@@ -474,7 +769,7 @@ class CampaignDateExtractor:
         return best_country
     
     def _detect_from_aircraft(self, campaign_path: Path) -> Optional[str]:
-        """Detect country from aircraft type in info.txt OR info.locale=eng.txt"""
+        """Detect country from aircraft type in info.txt (&planes= line)"""
         
         # Method 1: Check info.txt for &planes= line
         info_file = campaign_path / 'info.txt'
@@ -490,7 +785,7 @@ class CampaignDateExtractor:
                         content = f.read()
                 
                 # Look for &planes= line
-                plane_match = re.search(r'&planes=(.+)', content, re.IGNORECASE)
+                plane_match = self._planes_pattern.search(content)
                 
                 if plane_match:
                     plane_path = plane_match.group(1).strip().lower()
@@ -502,72 +797,45 @@ class CampaignDateExtractor:
             except:
                 pass
         
-        # Method 2: Check info.locale=eng.txt for aircraft mentions
-        info_locale_file = campaign_path / 'info.locale=eng.txt'
-        
-        if info_locale_file.exists():
-            try:
-                # Try UTF-16 LE first
-                try:
-                    with open(info_locale_file, 'r', encoding='utf-16-le') as f:
-                        content = f.read().lower()
-                except UnicodeDecodeError:
-                    with open(info_locale_file, 'r', encoding='utf-8') as f:
-                        content = f.read().lower()
-                
-                # Look for aircraft mentions in the description
-                # Common patterns: "Flyable Aircraft: Bf-109 G-6"
-                #                  "fly the ME 410"
-                #                  "P-47 Thunderbolt"
-                
-                # Check against aircraft database
-                for aircraft_key, country in self.aircraft_countries.items():
-                    # Look for the aircraft name with word boundaries or common separators
-                    # Handle both "fw190" and "fw 190" formats (with space before number)
-                    aircraft_with_space = re.sub(r'([a-z]+)(\d+)', r'\1 \2', aircraft_key)  # "fw190" -> "fw 190"
-                    
-                    patterns = [
-                        rf'\b{aircraft_key}[\s\-]',       # "p47-" or "p47 "
-                        rf'\b{aircraft_key}\b',            # "p47" as whole word
-                        rf'\b{aircraft_with_space}[\s\-]', # "p 47-" or "p 47 "
-                        rf'\b{aircraft_with_space}\b',     # "p 47" as whole words
-                    ]
-                    
-                    for pattern in patterns:
-                        if re.search(pattern, content):
-                            return country
-            except:
-                pass
-        
         return None
     
-    def _detect_from_description(self, campaign_path: Path) -> tuple[Optional[str], Dict[str, int]]:
-        """Detect country from campaign description keywords
+    def _read_description(self, campaign_path: Path) -> Optional[str]:
+        """
+        Read campaign description (info.locale=eng.txt) as lowercase text
+        
+        Tries several encodings and keeps the first one that yields readable
+        English text. Only the first max_detect_bytes of the file are read.
         
         Returns:
-            Tuple of (country_name, scores_dict)
+            Lowercased description or None if missing/undecodable
         """
         info_locale_file = campaign_path / 'info.locale=eng.txt'
         
-        scores = {'Germany': 0, 'Soviet Union': 0, 'Britain': 0, 'USA': 0}
-        
         if not info_locale_file.exists():
-            return None, scores
+            return None
         
         try:
-            # Try different encodings
             content = None
             encodings_to_try = ['utf-8', 'utf-16-le', 'utf-16-be', 'latin-1']
             
+            # Read and lowercase the raw bytes once, then only decode per encoding
+            with open(info_locale_file, 'rb') as f:
+                raw_lower = f.read(self.max_detect_bytes).lower()
+            
+            # If the read stopped at the limit, the last character may be cut in half.
+            # Incremental decoders drop an incomplete tail instead of raising.
+            truncated = len(raw_lower) == self.max_detect_bytes
+            
+            def decode(encoding):
+                return codecs.getincrementaldecoder(encoding)().decode(raw_lower, final=not truncated)
+            
             for encoding in encodings_to_try:
                 try:
-                    with open(info_locale_file, 'r', encoding=encoding) as f:
-                        test_content = f.read()
+                    test_lower = decode(encoding)
                     
                     # Validate that content looks reasonable (has normal ASCII characters)
                     # Check for common words that should be in English descriptions
-                    test_lower = test_content.lower()
-                    if any(word in test_lower for word in ['campaign', 'mission', 'pilot', 'aircraft', 'the ', 'and ']):
+                    if any(word in test_lower for word in _ENGLISH_HINT_WORDS):
                         content = test_lower
                         if self.verbose:
                             print(f"    Successfully read with {encoding}")
@@ -575,10 +843,20 @@ class CampaignDateExtractor:
                 except (UnicodeDecodeError, UnicodeError):
                     continue
             
+            if not content:
+                # No encoding gave recognisable English - fall back to the plain
+                # UTF-16 LE / UTF-8 decode so short texts can still name aircraft
+                for encoding in ['utf-16-le', 'utf-8']:
+                    try:
+                        content = decode(encoding)
+                        break
+                    except UnicodeDecodeError:
+                        continue
+            
             if not content:
                 if self.verbose:
                     print(f"    Warning: Could not decode file with any encoding")
-                return None, scores
+                return None
             
             if self.verbose:
                 print(f"    Read {len(content)} chars from description")
@@ -586,119 +864,65 @@ class CampaignDateExtractor:
                 if len(content) < 100:
                     print(f"    WARNING: Description seems too short!")
             
-            if not content or len(content) < 50:
-                # File read but empty or too short
-                return None, scores
-            
-            # German indicators
-            german_keywords = [
-                r'\biar[\s-]?80',        # IAR-80, IAR 80 (Romanian Axis aircraft) - STRONG INDICATOR
-                r'\biar[\s-]?80',        # Double weight for IAR80 (unique identifier)
-                r'\biar[\s-]?81',        # IAR-81 - STRONG INDICATOR
-                r'\biar[\s-]?81',        # Double weight for IAR81
-                r'\bmc[\s-]?20[02]',     # MC-200, MC-202 (Italian Axis aircraft)
-                r'\bjg\s*\d+',           # JG 52, JG 54, etc. (Jagdgeschwader)
-                r'\bkg\s*\d+',           # KG 51, etc. (Kampfgeschwader)
-                r'\bstg\s*\d+',          # StG 77, etc. (Stukageschwader)
-                r'\bzg\s*\d+',           # ZG (Zerstörergeschwader)
-                r'\bluftwaf+e',          # Luftwaffe
-                r'\bwehrmacht\b',        # Wehrmacht
-                r'\bbf[\s-]?109',        # Bf-109, Bf 109
-                r'\bfw[\s-]?190',        # Fw-190
-                r'\bme[\s-]?410',        # ME-410
-                r'\bme[\s-]?262',        # ME-262
-                r'\bmesserschmitt\b',    # Messerschmitt
-                r'\bfocke.wulf\b',       # Focke-Wulf
-                r'\bjunkers\b',          # Junkers
-                r'\bgerman\s+pilot',     # German pilot
-                r'\bgerman\s+forces',    # German forces
-                r'\bgerman\s+air\s+force', # German Air Force
-            ]
+            return content
             
-            # Soviet indicators
-            soviet_keywords = [
-                r'\biap\s*\d+',          # IAP (Fighter Aviation Regiment)
-                r'\bgvap\s*\d+',         # GVAP (Guards Fighter Aviation Regiment)
-                r'\bshap\s*\d+',         # ShAP (Ground Attack Aviation Regiment)
-                r'\bvvs\b',              # VVS (Soviet Air Force)
-                r'\bred\s+air\s+force',  # Red Air Force
-                r'\bred\s+army',         # Red Army
-                r'\bsoviet\s+pilot',     # Soviet pilot
-                r'\bsoviet\s+forces',    # Soviet forces
-                r'\byak[\s-]?[0-9]',     # Yak-1, Yak-9, etc.
-                r'\bila[\s-]?2',         # Il-2
-                r'\bla[\s-]?[0-9]',      # La-5, La-7
-                r'\blagg[\s-]?3',        # LaGG-3
-                r'\bpe[\s-]?2',          # Pe-2
-            ]
-            
-            # British indicators
-            british_keywords = [
-                r'\braf\b',              # RAF
-                r'\broyal\s+air\s+force', # Royal Air Force
-                r'\bsquadron\s+\d+',     # Squadron 601, etc.
-                r'\bbritish\s+pilot',    # British pilot
-                r'\bspitfire\b',         # Spitfire
-                r'\bhurricane\b',        # Hurricane
-                r'\btyphoon\b',          # Typhoon
-                r'\btempest\b',          # Tempest
-                r'\bmosquito\b',         # Mosquito
-            ]
-            
-            # American indicators
-            american_keywords = [
-                r'\busaaf\b',            # USAAF
-                r'\busaf\b',             # USAF
-                r'\b\d+th\s+fighter',    # 56th Fighter Group, etc.
-                r'\b\d+th\s+bomb',       # 305th Bomb Group
-                r'\b\d+fg\b',            # 366FG format (Fighter Group abbreviation)
-                r'\b365th\b',            # 365th Fighter Group (hawks campaign)
-                r'\b366th\b',            # 366th Fighter Group (hurtgen)
-                r'\bamerican\s+pilot',   # American pilot
-                r'\bus\s+air\s+force',   # US Air Force
-                r'\bp[\s-]?38',          # P-38
-                r'\bp[\s-]?47',          # P-47
-                r'\bp[\s-]?51',          # P-51
-                r'\bmustang\b',          # Mustang
-                r'\bthunderbolt\b',      # Thunderbolt
-                r'\blightning\b.*p.?38', # Lightning (with P-38 nearby)
-                r'\brepublic\s+p',       # Republic P-47
-                r'\b361st\b',            # 361st Fighter Group
-                r'\b362nd\b',            # 362nd Fighter Group  
-                r'\b368th\b',            # 368th Fighter Group
-                r'\b370th\b',            # 370th Fighter Group
-                r'\bhurtgen\b',          # Hurtgen Forest (US battle)
-                r'\baachen\b',           # Battle of Aachen (US involvement)
-                r'\bbastogne\b',         # Bastogne (US)
-                r'\bbulge\b',            # Battle of the Bulge (US)
-                r'\bninth\s+air\s+force', # Ninth Air Force (US)
-            ]
-            
-            # Count matches for each country
-            scores = {
-                'Germany': sum(1 for pattern in german_keywords if re.search(pattern, content)),
-                'Soviet Union': sum(1 for pattern in soviet_keywords if re.search(pattern, content)),
-                'Britain': sum(1 for pattern in british_keywords if re.search(pattern, content)),
-                'USA': sum(1 for pattern in american_keywords if re.search(pattern, content)),
-            }
-            
-            # Return country with highest score (if > 0)
-            max_score = max(scores.values())
-            if max_score > 0:
-                for country, score in scores.items():
-                    if score == max_score:
-                        return country, scores
-            
-            return None, scores
-            
-        except UnicodeDecodeError as e:
-            if self.verbose:
-                print(f"    Warning: Encoding error reading description: {e}")
-            return None, scores
         except Exception as e:
             if self.verbose:
-                print(f"    Warning: Error in description detection: {e}")
+                print(f"    Warning: Could not read description: {e}")
+            return None
+    
+    def _detect_aircraft_in_description(self, content: Optional[str]) -> Optional[str]:
+        """
+        Detect country from aircraft mentions in the (lowercased) campaign description
+        
+        Common patterns: "Flyable Aircraft: Bf-109 G-6"
+                         "fly the ME 410"
+                         "P-47 Thunderbolt"
+        """
+        if not content:
+            return None
+        
+        # One pass over the text collects every aircraft key mentioned
+        found_keys = {self._aircraft_group_keys[match.lastgroup]
+                      for match in self._aircraft_pattern.finditer(content)}
+        
+        # Keep database order as priority when several aircraft are mentioned
+        for aircraft_key, country in self.aircraft_countries.items():
+            if aircraft_key in found_keys:
+                return country
+        
+        return None
+    
+    def _detect_from_description(self, content: Optional[str]) -> tuple[Optional[str], Dict[str, int]]:
+        """Detect country from campaign description keywords
+        
+        Args:
+            content: Lowercased description from _read_description()
+        
+        Returns:
+            Tuple of (country_name, scores_dict)
+        """
+        scores = {'Germany': 0, 'Soviet Union': 0, 'Britain': 0, 'USA': 0}
+        
+        if not content or len(content) < 50:
+            # File missing, unreadable, empty or too short
+            return None, scores
+        
+        if not any(word in content for word in _ENGLISH_HINT_WORDS):
+            # Only decoded by the aircraft fallback - not reliable for keywords
             return None, scores
+        
+        # Count matches for each country (stops early once one country can't be caught)
+        scores = self._description_scanner.count(content, stop_when_decided=True)
+        
+        # Return country with highest score (if > 0)
+        max_score = max(scores.values())
+        if max_score > 0:
+            for country, score in scores.items():
+                if score == max_score:
+                    return country, scores
+        
+        return None, scores
     
     def _detect_from_briefings(self, campaign_path: Path) -> Optional[str]:
         """Detect country from mission briefing keywords (last resort)"""
@@ -707,18 +931,15 @@ class CampaignDateExtractor:
             briefing_file = campaign_path / f'01.{lang}'
             if briefing_file.exists():
                 try:
-                    with open(briefing_file, 'r', encoding='utf-16-le', errors='ignore') as f:
-                        content = f.read(1000).lower()  # Just check first 1000 chars
+                    # Just check first 1000 chars (2000 bytes of UTF-16),
+                    # lowercased as bytes before decoding
+                    with open(briefing_file, 'rb') as f:
+                        content = f.read(2000).lower().decode('utf-16-le', errors='ignore')
                     
-                    # Quick keyword check
-                    if any(word in content for word in ['luftwaffe', 'wehrmacht', 'jagdgeschwader']):
-                        return 'Germany'
-                    if any(word in content for word in ['vvs', 'red army', 'soviet']):
-                        return 'Soviet Union'
-                    if any(word in content for word in ['raf', 'royal air force', 'squadron']):
-                        return 'Britain'
-                    if any(word in content for word in ['usaaf', 'usaf', 'fighter group']):
-                        return 'USA'
+                    # Quick keyword check - first country (in priority order) with a hit
+                    for country, score in self._briefing_scanner.count(content).items():
+                        if score > 0:
+                            return country
                 except:
                     continue
         
@@ -761,38 +982,48 @@ class CampaignDateExtractor:
         campaign_path = self.campaigns_folder / campaign_name
         mission_files = {}
         
-        # Find all .msnbin files (these define the missions)
-        msnbin_files = list(campaign_path.glob('*.msnbin'))
+        # Read the folder once and index files by base name:
+        # lowercase stem -> {lowercase extension: path}
+        # (case-insensitive, like file lookups on Windows)
+        files_by_stem = {}
+        msnbin_stems = []  # .msnbin files define the missions
+        
+        with os.scandir(campaign_path) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or not entry.is_file():
+                    continue
+                stem, dot, ext = entry.name.rpartition('.')
+                if not dot:
+                    continue
+                suffix = '.' + ext.lower()
+                files_by_stem.setdefault(stem.lower(), {})[suffix] = Path(entry.path)
+                if suffix == '.msnbin':
+                    msnbin_stems.append(stem)
         
-        if not msnbin_files:
+        if not msnbin_stems:
             # Fallback: No .msnbin files found, try old method (for very old campaigns)
             if self.verbose:
                 print(f"  No .msnbin files found, using fallback detection")
             return self._get_mission_files_fallback(campaign_path)
         
         # For each .msnbin, find corresponding language files
-        for msnbin_file in msnbin_files:
-            # Get base name without extension
+        lang_extensions = ['.eng', '.ger', '.fra', '.rus', '.spa', '.pol', '.chs']
+        
+        for mission_id in msnbin_stems:
+            # Base name without extension is the mission ID
             # e.g., "01.msnbin" -> "01"
             # e.g., "1943-07-04a-FW190-A5U17-IISG1.msnbin" -> "1943-07-04a-FW190-A5U17-IISG1"
-            mission_id = msnbin_file.stem
             
             # Find matching language files (same base name, different extension)
             # PREFER .eng (English) files - if .eng exists, use it exclusively
-            lang_extensions = ['.eng', '.ger', '.fra', '.rus', '.spa', '.pol', '.chs']
-            lang_files = []
+            siblings = files_by_stem[mission_id.lower()]
             
-            # Check if .eng file exists first
-            eng_file = campaign_path / f"{mission_id}.eng"
-            if eng_file.exists():
+            if '.eng' in siblings:
                 # Use .eng file only (preferred language)
-                lang_files.append(eng_file)
+                lang_files = [siblings['.eng']]
             else:
                 # No .eng file - check other languages in order
-                for ext in lang_extensions[1:]:  # Skip .eng since we already checked
-                    lang_file = campaign_path / f"{mission_id}{ext}"
-                    if lang_file.exists():
-                        lang_files.append(lang_file)
+                lang_files = [siblings[ext] for ext in lang_extensions[1:] if ext in siblings]
             
             # Store mission (even if no language files found - we know it exists from .msnbin)
             mission_files[mission_id] = lang_files
@@ -812,7 +1043,7 @@ class CampaignDateExtractor:
         for file in campaign_path.iterdir():
             if file.is_file():
                 # Match files starting with digits
-                match = re.match(r'^(\d+)', file.name)
+                match = _LEADING_DIGITS.match(file.name)
                 if match:
                     mission_num = match.group(1)
                     
@@ -827,59 +1058,32 @@ class CampaignDateExtractor:
     def extract_date_from_briefing(self, briefing_file: Path) -> Optional[Dict[str, str]]:
         """
         Extract date from a mission briefing file
-        Search for "Date:" keyword anywhere in the file
+        Search for "Date:" keyword in the file
+        
+        The date is almost always near the top, so only the first
+        briefing_head_bytes are read at first. The rest of the file is only
+        read if no date is found there (or the date runs into the cut-off).
         
         Returns:
             Dict with 'raw_date' and 'normalized_date' or None if not found
         """
         try:
-            # Try UTF-16 LE encoding first (common for IL-2 files)
-            try:
-                with open(briefing_file, 'r', encoding='utf-16-le') as f:
-                    content = f.read()
-            except UnicodeDecodeError:
-                # Fall back to UTF-8
-                with open(briefing_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            
-            # Search for "Date:" anywhere in the file (case insensitive)
-            # Handle various formats:
-            # "Date: September 3rd 1942"
-            # "<b>Date:</b>Sept 18th, 1942"
-            # "<b>Date: </b>20.10.1940"  (tags around "Date: ")
-            # "Date: 4 November, 1943<br>"
-            
-            # First try: <b>Date:</b> (colon inside tags)
-            date_match = re.search(
-                r'<b>Date:</b>\s*(?:</?[\w\s]+>)*\s*([^<\n\r]+)',
-                content,
-                re.IGNORECASE
-            )
-            
-            # Second try: <b>Date: </b> (colon outside closing tag)
-            if not date_match:
-                date_match = re.search(
-                    r'<b>Date:\s*</b>\s*(?:</?[\w\s]+>)*\s*([^<\n\r]+)',
-                    content,
-                    re.IGNORECASE
-                )
-            
-            # Third try: Date: with possible tags after
-            if not date_match:
-                date_match = re.search(
-                    r'Date:\s*(?:</?[\w\s]+>)*\s*([^<\n\r]+)',
-                    content,
-                    re.IGNORECASE
-                )
-            
-            # Fourth try: within <u>Date</u> tags
-            if not date_match:
-                date_match = re.search(
-                    r'<u>Date</u>\s*(?:<br>)*\s*([^<\n\r]+)',
-                    content,
-                    re.IGNORECASE
-                )
-
+            with open(briefing_file, 'rb') as f:
+                raw = f.read(self.briefing_head_bytes)
+                truncated = len(raw) == self.briefing_head_bytes
+                
+                date_match = None
+                if self._may_contain_date(raw):
+                    content = self._decode_briefing(raw, final=not truncated)
+                    date_match = self._search_date(content)
+                
+                if truncated and (not date_match or date_match.end(1) == len(content)):
+                    # Not found in the first block - fall back to the whole file
+                    raw += f.read()
+                    date_match = None
+                    if self._may_contain_date(raw):
+                        content = self._decode_briefing(raw, final=True)
+                        date_match = self._search_date(content)
             
             if not date_match:
                 return None
@@ -888,7 +1092,7 @@ class CampaignDateExtractor:
             
             # Clean up the date string
             # Remove trailing text like "Time", "Weather", etc.
-            raw_date = re.split(r'\s+(Time|Weather|Airfield|Callsign|Wind)', raw_date, flags=re.IGNORECASE)[0].strip()
+            raw_date = self._date_trailer_split.split(raw_date)[0].strip()
             
             # Try to normalize the date
             normalized_date = self.normalize_date(raw_date)
@@ -903,6 +1107,71 @@ class CampaignDateExtractor:
             print(f"  Warning: Could not read {briefing_file.name}: {e}")
             return None
     
+    def _may_contain_date(self, raw: bytes) -> bool:
+        """
+        Check raw briefing bytes for a "date" marker before decoding them
+        
+        Every date marker contains "date" - in UTF-16 LE each of its letters is
+        followed by a NUL byte. Lowercasing the bytes only touches ASCII letters,
+        so a briefing without either form has no date marker in any case.
+        """
+        lowered = raw.lower()
+        return b'date' in lowered or b'd\x00a\x00t\x00e\x00' in lowered
+    
+    def _decode_briefing(self, raw: bytes, final: bool = True) -> str:
+        """
+        Decode briefing bytes as UTF-16 LE (common for IL-2 files) or UTF-8
+        
+        The encoding is picked from a sniff of the first bytes, and the other
+        one is only tried if that decode fails.
+        
+        Args:
+            raw: File bytes (possibly only the start of the file)
+            final: False if raw was cut off - an incomplete last character is dropped
+        """
+        encodings = ('utf-16-le', 'utf-8')
+        if self._sniff_briefing_encoding(raw) == 'utf-8':
+            encodings = ('utf-8', 'utf-16-le')
+        
+        try:
+            return codecs.getincrementaldecoder(encodings[0])().decode(raw, final=final)
+        except UnicodeDecodeError:
+            return codecs.getincrementaldecoder(encodings[1])().decode(raw, final=final)
+    
+    def _sniff_briefing_encoding(self, raw: bytes) -> str:
+        """
+        Guess whether briefing bytes are UTF-16 LE or UTF-8
+        
+        A byte order mark decides it. Otherwise UTF-16 LE text (mostly ASCII
+        characters) has a NUL in most odd positions, which UTF-8 text never has.
+        Only the first 4 KB are looked at.
+        """
+        sample = raw[:4096]
+        if sample.startswith(codecs.BOM_UTF16_LE):
+            return 'utf-16-le'
+        if sample.startswith(codecs.BOM_UTF8):
+            return 'utf-8'
+        if sample[1::2].count(0) > len(sample) // 4:
+            return 'utf-16-le'
+        return 'utf-8'
+    
+    def _search_date(self, content: str) -> Optional[re.Match]:
+        """
+        Search for the first "Date:" marker in briefing text (case insensitive)
+        
+        Handle various formats:
+        "Date: September 3rd 1942"
+        "<b>Date:</b>Sept 18th, 1942"
+        "<b>Date: </b>20.10.1940"  (tags around "Date: ")
+        "Date: 4 November, 1943<br>"
+        "<u>Date</u><br>March 21st 1918"
+        """
+        # Every marker contains "date" - a plain substring check is much cheaper
+        # than the pattern search on briefings that have no date at all
+        if 'date' not in content.lower():
+            return None
+        return self._date_pattern.search(content)
+    
     def normalize_date(self, date_string: str) -> Optional[str]:
         """
         Try to normalize date string to YYYY-MM-DD format
@@ -915,35 +1184,39 @@ class CampaignDateExtractor:
         - "Oct 23rd, 1942"
         """
         # Remove ordinal suffixes (st, nd, rd, th)
-        date_string = re.sub(r'(\d+)(st|nd|rd|th)', r'\1', date_string)
+        date_string = self._ordinal_pattern.sub(r'\1', date_string)
         
         # Remove extra commas
         date_string = date_string.replace(',', '')
         
         # Expand abbreviated month names
-        month_abbrev = {
-            'Jan': 'January', 'Feb': 'February', 'Mar': 'March', 'Apr': 'April',
-            'May': 'May', 'Jun': 'June', 'Jul': 'July', 'Aug': 'August',
-            'Sept': 'September', 'Oct': 'October', 'Nov': 'November', 'Dec': 'December'
-        }
+        date_string = self._month_abbrev_pattern.sub(
+            lambda m: self._month_abbrev[m.group(1).lower()], date_string
+        )
+        
+        stripped = date_string.strip()
         
-        for abbr, full in month_abbrev.items():
-            # Use word boundary to avoid partial matches
-            date_string = re.sub(r'\b' + abbr + r'\b', full, date_string, flags=re.IGNORECASE)
+        # Month-name forms: "September 3 1942" or "3 September 1942"
+        match = self._date_tokens.fullmatch(stripped)
+        if match:
+            month = self._month_numbers[(match.group('month') or match.group('month2')).lower()]
+            day = int(match.group('day') or match.group('day2'))
+            year = int(match.group('year'))
+            try:
+                datetime(year, month, day)  # Reject impossible dates (e.g. 31 June)
+            except ValueError:
+                return date_string
+            return f'{year:04d}-{month:02d}-{day:02d}'
         
-        # Try different date formats
+        # Numeric forms are rare, so strptime is only tried for them
         formats = [
-            '%B %d %Y',      # September 3 1942
-            '%d %B %Y',      # 3 September 1942
-            '%B %d, %Y',     # September 3, 1942
-            '%d %B, %Y',     # 3 September, 1942
             '%m/%d/%Y',      # 09/03/1942
             '%Y-%m-%d',      # 1942-09-03 (already normalized)
         ]
         
         for fmt in formats:
             try:
-                date_obj = datetime.strptime(date_string.strip(), fmt)
+                date_obj = datetime.strptime(stripped, fmt)
                 return date_obj.strftime('%Y-%m-%d')
             except ValueError:
                 continue
@@ -951,8 +1224,48 @@ class CampaignDateExtractor:
         # Could not parse - return original
         return date_string
     
-    def scan_campaign(self, campaign_name: str) -> Dict:
-        """Scan a single campaign and extract all mission dates"""
+    def _find_mission_date(self, files_for_mission: List[Path]) -> Optional[Dict[str, str]]:
+        """Try each language file of a mission until a date is found"""
+        for mission_file in files_for_mission:
+            date_info = self.extract_date_from_briefing(mission_file)
+            if date_info:
+                return date_info  # Found a date, stop searching
+        return None
+    
+    def _store_mission_date(self, campaign_data: Dict, mission_num: str,
+                            files_for_mission: List[Path], date_info: Optional[Dict[str, str]]):
+        """Record a mission's date info (or an empty entry) and print the result"""
+        if date_info:
+            campaign_data['missions'][mission_num] = date_info
+            if self.verbose:
+                print(f"      ✓ Found: {date_info['raw_date']} (from {date_info['mission_file']})")
+            else:
+                print(f"    Mission {mission_num}: {date_info['raw_date']} (from {date_info['mission_file']})")
+        else:
+            # No date found in any file variant
+            print(f"    Mission {mission_num}: No date found (checked {len(files_for_mission)} files)")
+            campaign_data['missions'][mission_num] = {
+                'raw_date': None,
+                'normalized_date': None,
+                'mission_file': files_for_mission[0].name if files_for_mission else None
+            }
+    
+    def scan_campaign(self, campaign_name: str, existing_campaign: Dict = None,
+                      pool: ThreadPoolExecutor = None) -> Dict:
+        """
+        Scan a single campaign and extract all mission dates
+        
+        Args:
+            campaign_name: Name of campaign folder
+            existing_campaign: Previously saved data for this campaign - missions
+                that already have a date there are reused without reading briefings
+            pool: Thread pool for briefing reads, shared across campaigns by
+                scan_all_campaigns (a temporary one is used if not given)
+        """
+        if pool is None:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                return self.scan_campaign(campaign_name, existing_campaign, pool)
+        
         print(f"\nScanning campaign: {campaign_name}")
         
         # Detect country (returns tuple: (country, is_stock))
@@ -984,7 +1297,7 @@ class CampaignDateExtractor:
         # Smart sort: Try numeric first, fall back to alphabetic
         def smart_sort_key(mission_id):
             # If it starts with digits, use those for sorting
-            match = re.match(r'^(\d+)', mission_id)
+            match = _LEADING_DIGITS.match(mission_id)
             if match:
                 # Return tuple: (numeric_part, full_string) for proper sorting
                 # This ensures "01" < "02" < "10", and "01a" < "01b"
@@ -994,35 +1307,37 @@ class CampaignDateExtractor:
                 # Use large number to put these after numeric missions
                 return (999999, mission_id)
         
-        for mission_num in sorted(mission_files_dict.keys(), key=smart_sort_key):
+        sorted_missions = sorted(mission_files_dict.keys(), key=smart_sort_key)
+        
+        # Missions already dated by a previous scan don't need their briefings read
+        known_missions = existing_campaign.get('missions', {}) if existing_campaign else {}
+        known_dates = {
+            mission_num: known_missions[mission_num]
+            for mission_num in sorted_missions
+            if (known_missions.get(mission_num) or {}).get('normalized_date')
+        }
+        missions_to_read = [m for m in sorted_missions if m not in known_dates]
+        
+        # Read briefings on a thread pool - this is mostly file I/O, so missions
+        # overlap their reads. map() keeps mission order for the output below.
+        mission_dates = pool.map(self._find_mission_date,
+                                 (mission_files_dict[m] for m in missions_to_read))
+        
+        for mission_num in sorted_missions:
             files_for_mission = mission_files_dict[mission_num]
             
+            if mission_num in known_dates:
+                campaign_data['missions'][mission_num] = known_dates[mission_num]
+                print(f"    Mission {mission_num}: {known_dates[mission_num]['raw_date']} (already known)")
+                continue
+            
+            date_info = next(mission_dates)
+            
             if self.verbose:
                 file_list = ', '.join(f.name for f in files_for_mission)
                 print(f"    Mission {mission_num}: Checking {len(files_for_mission)} files: {file_list}")
             
-            date_info = None
-            
-            # Try each file variant until we find a date
-            for mission_file in files_for_mission:
-                date_info = self.extract_date_from_briefing(mission_file)
-                if date_info:
-                    break  # Found a date, stop searching
-            
-            if date_info:
-                campaign_data['missions'][mission_num] = date_info
-                if self.verbose:
-                    print(f"      ✓ Found: {date_info['raw_date']} (from {date_info['mission_file']})")
-                else:
-                    print(f"    Mission {mission_num}: {date_info['raw_date']} (from {date_info['mission_file']})")
-            else:
-                # No date found in any file variant
-                print(f"    Mission {mission_num}: No date found (checked {len(files_for_mission)} files)")
-                campaign_data['missions'][mission_num] = {
-                    'raw_date': None,
-                    'normalized_date': None,
-                    'mission_file': files_for_mission[0].name if files_for_mission else None
-                }
+            self._store_mission_date(campaign_data, mission_num, files_for_mission, date_info)
         
         # Check if WW1 and should be excluded
         if self.exclude_ww1 and self.is_ww1_campaign(campaign_name, campaign_data):
@@ -1032,8 +1347,37 @@ class CampaignDateExtractor:
         
         return campaign_data
     
-    def scan_all_campaigns(self) -> Dict:
-        """Scan all campaigns and extract mission dates"""
+    def _campaign_fingerprint(self, campaign_name: str) -> List[int]:
+        """
+        Cheap fingerprint of a campaign folder to tell whether it needs rescanning
+        
+        Made of the folder mtime plus file count, total size and newest file mtime,
+        so adding, removing, renaming or editing mission files all change it.
+        Also includes the WW1 setting, since that affects the scan result.
+        """
+        campaign_path = self.campaigns_folder / campaign_name
+        file_count = 0
+        total_size = 0
+        newest_mtime = 0
+        
+        with os.scandir(campaign_path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    file_count += 1
+                    total_size += stat.st_size
+                    newest_mtime = max(newest_mtime, stat.st_mtime_ns)
+        
+        return [campaign_path.stat().st_mtime_ns, file_count, total_size, newest_mtime, int(self.exclude_ww1)]
+    
+    def scan_all_campaigns(self, existing_data: Dict = None) -> Dict:
+        """
+        Scan all campaigns and extract mission dates
+        
+        Args:
+            existing_data: Previously saved data - campaigns whose folder
+                fingerprint hasn't changed are taken from here without rescanning
+        """
         print("="*70)
         print("SCANNING ALL IL-2 CAMPAIGNS FOR MISSION DATES")
         print("="*70)
@@ -1052,13 +1396,24 @@ class CampaignDateExtractor:
         # Scan each campaign
         all_data = {}
         
-        for campaign_name in campaigns:
-            try:
-                campaign_data = self.scan_campaign(campaign_name)
-                if campaign_data:
-                    all_data[campaign_name] = campaign_data
-            except Exception as e:
-                print(f"  Error scanning {campaign_name}: {e}")
+        # One briefing read pool for the whole run rather than one per campaign
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for campaign_name in campaigns:
+                try:
+                    fingerprint = self._campaign_fingerprint(campaign_name)
+                    existing_campaign = existing_data.get(campaign_name) if existing_data else None
+                    
+                    if existing_campaign and existing_campaign.get('_fingerprint') == fingerprint:
+                        print(f"\nUnchanged since last scan: {campaign_name}")
+                        all_data[campaign_name] = existing_campaign
+                        continue
+                    
+                    campaign_data = self.scan_campaign(campaign_name, existing_campaign, pool)
+                    if campaign_data:
+                        campaign_data['_fingerprint'] = fingerprint
+                        all_data[campaign_name] = campaign_data
+                except Exception as e:
+                    print(f"  Error scanning {campaign_name}: {e}")
         
         return all_data
     
@@ -1092,6 +1447,9 @@ class CampaignDateExtractor:
         """
         Merge new campaign data with existing, preserving existing mission data
         
+        The existing campaign dict (and its missions dict) is updated in place
+        rather than copied - save_to_json replaces the old data with the result.
+        
         Args:
             existing_campaign: Existing campaign data
             new_campaign: Newly scanned campaign data
@@ -1099,7 +1457,7 @@ class CampaignDateExtractor:
         Returns:
             Merged campaign data
         """
-        merged = existing_campaign.copy()
+        merged = existing_campaign
         
         # Update campaign name
         merged['campaign_name'] = new_campaign.get('campaign_name', existing_campaign.get('campaign_name'))
@@ -1133,23 +1491,23 @@ class CampaignDateExtractor:
         merged['exclusion_reason'] = new_campaign.get('exclusion_reason', existing_campaign.get('exclusion_reason'))
         
         # Merge missions - add NEW missions, keep existing ones
-        existing_missions = existing_campaign.get('missions', {})
+        merged_missions = merged.setdefault('missions', {})
         new_missions = new_campaign.get('missions', {})
         
-        merged_missions = existing_missions.copy()
-        
         # Add only NEW missions (not in existing data)
         new_mission_count = 0
         for mission_num, mission_data in new_missions.items():
-            if mission_num not in existing_missions:
+            if mission_num not in merged_missions:
                 merged_missions[mission_num] = mission_data
                 new_mission_count += 1
                 if self.verbose:
                     print(f"    + New mission {mission_num}")
         
-        merged['missions'] = merged_missions
         merged['mission_count'] = len(merged_missions)
         
+        # Remember folder state of this scan so unchanged campaigns are skipped next time
+        merged['_fingerprint'] = new_campaign.get('_fingerprint')
+        
         if new_mission_count > 0 and not self.verbose:
             print(f"  ✓ Added {new_mission_count} new mission(s)")
         
@@ -1161,8 +1519,8 @@ class CampaignDateExtractor:
         print("SCANNING CAMPAIGNS")
         print(f"{'='*70}")
         
-        # Scan all campaigns
-        new_data = self.scan_all_campaigns()
+        # Scan all campaigns (unchanged ones are taken from existing data)
+        new_data = self.scan_all_campaigns(existing_data)
         
         # If existing data provided, merge instead of overwrite
         if existing_data:
@@ -1175,8 +1533,8 @@ class CampaignDateExtractor:
             updated_campaigns = []
             
             # Process each campaign
-            all_campaigns = set(list(existing_data.keys()) + list(new_data.keys()))
-            all_campaigns.discard('game_directory')  # Remove metadata key
+            # Dict key views support set operations directly - no list copies
+            all_campaigns = (existing_data.keys() | new_data.keys()) - {'game_directory'}  # Remove metadata key
             
             for campaign_name in all_campaigns:
                 if campaign_name in existing_data and campaign_name in new_data:
@@ -1217,62 +1575,63 @@ class CampaignDateExtractor:
             data['game_directory'] = self.game_directory
         
         # Save to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         
         print(f"\n{'='*70}")
         print(f"✓ Mission dates saved to: {output_file}")
         print(f"{'='*70}")
         
         # Print summary (excluding game_directory key)
-        campaign_data = {k: v for k, v in data.items() if k != 'game_directory'}
-        
-        total_missions = sum(camp['mission_count'] for camp in campaign_data.values())
-        missions_with_dates = sum(
-            sum(1 for m in camp['missions'].values() if m['normalized_date'])
-            for camp in campaign_data.values()
-        )
+        # Gather all counts in one pass over the campaigns
+        campaign_count = 0
+        excluded_campaigns = []  # (name, reason)
+        total_missions = 0
+        missions_with_dates = 0
+        country_counts = {}  # Active campaigns per country (excluding WW1)
+        get_normalized = itemgetter('normalized_date')
+        
+        for name, camp in data.items():
+            if name == 'game_directory':
+                continue
+            campaign_count += 1
+            
+            if camp.get('excluded'):
+                excluded_campaigns.append((name, camp.get('exclusion_reason', 'Unknown')))
+                continue
+            
+            total_missions += camp['mission_count']
+            # Pull the date column out with C-level map() rather than a generator
+            missions_with_dates += sum(map(bool, map(get_normalized, camp['missions'].values())))
+            
+            country = camp.get('country', 'Unknown')
+            if country:
+                country_counts[country] = country_counts.get(country, 0) + 1
         
         print(f"\nSummary:")
-        print(f"  Total campaigns: {len(campaign_data)}")
-        
-        # Count excluded
-        excluded_count = sum(1 for c in campaign_data.values() if c.get('excluded'))
-        active_count = len(campaign_data) - excluded_count
-        
-        if excluded_count > 0:
-            print(f"  Active campaigns: {active_count}")
-            print(f"  Excluded (WW1): {excluded_count}")
+        print(f"  Total campaigns: {campaign_count}")
         
-        total_missions = sum(camp['mission_count'] for camp in campaign_data.values() if not camp.get('excluded'))
-        missions_with_dates = sum(
-            sum(1 for m in camp['missions'].values() if m['normalized_date'])
-            for camp in campaign_data.values() if not camp.get('excluded')
-        )
+        if excluded_campaigns:
+            print(f"  Active campaigns: {campaign_count - len(excluded_campaigns)}")
+            print(f"  Excluded (WW1): {len(excluded_campaigns)}")
         
         print(f"  Total missions: {total_missions}")
         print(f"  Missions with dates: {missions_with_dates}")
         print(f"  Missing dates: {total_missions - missions_with_dates}")
         
-        # Country breakdown (excluding WW1)
-        country_counts = {}
-        for camp in campaign_data.values():
-            if camp.get('excluded'):
-                continue
-            country = camp.get('country', 'Unknown')
-            if country:
-                country_counts[country] = country_counts.get(country, 0) + 1
-        
         if country_counts:
             print(f"\n  Active campaigns by country:")
             for country, count in sorted(country_counts.items()):
                 print(f"    {country}: {count}")
         
-        if excluded_count > 0:
+        if excluded_campaigns:
             print(f"\n  Excluded campaigns:")
-            for name, camp in campaign_data.items():
-                if camp.get('excluded'):
-                    print(f"    - {name} ({camp.get('exclusion_reason', 'Unknown')})")
+            for name, reason in excluded_campaigns:
+                print(f"    - {name} ({reason})")
         
         return data
 
@@ -1282,9 +1641,7 @@ def main():
     import sys
     from pathlib import Path
     
-    print("="*70)
-    print("IL-2 CAMPAIGN PROGRESS TRACKER - Date Extractor")
-    print("="*70)
+    print(f"{_SEP}\nIL-2 CAMPAIGN PROGRESS TRACKER - Date Extractor\n{_SEP}")
     
     # Output file
     output_file = "campaign_mission_dates.json"
@@ -1335,8 +1692,8 @@ def main():
             game_dir = sys.argv[1]
             campaigns_folder = str(Path(game_dir) / 'data' / 'Campaigns')
         else:
-            # Use GUI to select directory
-            game_dir = select_game_directory_gui()
+            # Use GUI to select directory (--force-new always shows the dialog)
+            game_dir = select_game_directory_gui(use_cache=not force_new)
             
             if not game_dir:
                 print("\n⚠ No directory selected. Exiting.")
@@ -1382,42 +1739,158 @@ def main():
         extractor = CampaignDateExtractor(campaigns_folder, verbose=verbose, exclude_ww1=not include_ww1)
         extractor.save_to_json(output_file, existing_data if existing_data else None)
     
+    # Each banner is written with a single print() - one console write instead of one per line
     if not auto_mode:
-        print(f"\n{'='*70}")
-        print("COMPLETE!")
-        print(f"{'='*70}")
-        print(f"\n✓ Data saved to: {output_file}")
-        print(f"✓ Configuration: campaign_progress_config.yaml")
-        print(f"\nNext run: Just execute the script - it will auto-update!")
+        print(f"\n{_SEP}\n"
+              f"COMPLETE!\n"
+              f"{_SEP}\n"
+              f"\n✓ Data saved to: {output_file}\n"
+              f"✓ Configuration: campaign_progress_config.yaml\n"
+              f"\nNext run: Just execute the script - it will auto-update!")
     
     if not include_ww1:
-        print(f"\nNote: WW1 Flying Circus campaigns excluded by default.")
-        print(f"      Use --include-ww1 flag to include them.")
+        print("\nNote: WW1 Flying Circus campaigns excluded by default.\n"
+              "      Use --include-ww1 flag to include them.")
+
+
+def _load_cached_game_dir() -> Optional[str]:
+    """
+    Return the game directory saved by an earlier folder dialog
+    
+    Only used if it still contains a data/Campaigns folder.
+    """
+    try:
+        with open(_GAME_DIR_CACHE_FILE, 'r', encoding='utf-8') as f:
+            game_dir = json.load(f).get('game_dir')
+    except (OSError, ValueError, AttributeError):
+        return None
+    
+    if game_dir and os.path.isdir(os.path.join(game_dir, 'data', 'Campaigns')):
+        return game_dir
+    return None
+
+
+def _save_cached_game_dir(game_dir: str):
+    """Remember the game directory picked in the folder dialog"""
+    try:
+        with open(_GAME_DIR_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'game_dir': game_dir}, f)
+    except OSError as e:
+        print(f"⚠ Warning: Could not save selected directory: {e}")
+
+
+def _ask_directory_windows(title: str, initial_dir: Optional[str]) -> str:
+    """
+    Show the native Windows folder picker (SHBrowseForFolder) through ctypes
+    
+    Much quicker to open than a Tk dialog, which has to start a Tcl/Tk
+    interpreter first. Raises if the shell API can't be used, so the caller
+    can fall back to Tk.
+    
+    Returns:
+        Selected directory path, or '' if cancelled
+    """
+    import ctypes
+    from ctypes import wintypes
+    
+    BIF_RETURNONLYFSDIRS = 0x0001
+    BIF_NEWDIALOGSTYLE = 0x0040
+    BFFM_INITIALIZED = 1
+    BFFM_SETSELECTIONW = 0x0467
+    MAX_PATH = 260
+    
+    BrowseCallback = ctypes.WINFUNCTYPE(ctypes.c_int, wintypes.HWND, ctypes.c_uint,
+                                        wintypes.LPARAM, wintypes.LPARAM)
+    
+    class BROWSEINFOW(ctypes.Structure):
+        _fields_ = [
+            ('hwndOwner', wintypes.HWND),
+            ('pidlRoot', ctypes.c_void_p),
+            ('pszDisplayName', wintypes.LPWSTR),
+            ('lpszTitle', wintypes.LPCWSTR),
+            ('ulFlags', ctypes.c_uint),
+            ('lpfn', BrowseCallback),
+            ('lParam', wintypes.LPARAM),
+            ('iImage', ctypes.c_int),
+        ]
+    
+    shell32 = ctypes.windll.shell32
+    ole32 = ctypes.windll.ole32
+    user32 = ctypes.windll.user32
+    kernel32 = ctypes.windll.kernel32
+    
+    shell32.SHBrowseForFolderW.restype = ctypes.c_void_p
+    shell32.SHBrowseForFolderW.argtypes = [ctypes.POINTER(BROWSEINFOW)]
+    shell32.SHGetPathFromIDListW.argtypes = [ctypes.c_void_p, wintypes.LPWSTR]
+    ole32.CoTaskMemFree.argtypes = [ctypes.c_void_p]
+    user32.SendMessageW.argtypes = [wintypes.HWND, ctypes.c_uint, wintypes.WPARAM, wintypes.LPARAM]
+    kernel32.GetConsoleWindow.restype = wintypes.HWND
+    
+    # Start the dialog in initial_dir once it has opened
+    initial_buffer = ctypes.create_unicode_buffer(initial_dir or '')
+    
+    def on_browse_event(hwnd, msg, lparam, data):
+        if msg == BFFM_INITIALIZED and initial_dir:
+            user32.SendMessageW(hwnd, BFFM_SETSELECTIONW, 1, data)
+        return 0
+    
+    callback = BrowseCallback(on_browse_event)  # Must stay referenced while the dialog is open
+    display_name = ctypes.create_unicode_buffer(MAX_PATH)
+    
+    browse_info = BROWSEINFOW()
+    browse_info.hwndOwner = kernel32.GetConsoleWindow()  # Keeps the dialog in front of the console
+    browse_info.pszDisplayName = ctypes.cast(display_name, wintypes.LPWSTR)
+    browse_info.lpszTitle = title
+    browse_info.ulFlags = BIF_RETURNONLYFSDIRS | BIF_NEWDIALOGSTYLE
+    browse_info.lpfn = callback
+    browse_info.lParam = ctypes.addressof(initial_buffer)
+    
+    # The new dialog style needs OLE initialized on this thread
+    ole_initialized = ole32.OleInitialize(None) >= 0
+    try:
+        pidl = shell32.SHBrowseForFolderW(ctypes.byref(browse_info))
+        if not pidl:
+            return ''  # Cancelled
+        
+        path_buffer = ctypes.create_unicode_buffer(MAX_PATH)
+        try:
+            if not shell32.SHGetPathFromIDListW(pidl, path_buffer):
+                return ''  # Not a file system folder
+        finally:
+            ole32.CoTaskMemFree(pidl)
+        return path_buffer.value
+    finally:
+        if ole_initialized:
+            ole32.OleUninitialize()
 
 
-def select_game_directory_gui():
+def select_game_directory_gui(use_cache: bool = True):
     """
     Open a GUI folder browser to select IL-2 game directory
     
+    Args:
+        use_cache: Return the directory picked in an earlier dialog (if still
+            valid) instead of opening the dialog again
+    
     Returns:
         Selected directory path or None if cancelled
     """
-    import tkinter as tk
-    from tkinter import filedialog
-    import os
-    
-    print("\n" + "="*70)
-    print("FIRST TIME SETUP - Select IL-2 Game Directory")
-    print("="*70)
-    print("\nA folder browser will open...")
-    print("Please select your IL-2 Sturmovik installation folder")
-    print("(The main game folder, NOT the Campaigns subfolder)")
-    print("\nExample: IL-2 Sturmovik Battle of Stalingrad")
-    
-    # Create invisible root window
-    root = tk.Tk()
-    root.withdraw()  # Hide the main window
-    root.attributes('-topmost', True)  # Bring to front
+    if use_cache:
+        cached_dir = _load_cached_game_dir()
+        if cached_dir:
+            print(f"\n✓ Using previously selected directory: {cached_dir}")
+            return cached_dir
+    
+    import sys
+    global _tk, _filedialog
+    
+    print(f"\n{_SEP}\n"
+          f"FIRST TIME SETUP - Select IL-2 Game Directory\n"
+          f"{_SEP}\n"
+          f"\nA folder browser will open...\n"
+          f"Please select your IL-2 Sturmovik installation folder\n"
+          f"(The main game folder, NOT the Campaigns subfolder)\n"
+          f"\nExample: IL-2 Sturmovik Battle of Stalingrad")
     
     # Try to find common IL-2 installation paths as initial directory
     possible_paths = [
@@ -1428,23 +1901,41 @@ def select_game_directory_gui():
         os.path.expanduser("~"),
     ]
     
-    initial_dir = None
-    for path in possible_paths:
-        if os.path.exists(path):
-            initial_dir = path
-            break
+    # First existing folder wins - later candidates are never probed
+    initial_dir = next((path for path in possible_paths if os.path.isdir(path)), None)
     
-    # Open folder dialog
-    selected_path = filedialog.askdirectory(
-        title="Select IL-2 Sturmovik Game Directory",
-        initialdir=initial_dir,
-        mustexist=True
-    )
+    title = "Select IL-2 Sturmovik Game Directory"
+    selected_path = None
     
-    root.destroy()  # Clean up
+    # On Windows use the native folder picker - no Tcl/Tk startup needed
+    if sys.platform == 'win32':
+        try:
+            selected_path = _ask_directory_windows(title, initial_dir)
+        except Exception as e:
+            print(f"⚠ Native folder picker unavailable ({e}), using Tk dialog")
+    
+    if selected_path is None:
+        if _tk is None:
+            import tkinter as _tk
+            from tkinter import filedialog as _filedialog
+        
+        # Create invisible root window
+        root = _tk.Tk()
+        root.withdraw()  # Hide the main window
+        root.attributes('-topmost', True)  # Bring to front
+        
+        # Open folder dialog
+        selected_path = _filedialog.askdirectory(
+            title=title,
+            initialdir=initial_dir,
+            mustexist=True
+        )
+        
+        root.destroy()  # Clean up
     
     if selected_path:
         print(f"\n✓ Selected: {selected_path}")
+        _save_cached_game_dir(selected_path)
         return selected_path
     else:
         print("\n⚠ No folder selected")
@@ -18,17 +18,171 @@ Files needed:
     - object_categories.yaml (for object classification)
 """
 
+import calendar
+import codecs
 import json
+import os
+import random
 import yaml
 import shutil
 import sys
+import tempfile
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import re
 import argparse
+from bisect import bisect_right
+from collections import Counter
+from functools import lru_cache, partial
+from itertools import accumulate, islice
+from operator import itemgetter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+# libyaml's C loader is much faster; PyYAML without it has only SafeLoader
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Leading mission number and suffix of a mission id ("01a" -> "01", "a")
+_LEADING_DIGITS = re.compile(r'^(\d+)(.*)$')
+
+# Briefing header lines in .eng mission files: "Date: 4 November, 1943<br>"
+# and "Time: 9:45<br>"
+_BRIEFING_DATE = re.compile(r'Date:\s*([^<\r\n]+)', re.IGNORECASE)
+_BRIEFING_TIME = re.compile(r'Time:\s*(\d{1,2}:\d{2})', re.IGNORECASE)
+
+# characterStatisticsByFileName counters summed into the kill categories
+_TANK_KEYS = ('killLightArmoredVehicle', 'killMediumArmoredVehicle', 'killHeavyArmoredVehicle')
+_GROUND_KEYS = (
+    'killTransportVehicle', *_TANK_KEYS, 'killCannon', 'killAAAGun',
+    'killMachinegun', 'killRocketLauncher', 'killRailroadCarriage', 'killLocomotive',
+    'killRailroadStation', 'killBridge', 'killFacility', 'killRadar',
+    'killSearchlight', 'killResidentalBuilding'
+)
+_SHIP_KEYS = ('killLightShip', 'killLargeCargoShip', 'killDestroyerShip', 'killSubmarine')
+
+# Next section header after Events in a campaign's info.locale=eng.txt
+# (see update_campaign_info_file)
+_INFO_NEXT_SECTION = re.compile(r'<br><br><u>[^<]+</u>')
+# Campaign display name: &name="Name" or &name=Name
+_INFO_NAME_QUOTED = re.compile(r'&name\s*=\s*"([^"]+)"')
+_INFO_NAME_UNQUOTED = re.compile(r'&name\s*=\s*([^\n&]+)')
+
+# Name fragments that put a killed target in the summary's naval / ground
+# categories (anything else counts as air) - one regex scan per category
+_NAVAL_TARGET_KEYWORDS = ('boat', 'ship', 'vessel', 'torpedo')
+_GROUND_TARGET_KEYWORDS = ('aa', 'gun', 'ml-20', 'dshk', '52-k', 'flak', 'tank', 'truck', 'artillery')
+_NAVAL_TARGET = re.compile('|'.join(map(re.escape, _NAVAL_TARGET_KEYWORDS)))
+_GROUND_TARGET = re.compile('|'.join(map(re.escape, _GROUND_TARGET_KEYWORDS)))
+
+# CampaignRanksAwards folder per country (Soviet Union picks USSR/early or
+# USSR/late by event date; other countries use their own name)
+_RANK_COUNTRY_FOLDERS = {
+    'Germany': 'Germany',
+    'Britain': 'Britain',
+    'USA': 'US'
+}
+
+# Landing outcome buckets for the summary, highest priority first, and the
+# final_state keywords that select them. One lookahead scan finds every
+# keyword (overlaps included); the highest-priority bucket hit wins.
+_LANDING_PRIORITY = ('wounded', 'bailout', 'kia_mia', 'hard', 'safe')
+_LANDING_KEYWORDS = {
+    'wounded': 'wounded',
+    'bail': 'bailout',
+    'kia': 'kia_mia', 'mia': 'kia_mia', 'killed': 'kia_mia',
+    'hard': 'hard', 'crash': 'hard',
+    'landed': 'safe',
+}
+_LANDING_RANK = {keyword: _LANDING_PRIORITY.index(bucket)
+                 for keyword, bucket in _LANDING_KEYWORDS.items()}
+_LANDING_STATUS = re.compile('(?=(' + '|'.join(_LANDING_KEYWORDS) + '))')
+
+# Event dates as shown in the Events list ("1943-01-06" -> "06 January, 1943")
+_ISO_EVENT_DATE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+_MONTH_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
+# Rank insignia images that need rotating 90° counter-clockwise, keyed by
+# country folder (based on user requirements)
+_RANKS_TO_ROTATE = {
+    'Germany': [
+        # ALL German ranks need rotation
+        'unteroffizier.png',
+        'oberstleutnant.png',
+        'oberleutnant.png',
+        'oberfeldwebel.png',
+        'major.png',
+        'leutnant.png',
+        'hauptmann.png',
+        'feldwebel.png',
+        'generalleutnant.png',
+        'generalmajor.png',
+        'generalfeldmarschall.png',
+        'generaloberst.png',
+        'oberst.png',
+        'stabsfeldwebel.png',
+        'gefreiter.png',
+    ],
+    'Britain': [
+        # Only these 5 British ranks
+        'flight_lieutenant.png',
+        'flying_officer.png',
+        'pilot_officer.png',
+        'squadron_leader.png',
+        'wing_commander.png',
+    ],
+    'US': [  # NOTE: Changed from 'USA' to 'US' to match country_folder!
+        # All US ranks EXCEPT first_sergeant.png
+        'second_lieutenant.png',
+        'major_usaaf.png',
+        'lt_colonel.png',
+        'flight_officer.png',
+        # 'first_sergeant.png',  # ← NOT rotated!
+        'first_lieutenant.png',
+        'chief_warrant_officer.png',
+        'captain_usaaf.png',
+        'brigadier_general.png',
+        'colonel.png',
+        'major_general.png',
+        'lieutenant_general.png',
+        'general.png',
+        'master_sergeant.png',
+        'technical_sergeant.png',
+        'staff_sergeant.png',
+    ],
+    'USSR/late': [
+        # ALL USSR/late ranks need rotation
+        'sub_colonel.png',
+        'sergeant_vvs.png',
+        'senior_sergeant.png',
+        'senior_lieutenant.png',
+        'major_vvs.png',
+        'lieutenant_vvs.png',
+        'junior_lieutenant.png',
+        'captain_vvs.png',
+        'colonel_vvs.png',
+        'major_general_vvs.png',
+        'lieutenant_general_vvs.png',
+        'general_vvs.png',
+        'marshal_vvs.png',
+    ],
+    # USSR/early: NONE - not in dictionary, so will return False
+}
+
+# Lowercased lookup sets, built once instead of on every rank_needs_rotation call
+_RANKS_TO_ROTATE_SETS = {
+    country_key: frozenset(name.lower() for name in names)
+    for country_key, names in _RANKS_TO_ROTATE.items()
+}
+
+
+@lru_cache(maxsize=None)
 def smart_mission_sort_key(mission_id: str):
     """
     Smart sorting for mission IDs
@@ -36,12 +190,13 @@ def smart_mission_sort_key(mission_id: str):
     - Date-based IDs (1943-07-04a): Sort alphabetically (ISO format sorts correctly)
     - Mixed (01a, 02b): Sort by number then suffix
     """
-    # If it's purely numeric, convert to int
-    if mission_id.isdigit():
+    # Fast path for the common purely numeric ids - isdecimal() (unlike
+    # isdigit()) only accepts characters that int() can convert
+    if mission_id.isdecimal():
         return (int(mission_id), "")
     
     # Try to extract leading digits (handles "01a", "02b", "1943-07-04a", etc.)
-    match = re.match(r'^(\d+)(.*)$', mission_id)
+    match = _LEADING_DIGITS.match(mission_id)
     if match:
         return (int(match.group(1)), match.group(2))
     
@@ -50,6 +205,328 @@ def smart_mission_sort_key(mission_id: str):
     return (999999, mission_id)
 
 
+def _decode_briefing_head(raw: bytes) -> str:
+    """
+    Decode the first bytes of an .eng mission file
+    
+    A byte order mark decides the encoding. Otherwise UTF-16 LE text (mostly
+    ASCII characters) has a NUL in most odd positions, which UTF-8 and
+    ISO-8859-1 text never has.
+    """
+    if raw.startswith(codecs.BOM_UTF16_LE) or raw[1::2].count(0) > len(raw) // 4:
+        return raw.decode('utf-16-le', errors='ignore')
+    
+    if raw.startswith(codecs.BOM_UTF8):
+        raw = raw[len(codecs.BOM_UTF8):]
+    try:
+        # Incremental decoder - the read may have cut a multi-byte character
+        return codecs.getincrementaldecoder('utf-8')().decode(raw)
+    except UnicodeDecodeError:
+        return raw.decode('iso-8859-1')
+
+
+def _map_graduated_kills(config, convert):
+    """
+    config with each award's graduated_random_kills replaced by convert(value)
+    
+    Award dicts are copied, the rest of config is shared. Anything not shaped
+    like the awards section (country -> list of award dicts) is left as is.
+    """
+    awards = config.get('awards') if isinstance(config, dict) else None
+    if not isinstance(awards, dict):
+        return config
+    
+    converted = {}
+    for country, country_awards in awards.items():
+        if isinstance(country_awards, list):
+            country_awards = [
+                {**award, 'graduated_random_kills': convert(award['graduated_random_kills'])}
+                if isinstance(award, dict) and 'graduated_random_kills' in award else award
+                for award in country_awards
+            ]
+        converted[country] = country_awards
+    return {**config, 'awards': converted}
+
+
+def _graduated_kills_to_pairs(graduated):
+    """{kills: chance} as [[kills, chance], ...] - keeps integer keys through JSON"""
+    return [[kills, chance] for kills, chance in graduated.items()] if isinstance(graduated, dict) else graduated
+
+
+def _graduated_kills_from_pairs(graduated):
+    """Inverse of _graduated_kills_to_pairs"""
+    return {kills: chance for kills, chance in graduated} if isinstance(graduated, list) else graduated
+
+
+def _load_json_file(path) -> Dict:
+    """Read a JSON file - with orjson when it is installed, else the json module
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+    catching json.JSONDecodeError either way.
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Report file names keep only word characters, whitespace and '-'.
+# ASCII names (the usual case) go through one str.translate with the
+# characters the regex would remove; others use the (Unicode) regex.
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\s-]')
+_UNSAFE_ASCII_FILENAME_CHARS = {
+    code: None for code in range(128) if _UNSAFE_FILENAME_CHARS.match(chr(code))
+}
+
+
+def _strip_unsafe_filename_chars(name: str) -> str:
+    """name without the characters matched by _UNSAFE_FILENAME_CHARS"""
+    if name.isascii():
+        return name.translate(_UNSAFE_ASCII_FILENAME_CHARS)
+    return _UNSAFE_FILENAME_CHARS.sub('', name)
+
+
+def _latest_mission_key(stats: Dict) -> str:
+    """
+    Key of the highest-numbered mission in characterStatisticsByFileName
+    
+    Same pick as max(stats, key=lambda k: int(k) if k.isdigit() else 0):
+    the first of the largest numeric keys, or the first key overall when
+    no key is above 0 - but with int itself as the key function and only
+    the numeric keys compared.
+    """
+    digit_keys = [key for key in stats if key.isdigit()]
+    if digit_keys:
+        latest = max(digit_keys, key=int)
+        if int(latest) > 0:
+            return latest
+    return next(iter(stats))
+
+
+def _indented_json(value) -> bytes:
+    """value as indent=2 UTF-8 JSON (non-ASCII kept) - with orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@lru_cache(maxsize=512)
+def _format_event_date(date_value) -> str:
+    """
+    Format a YYYY-MM-DD event date as "06 January, 1943"
+    
+    Plain YYYY-MM-DD dates are sliced and checked directly; anything else
+    goes through strptime/strftime. Raises like strptime for invalid dates.
+    """
+    match = _ISO_EVENT_DATE.fullmatch(date_value) if isinstance(date_value, str) else None
+    if match:
+        year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        if year >= 1000 and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]:
+            return f"{match.group(3)} {_MONTH_NAMES[month - 1]}, {match.group(1)}"
+    
+    return datetime.strptime(date_value, '%Y-%m-%d').strftime('%d %B, %Y')
+
+
+def _parse_iso_date(date_value: str) -> date:
+    """
+    Parse a YYYY-MM-DD date
+    
+    Plain YYYY-MM-DD goes through date.fromisoformat; looser forms that
+    strptime also accepts (e.g. "1943-1-6") fall back to strptime.
+    """
+    if _ISO_EVENT_DATE.fullmatch(date_value):
+        return date.fromisoformat(date_value)
+    return datetime.strptime(date_value, '%Y-%m-%d').date()
+
+
+# Flight log clock times must stay within datetime's range (measured from
+# the 2000-01-01 base the times were originally added to), else the raw
+# mission time is shown
+_CLOCK_BASE = datetime(2000, 1, 1)
+_CLOCK_MIN_SECONDS = (datetime.min - _CLOCK_BASE) // timedelta(seconds=1)
+_CLOCK_MAX_SECONDS = (datetime.max.replace(microsecond=0) - _CLOCK_BASE) // timedelta(seconds=1)
+
+
+# Fixed pieces of each mission box in the debriefings
+_DEBRIEF_BOX_OPEN = '<div class="mission-box">'
+_DEBRIEF_RULE = "━" * 50 + "<br>"
+# Section headers and box end, each pre-joined with the line(s) that always
+# come with it (html_lines are joined with newlines)
+_DEBRIEF_COMBAT_HEADER = "<br>\n<b>COMBAT RESULTS</b><br>"
+_DEBRIEF_FLIGHT_LOG_HEADER = "<br>\n<b>FLIGHT LOG</b><br>"
+_DEBRIEF_BOX_CLOSE = "\n".join((_DEBRIEF_RULE, "</div>", "<br>"))  # Rule, close mission-box, spacing
+
+# Repeated style fragments of the PDF campaign summary
+_SUMMARY_H2 = '<h2 style="border-bottom: 2px solid #333; padding-bottom: 5px; margin-top: 30px;">'
+_SUMMARY_TABLE = '<table style="width: 100%; margin: 10px 0;">'
+_SUMMARY_TD_LABEL = '<td style="padding: 5px 0;">'
+_SUMMARY_TD_VALUE = '<td style="text-align: right;">'
+# One label/value table row: _summary_row((label, value)) - a single
+# %-format call instead of building the row f-string from its pieces
+_SUMMARY_ROW = f'<tr>{_SUMMARY_TD_LABEL}<b>%s:</b></td>{_SUMMARY_TD_VALUE}%s</td></tr>'
+_summary_row = _SUMMARY_ROW.__mod__
+# Same row starting a new group - the .sep rule in _PDF_DOCUMENT_STYLE adds
+# the gap above it instead of an empty spacer row (20px = the row's own 5px
+# padding + the spacer row's 10px + 5px)
+_summary_sep_row = _SUMMARY_ROW.replace('<tr>', '<tr class="sep">', 1).__mod__
+
+# Fixed-shape blocks of the PDF campaign summary, filled with str.format per
+# campaign ({field} in the row values below) - the variable-length parts
+# (outcomes, aircraft, awards, targets) are still built row by row
+_SUMMARY_MISSIONS_BLOCK = '\n'.join((
+    f'{_SUMMARY_H2}MISSIONS FLOWN</h2>',
+    _SUMMARY_TABLE,
+    _summary_row(('Completed', '{mission_count} missions')),
+    _summary_row(('Total Flight Time', '{total_hours}h {total_minutes}m')),
+    _summary_row(('Average Duration', '{avg_minutes}m')),
+))
+_SUMMARY_CAREER_BLOCK = '\n'.join((
+    f'{_SUMMARY_H2}CAREER PROGRESSION</h2>',
+    _SUMMARY_TABLE,
+    _summary_row(('Starting Rank', '{starting_rank}')),
+    _summary_row(('Final Rank', '{final_rank}')),
+    _summary_row(('Promotions', '{promotion_count}')),
+    _summary_sep_row(('Awards Received', '{award_count}')),
+    '</table>',
+))
+# Landing outcome rows in the order listed: (landing_outcomes bucket, label)
+_SUMMARY_OUTCOME_ROWS = (
+    ('safe', 'Safe Landings'),
+    ('hard', 'Hard Landings / Crashes'),
+    ('wounded', 'Wounded Landings'),
+    ('bailout', 'Bailouts'),
+    ('kia_mia', 'KIA / MIA'),
+)
+# Top targets lists: (target_counts category, list heading)
+_SUMMARY_TARGET_SECTIONS = (
+    ('air', '<p style="margin: 10px 0 5px 0;"><b>Air Targets:</b></p>'),
+    ('ground', '<p style="margin: 15px 0 5px 0;"><b>Ground Targets:</b></p>'),
+    ('naval', '<p style="margin: 15px 0 5px 0;"><b>Naval Targets:</b></p>'),
+)
+
+# Static parts of the PDF report document (export_campaign_to_pdf) - only
+# the title, heading, timestamp and report body change per campaign
+_PDF_DOCUMENT_START = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+"""
+_PDF_DOCUMENT_STYLE = """    <style>
+        body {
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            font-size: 10pt;
+        }
+        h1 {
+            text-align: center;
+            border-bottom: 2px solid #333;
+            padding-bottom: 10px;
+        }
+        .mission-box {
+            page-break-inside: avoid;
+            margin-bottom: 10px;
+        }
+        .sep td {
+            padding-top: 20px !important;
+        }
+    </style>
+</head>
+"""
+_PDF_DOCUMENT_START_BYTES = _PDF_DOCUMENT_START.encode('utf-8')
+_PDF_DOCUMENT_STYLE_BYTES = (_PDF_DOCUMENT_STYLE + "<body>\n").encode('utf-8')
+_PDF_DOCUMENT_END_BYTES = b"\n</body>\n</html>\n"
+# wkhtmltopdf options for the report (copied per call - pdfkit may modify it)
+_PDF_OPTIONS = {
+    'page-size': 'A4',
+    'margin-top': '15mm',
+    'margin-right': '15mm',
+    'margin-bottom': '15mm',
+    'margin-left': '15mm',
+    'encoding': 'UTF-8',
+    'no-outline': None,
+    'enable-local-file-access': None,
+    'quiet': ''  # Suppress wkhtmltopdf warnings
+}
+
+# Flight log events shown with their altitude only (Takeoff/Landing/...)
+_FLIGHT_LOG_MOVEMENTS = ("Takeoff", "Landing", "Crash", "Bailout")
+
+
+def _parse_start_time(start_time) -> Optional[int]:
+    """Mission start time (e.g. "09:45") as seconds after midnight, None if unusable"""
+    if not start_time:
+        return None
+    try:
+        start_parts = start_time.split(':')
+        if len(start_parts) == 2:
+            start_hour, start_min = map(int, start_parts)
+            if 0 <= start_hour <= 23 and 0 <= start_min <= 59:
+                return start_hour * 3600 + start_min * 60
+    except Exception:
+        pass
+    return None
+
+
+def _mission_clock_time(start_seconds: Optional[int], mission_time) -> str:
+    """
+    Convert a mission time (e.g. "00:23:45") to the real clock time
+    
+    Args:
+        start_seconds: Mission start from _parse_start_time (None = unknown)
+        mission_time: Time since mission start as "HH:MM:SS"
+        
+    Returns:
+        Clock time as "HH:MM:SS", or mission_time unchanged if it can't be converted
+    """
+    if start_seconds is None or not mission_time:
+        return mission_time
+    try:
+        time_parts = mission_time.split(':')
+        if len(time_parts) == 3:
+            hours, minutes, seconds = map(int, time_parts)
+            total_seconds = start_seconds + hours * 3600 + minutes * 60 + seconds
+            if _CLOCK_MIN_SECONDS <= total_seconds <= _CLOCK_MAX_SECONDS:
+                clock_hours, remainder = divmod(total_seconds % 86400, 3600)  # Clock time of day
+                clock_minutes, clock_seconds = divmod(remainder, 60)
+                return f"{clock_hours:02d}:{clock_minutes:02d}:{clock_seconds:02d}"
+    except Exception:
+        # Fallback to mission time if conversion fails
+        pass
+    return mission_time
+
+
+def _unconverted_time(mission_time):
+    """Flight log time shown as-is (mission start time unknown)"""
+    return mission_time
+
+
+def _promotion_scan(running_scores, required_scores: List[int], start_index: int):
+    """
+    Walk the running score after each mission and yield the promotions
+    
+    Only ONE rank per mission: a mission can lift the pilot at most one rank,
+    even if the running score already covers several.
+    
+    Args:
+        running_scores: Running (cumulative) score after each mission, in order
+        required_scores: Scaled score needed for each rank, by rank index
+        start_index: Rank index the pilot starts at
+        
+    Yields:
+        (mission position, new rank index, running score) per promotion
+    """
+    rank_index = start_index
+    last_rank_index = len(required_scores) - 1
+    for position, running_score in enumerate(running_scores):
+        # Check if we've reached next rank
+        if rank_index < last_rank_index and running_score >= required_scores[rank_index + 1]:
+            rank_index += 1
+            yield position, rank_index, running_score
+
+
 class EventGenerator:
     def __init__(self, config_file: str = "campaign_progress_config.yaml", dry_run: bool = False):
         """Initialize event generator with configuration
@@ -61,6 +538,10 @@ class EventGenerator:
         
         self.dry_run = dry_run
         
+        # Per-event / per-mission debug output (HTML snippets, debriefing
+        # progress) - off by default, these prints cost more than the work
+        self._debug = False
+        
         # Load configuration
         # Try external file first (for user editing), then embedded
         from pathlib import Path
@@ -77,18 +558,11 @@ class EventGenerator:
                     # Fallback to embedded
                     config_path = Path(sys._MEIPASS) / config_file
         
-        # Try UTF-8 first, fallback to ISO-8859-1
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
-        except UnicodeDecodeError:
-            with open(config_path, 'r', encoding='iso-8859-1') as f:
-                self.config = yaml.safe_load(f)
+        self.config = self._load_config(config_path)
         
         # Load mission dates with explicit error handling
         try:
-            with open('campaign_mission_dates.json', 'r', encoding='utf-8') as f:
-                self.mission_dates = json.load(f)
+            self.mission_dates = _load_json_file('campaign_mission_dates.json')
         except FileNotFoundError:
             print(f"ERROR: Required file 'campaign_mission_dates.json' not found!")
             print(f"Please run step1_extract_mission_dates.py first.")
@@ -101,8 +575,7 @@ class EventGenerator:
         
         # Load decoded save data with explicit error handling
         try:
-            with open('campaigns_decoded.json', 'r', encoding='utf-8') as f:
-                self.save_data = json.load(f)
+            self.save_data = _load_json_file('campaigns_decoded.json')
         except FileNotFoundError:
             print(f"ERROR: Required file 'campaigns_decoded.json' not found!")
             print(f"Please run decode_campaing_usersave1.py first.")
@@ -116,15 +589,17 @@ class EventGenerator:
         # Extract game directory from mission dates JSON
         self.game_directory = self.mission_dates.get('game_directory', '')
         
-        # Initialize Mission Log Processor for debriefings
-        self.log_processor = None
-        if self.game_directory:
-            try:
-                from step4_process_mission_logs import MissionLogProcessor
-                self.log_processor = MissionLogProcessor(self.game_directory, verbose=False)
-                print(f"  - Mission log processor initialized")
-            except Exception as e:
-                print(f"  - Warning: Could not initialize mission log processor: {e}")
+        # Mission Log Processor for debriefings - created on first use
+        # (see the log_processor property)
+        self._log_processor = None
+        self._log_processor_loaded = False
+        
+        # pdfkit module and wkhtmltopdf configuration for PDF export -
+        # resolved on the first export and reused for every campaign
+        # (see _load_pdfkit)
+        self._pdfkit = None
+        self._pdfkit_config = None
+        self._pdfkit_loaded = False
         
         print(f"Loaded configuration:")
         print(f"  - {len(self.mission_dates) - 1} campaigns with dates")  # -1 for game_directory key
@@ -136,6 +611,245 @@ class EventGenerator:
         self.mission_dates_lower = {
             k.lower(): (k, v) for k, v in self.mission_dates.items() if k != 'game_directory'
         }
+        
+        # campaign_lower -> {mission_num: normalized_date} index, so that
+        # get_mission_date is a couple of dict lookups. Entries that are not
+        # dicts are kept aside only to report them when they are looked up.
+        self._mission_date_index = {}
+        self._malformed_mission_dates = {}
+        for campaign_name_lower, (_, campaign_data) in self.mission_dates_lower.items():
+            if not isinstance(campaign_data, dict):
+                continue
+            campaign_dates = self._mission_date_index[campaign_name_lower] = {}
+            for mission_num, mission_data in campaign_data.get('missions', {}).items():
+                if isinstance(mission_data, dict):
+                    campaign_dates[mission_num] = mission_data.get('normalized_date')
+                else:
+                    self._malformed_mission_dates[(campaign_name_lower, mission_num)] = mission_data
+        
+        # Campaign name as callers spell it -> its _mission_date_index entry,
+        # so the per-call lookups skip lowercasing the name every time
+        self._campaign_mission_dates = {}
+        
+        # (campaign_name, mission_id) -> (date_str, time_str) from the .eng files
+        self._mission_datetime_cache = {}
+        
+        # campaign_name -> {normcased file name: path} of its .eng files
+        self._eng_files = {}
+        # .eng file path -> (date_str, time_str) from its briefing header
+        self._eng_datetimes = {}
+        
+        # campaign_name_lower -> rank scaling factor (see get_rank_scaling_factor)
+        self._rank_scaling_factors = {}
+        
+        # Parsed rank_scaling factor brackets (see _get_rank_scaling_brackets)
+        self._rank_scaling_brackets = None
+        
+        # (image_path, rotate) -> data URI or fallback path (see image_to_base64)
+        self._image_data_uris = {}
+        # Image folder -> normcased names of its entries (see _image_exists)
+        self._image_folders = {}
+        
+        # campaign_name -> display name from its info file (see get_campaign_display_name)
+        self._display_names = {}
+        
+        # Award chance rolls: one private Random instance, rolls remembered per
+        # (campaign, mission, award) - see _award_roll
+        self._rng = random.Random()
+        self._award_rolls = {}
+        
+        # Awards that check_awards' mission loop can ever grant, per country
+        # (config order is kept - it decides the order of same-mission awards)
+        self._mission_awards = {
+            country: [award for award in awards if self._can_earn_in_mission_loop(award)]
+            for country, awards in self.config.get('awards', {}).items()
+        }
+        
+        # Award conditions compiled once, keyed by id(award) (the config keeps
+        # the award dicts alive): flattened (stat_name, threshold) pairs and the
+        # graduated_random_kills thresholds sorted highest kill count first
+        self._award_conditions = {}
+        self._graduated_thresholds = {}
+        for awards in self.config.get('awards', {}).values():
+            for award in awards:
+                self._compile_award(award)
+        
+        # Rank score thresholds per country, and whether they are ascending
+        # (then the current rank can be found by bisection)
+        self._rank_scores = {}
+        for country, ranks in self.config.get('ranks', {}).items():
+            scores = [rank['score'] for rank in ranks]
+            self._rank_scores[country] = (scores, scores == sorted(scores))
+        
+        # id(mission stats dict) -> (stats dict, per-mission totals)
+        self._mission_totals_cache = {}
+        
+        # Pilot's badge/emblem candidates per country - static per config
+        self._pilots_awards = {
+            country: self._find_pilots_awards(awards)
+            for country, awards in self.config.get('awards', {}).items()
+        }
+        
+        # Wound badge awards and their required wound counts per country -
+        # static per config (see _find_wound_awards)
+        self._wound_awards = {
+            country: self._find_wound_awards(awards)
+            for country, awards in self.config.get('awards', {}).items()
+        }
+    
+    @staticmethod
+    def _find_pilots_awards(awards_config: List[Dict]) -> Dict[str, Dict]:
+        """Find a country's pilot's badge/emblem awards
+        
+        Returns a dict with up to three entries:
+            'first':  first pilot's award in config order (used for most countries)
+            'badge':  first one that is a badge (USSR before 6 January 1943)
+            'emblem': first one that is an emblem (USSR from 6 January 1943)
+        """
+        pilots_awards = {}
+        for award in awards_config:
+            # Check if this is a pilot's badge/emblem
+            is_pilots_award = (
+                "Pilot's Badge" in award['name'] or 
+                "Aviation Badge" in award['name'] or
+                "Aviation Emblem" in award['name'] or
+                "pilots_badge" in award.get('image', '') or
+                "pilots_emblem" in award.get('image', '')
+            )
+            if not is_pilots_award:
+                continue
+            
+            pilots_awards.setdefault('first', award)
+            if "Badge" in award['name'] or "badge" in award.get('image', ''):
+                pilots_awards.setdefault('badge', award)
+            if "Emblem" in award['name'] or "emblem" in award.get('image', ''):
+                pilots_awards.setdefault('emblem', award)
+        
+        return pilots_awards
+    
+    @property
+    def log_processor(self):
+        """
+        Mission log processor for debriefings (None if unavailable)
+        
+        step4 and its parser modules are only imported when debriefings are
+        actually needed.
+        """
+        if not self._log_processor_loaded:
+            self._log_processor_loaded = True
+            if self.game_directory:
+                try:
+                    from step4_process_mission_logs import MissionLogProcessor
+                    self._log_processor = MissionLogProcessor(self.game_directory, verbose=False)
+                    print(f"  - Mission log processor initialized")
+                except Exception as e:
+                    print(f"  - Warning: Could not initialize mission log processor: {e}")
+        return self._log_processor
+    
+    @log_processor.setter
+    def log_processor(self, processor):
+        self._log_processor = processor
+        self._log_processor_loaded = True
+    
+    @staticmethod
+    def _find_wound_awards(awards_config: List[Dict]) -> List[Tuple[Dict, List]]:
+        """
+        Find the awards that have wounds as a condition
+        
+        Returns:
+            List of (award, required_wounds) - required_wounds holds the
+            'deaths' / 'wounded_in_sortie' counts of its conditions in order
+        """
+        # Dynamisch: finde alle Awards, die Verwundungen als Bedingung haben
+        wound_awards = []
+        for a in awards_config:
+            conditions = a.get('conditions', [])
+            if any('deaths' in cond or 'wounded_in_sortie' in cond or 'wounded_this_sortie' in cond
+                   for cond in conditions):
+                required_wounds = [
+                    condition.get('deaths') or condition.get('wounded_in_sortie')
+                    for condition in conditions
+                    if 'deaths' in condition or 'wounded_in_sortie' in condition
+                ]
+                wound_awards.append((a, required_wounds))
+        return wound_awards
+    
+    def _compile_award(self, award: Dict):
+        """
+        Precompute an award's condition pairs and graduated thresholds
+        
+        Awards with malformed conditions are skipped here; the checks then
+        walk their YAML structure directly, exactly as written.
+        """
+        conditions = award.get('conditions', [])
+        if isinstance(conditions, list) and all(isinstance(condition, dict) for condition in conditions):
+            self._award_conditions[id(award)] = [
+                pair for condition in conditions for pair in condition.items()
+            ]
+        
+        graduated = award.get('graduated_random_kills')
+        if isinstance(graduated, dict):
+            try:
+                self._graduated_thresholds[id(award)] = sorted(graduated.items(), reverse=True)
+            except TypeError:
+                pass  # Mixed key types - sorted on use (and fails) as before
+    
+    @staticmethod
+    def _can_earn_in_mission_loop(award: Dict) -> bool:
+        """
+        Whether an award has anything that can trigger it mission by mission
+        
+        Per-sortie awards need one of the sortie conditions, cumulative awards
+        need graduated_random_kills or at least one condition. Awards without
+        (e.g. the pilot's badge) and awards with max_awards: 0 never trigger.
+        """
+        max_awards = award.get('max_awards', 1)
+        if max_awards is not None and max_awards <= 0:
+            return False
+        
+        conditions = award.get('conditions', [])
+        if award.get('per_sortie'):
+            sortie_keys = ('air_kills_in_sortie', 'air_kills_wounded_sortie', 'wounded_this_sortie')
+            return any(key in condition for condition in conditions for key in sortie_keys)
+        
+        return 'graduated_random_kills' in award or bool(conditions)
+    
+    def _load_config(self, config_path: Path) -> Dict:
+        """Load the YAML configuration, using a JSON sidecar cache when it is fresh
+        
+        The config rarely changes between runs and JSON parses much faster than
+        YAML, so the parsed config is stored next to the YAML file as
+        <name>.cache.json and reused until the YAML file is modified again.
+        """
+        cache_path = config_path.with_suffix('.cache.json')
+        
+        try:
+            if cache_path.stat().st_mtime >= config_path.stat().st_mtime:
+                return _map_graduated_kills(_load_json_file(cache_path), _graduated_kills_from_pairs)
+        except (OSError, ValueError, TypeError):
+            # No cache yet, or an unreadable one - parse the YAML below
+            pass
+        
+        # Try UTF-8 first, fallback to ISO-8859-1
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = yaml.load(f, Loader=_YAML_LOADER)
+        except UnicodeDecodeError:
+            with open(config_path, 'r', encoding='iso-8859-1') as f:
+                config = yaml.load(f, Loader=_YAML_LOADER)
+        
+        # graduated_random_kills uses integer keys, which JSON would turn into
+        # strings - they are cached as [kills, chance] pairs instead. Only
+        # configs that survive the round trip unchanged are cached
+        try:
+            cache_text = json.dumps(_map_graduated_kills(config, _graduated_kills_to_pairs), ensure_ascii=False)
+            if _map_graduated_kills(json.loads(cache_text), _graduated_kills_from_pairs) == config:
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    f.write(cache_text)
+        except (TypeError, ValueError, OSError):
+            pass
+        
+        return config
     
     def extract_mission_datetime(self, campaign_name: str, mission_id: str) -> tuple[Optional[str], Optional[str]]:
         """
@@ -153,65 +867,106 @@ class EventGenerator:
             Tuple of (date_string, time_string) or (None, None) if not found
             Example: ("4 November, 1943", "09:45")
         """
+        # The result only depends on the mission file on disk, so each
+        # mission's briefing is read at most once per run
+        cache_key = (campaign_name, mission_id)
+        if cache_key not in self._mission_datetime_cache:
+            self._mission_datetime_cache[cache_key] = self._read_mission_datetime(campaign_name, mission_id)
+        return self._mission_datetime_cache[cache_key]
+    
+    def _read_mission_datetime(self, campaign_name: str, mission_id: str) -> tuple[Optional[str], Optional[str]]:
+        """Read mission date and start time from the .eng file (uncached extract_mission_datetime)"""
         if not self.game_directory:
             return None, None
         
-        campaign_path = Path(self.game_directory) / "data" / "Campaigns" / campaign_name
+        eng_files = self._get_eng_files(campaign_name)
         
         # Try to find the mission file - check common patterns
+        # (names are compared with normcase, i.e. case-insensitively on Windows)
+        mission_key = os.path.normcase(mission_id)
         possible_files = [
-            campaign_path / f"{mission_id}.eng",
-            campaign_path / f"{mission_id.zfill(2)}.eng",
+            f"{mission_key}.eng",
+            f"{os.path.normcase(mission_id.zfill(2))}.eng",
         ]
         
         # Also check for files with extended names
-        for file in campaign_path.glob(f"{mission_id}*.eng"):
-            possible_files.append(file)
+        possible_files.extend(name for name in eng_files if name.startswith(mission_key))
         
-        for mission_file in possible_files:
-            if not mission_file.exists():
+        for file_name in possible_files:
+            mission_file = eng_files.get(file_name)
+            if mission_file is None:
                 continue
             
-            try:
-                # Try multiple encodings (IL-2 uses UTF-16 LE for .eng files)
-                content = None
-                for encoding in ['utf-16-le', 'utf-16', 'utf-8', 'utf-8-sig', 'iso-8859-1']:
-                    try:
-                        with open(mission_file, 'r', encoding=encoding, errors='ignore') as f:
-                            content = f.read(2000)  # Read first 2000 chars (briefing is at top)
-                        break  # Success!
-                    except (UnicodeDecodeError, UnicodeError):
-                        continue
-                
-                if not content:
-                    continue
-                
-                # Look for: Date: 4 November, 1943<br>
-                date_str = None
-                date_match = re.search(r'Date:\s*([^<\r\n]+)', content, re.IGNORECASE)
-                if date_match:
-                    date_str = date_match.group(1).strip()
-                
-                # Look for: Time: 9:45<br> or Time: 09:45<br>
-                time_str = None
-                time_match = re.search(r'Time:\s*(\d{1,2}:\d{2})', content, re.IGNORECASE)
-                if time_match:
-                    time_raw = time_match.group(1)
-                    # Ensure HH:MM format
-                    parts = time_raw.split(':')
-                    if len(parts) == 2:
-                        hours = parts[0].zfill(2)
-                        minutes = parts[1]
-                        time_str = f"{hours}:{minutes}"
-                
-                if date_str or time_str:
-                    return date_str, time_str
-            
-            except Exception:
-                continue
+            date_str, time_str = self._get_eng_datetime(mission_file)
+            if date_str or time_str:
+                return date_str, time_str
         
         return None, None
     
+    def _get_eng_datetime(self, mission_file: Path) -> tuple[Optional[str], Optional[str]]:
+        """
+        Date and start time from one .eng file's briefing header
+        
+        Results are cached per file: the candidate lists of different missions
+        overlap (mission "1" also looks at "10.eng", "11.eng", ...), so each
+        file is read at most once per run.
+        """
+        if mission_file in self._eng_datetimes:
+            return self._eng_datetimes[mission_file]
+        
+        date_str = None
+        time_str = None
+        try:
+            # Read the briefing head once and decode it with the sniffed
+            # encoding (IL-2 uses UTF-16 LE for .eng files)
+            with open(mission_file, 'rb') as f:
+                raw = f.read(4000)
+            content = _decode_briefing_head(raw)[:2000]  # First 2000 chars (briefing is at top)
+            
+            # Look for: Date: 4 November, 1943<br>
+            date_match = _BRIEFING_DATE.search(content)
+            if date_match:
+                date_str = date_match.group(1).strip()
+            
+            # Look for: Time: 9:45<br> or Time: 09:45<br>
+            time_match = _BRIEFING_TIME.search(content)
+            if time_match:
+                time_raw = time_match.group(1)
+                # Ensure HH:MM format
+                parts = time_raw.split(':')
+                if len(parts) == 2:
+                    hours = parts[0].zfill(2)
+                    minutes = parts[1]
+                    time_str = f"{hours}:{minutes}"
+        
+        except Exception:
+            date_str = time_str = None
+        
+        self._eng_datetimes[mission_file] = (date_str, time_str)
+        return date_str, time_str
+    
+    def _get_eng_files(self, campaign_name: str) -> Dict[str, Path]:
+        """
+        .eng mission files of a campaign folder, keyed by normcased file name
+        
+        The folder is listed once per run instead of being globbed for every
+        mission.
+        """
+        eng_files = self._eng_files.get(campaign_name)
+        if eng_files is None:
+            eng_files = {}
+            campaign_path = Path(self.game_directory) / "data" / "Campaigns" / campaign_name
+            try:
+                with os.scandir(campaign_path) as entries:
+                    for entry in entries:
+                        file_name = os.path.normcase(entry.name)
+                        if file_name.endswith('.eng') and entry.is_file():
+                            eng_files[file_name] = Path(entry.path)
+            except OSError:
+                pass  # Campaign folder missing or unreadable
+            self._eng_files[campaign_name] = eng_files
+        return eng_files
+    
     def extract_mission_start_time(self, campaign_name: str, mission_id: str) -> Optional[str]:
         """
         Extract mission start time from .eng file (backward compatibility)
@@ -222,6 +977,33 @@ class EventGenerator:
         _, time_str = self.extract_mission_datetime(campaign_name, mission_id)
         return time_str
     
+    def _mission_totals(self, mission_stats: Dict) -> Dict:
+        """
+        Per-mission counters from one characterStatisticsByFileName entry
+        
+        calculate_cumulative_stats and check_awards both aggregate the same
+        missions, so the sums are computed once per stats dict and cached.
+        The cache keeps a reference to the dict, so its id cannot be reused.
+        """
+        cached = self._mission_totals_cache.get(id(mission_stats))
+        if cached is not None and cached[0] is mission_stats:
+            return cached[1]
+        
+        totals = {
+            'light': int(mission_stats.get('killLightPlane', 0)),
+            'medium': int(mission_stats.get('killMediumPlane', 0)),
+            'heavy': int(mission_stats.get('killHeavyPlane', 0)),
+            'static': int(mission_stats.get('killStaticPlane', 0)),
+            'ground': sum(int(mission_stats.get(key, 0)) for key in _GROUND_KEYS),
+            'tanks': sum(int(mission_stats.get(key, 0)) for key in _TANK_KEYS),
+            'ships': sum(int(mission_stats.get(key, 0)) for key in _SHIP_KEYS),
+            'deaths': int(mission_stats.get('deaths', 0)),
+            'flight_time': int(mission_stats.get('totalFlightTime', 0)),  # seconds
+            'score': int(mission_stats.get('score', 0))
+        }
+        self._mission_totals_cache[id(mission_stats)] = (mission_stats, totals)
+        return totals
+    
     def calculate_cumulative_stats(self, campaign_stats: Dict) -> Dict:
         """
         Calculate cumulative statistics from characterStatisticsByFileName
@@ -250,18 +1032,21 @@ class EventGenerator:
         }
         
         for mission_num, stats in campaign_stats.items():
-            # Defensive: ensure stats is a dict
-            if not isinstance(stats, dict):
+            # Defensive: stats should be a dict - malformed entries are rare, so
+            # let .get() fail instead of type-checking every mission
+            try:
+                totals = self._mission_totals(stats)
+            except AttributeError:
                 print(f"    Warning: Stats for mission {mission_num} is not a dict: {type(stats)} = {stats}")
                 continue
             
             cumulative['missions_completed'] += 1
             
             # Air kills (static planes count as 0.5)
-            light = int(stats.get('killLightPlane', 0))
-            medium = int(stats.get('killMediumPlane', 0))
-            heavy = int(stats.get('killHeavyPlane', 0))
-            static = int(stats.get('killStaticPlane', 0))
+            light = totals['light']
+            medium = totals['medium']
+            heavy = totals['heavy']
+            static = totals['static']
             
             cumulative['fighter_kills'] += light + medium
             cumulative['bomber_kills'] += heavy
@@ -271,60 +1056,23 @@ class EventGenerator:
             # Air combat score (weighted: bombers count double, static count 0.5)
             cumulative['air_combat_score'] += light + medium + (static * 0.5) + (heavy * 2)
             
-            # Ground kills
-            ground = (
-                int(stats.get('killTransportVehicle', 0)) +
-                int(stats.get('killLightArmoredVehicle', 0)) +
-                int(stats.get('killMediumArmoredVehicle', 0)) +
-                int(stats.get('killHeavyArmoredVehicle', 0)) +
-                int(stats.get('killCannon', 0)) +
-                int(stats.get('killAAAGun', 0)) +
-                int(stats.get('killMachinegun', 0)) +
-                int(stats.get('killRocketLauncher', 0)) +
-                int(stats.get('killRailroadCarriage', 0)) +
-                int(stats.get('killLocomotive', 0)) +
-                int(stats.get('killRailroadStation', 0)) +
-                int(stats.get('killBridge', 0)) +
-                int(stats.get('killFacility', 0)) +
-                int(stats.get('killRadar', 0)) +
-                int(stats.get('killSearchlight', 0)) +
-                int(stats.get('killResidentalBuilding', 0))
-            )
-            cumulative['ground_kills'] += ground
-            
-            # Tank kills
-            tanks = (
-                int(stats.get('killLightArmoredVehicle', 0)) +
-                int(stats.get('killMediumArmoredVehicle', 0)) +
-                int(stats.get('killHeavyArmoredVehicle', 0))
-            )
-            cumulative['tank_kills'] += tanks
-            
-            # Ship kills
-            ships = (
-                int(stats.get('killLightShip', 0)) +
-                int(stats.get('killLargeCargoShip', 0)) +
-                int(stats.get('killDestroyerShip', 0)) +
-                int(stats.get('killSubmarine', 0))
-            )
-            cumulative['ship_kills'] += ships
-            
-            # Deaths
-            cumulative['deaths'] += int(stats.get('deaths', 0))
-            
-            # Total kills (air + ground + sea)
-            cumulative['total_kills'] = (
-                cumulative['total_air_kills'] + 
-                cumulative['ground_kills'] + 
-                cumulative['ship_kills']
-            )
+            cumulative['ground_kills'] += totals['ground']
+            cumulative['tank_kills'] += totals['tanks']
+            cumulative['ship_kills'] += totals['ships']
+            cumulative['deaths'] += totals['deaths']
             
             # Flight time
-            cumulative['total_flight_time'] += int(stats.get('totalFlightTime', 0))
-            cumulative['flight_time_hours'] = cumulative['total_flight_time'] / 3600
+            cumulative['total_flight_time'] += totals['flight_time']
             
             # Score
-            cumulative['total_score'] += int(stats.get('score', 0))
+            cumulative['total_score'] += totals['score']
+        
+        # Total kills (air + ground + sea)
+        cumulative['total_kills'] = (
+            cumulative['total_air_kills'] + 
+            cumulative['ground_kills'] + 
+            cumulative['ship_kills']
+        )
         
         # Convert flight time to hours
         cumulative['flight_time_hours'] = cumulative['total_flight_time'] / 3600
@@ -333,24 +1081,57 @@ class EventGenerator:
     
     def get_mission_date(self, campaign_name: str, mission_num: str) -> Optional[str]:
         """Get the date for a specific mission (case-insensitive campaign lookup)"""
-        # Case-insensitive lookup
-        campaign_name_lower = campaign_name.lower()
-        if campaign_name_lower not in self.mission_dates_lower:
-            return None
+        campaign_dates = self._campaign_mission_dates.get(campaign_name)
+        if campaign_dates is None:
+            campaign_dates = self._mission_date_index.get(campaign_name.lower(), {})
+            self._campaign_mission_dates[campaign_name] = campaign_dates
+        mission_date = campaign_dates.get(mission_num)
+        
+        if mission_date is None and self._malformed_mission_dates:
+            key = (campaign_name.lower(), mission_num)
+            if key in self._malformed_mission_dates:
+                mission_data = self._malformed_mission_dates[key]
+                print(f"    Warning: mission_data for {campaign_name}/{mission_num} is {type(mission_data)}: {mission_data}")
         
-        original_name, campaign_data = self.mission_dates_lower[campaign_name_lower]
-        missions = campaign_data.get('missions', {})
+        return mission_date
+    
+    def get_starting_rank_offset(self, campaign_name: str, rank_count: int) -> int:
+        """Starting rank index from campaign_mission_dates.json, clamped to the rank list"""
+        # New JSON structure: campaigns are at root level (no 'campaigns' wrapper)
+        if campaign_name not in self.mission_dates or campaign_name == 'game_directory':
+            return 0
         
-        if mission_num in missions:
-            mission_data = missions[mission_num]
-            # Defensive: check if it's a dict
-            if isinstance(mission_data, dict):
-                return mission_data.get('normalized_date')
-            else:
-                print(f"    Warning: mission_data for {campaign_name}/{mission_num} is {type(mission_data)}: {mission_data}")
-                return None
+        starting_rank_offset = self.mission_dates[campaign_name].get('starting_rank_offset', 0)
+        # Clamp to valid range
+        return max(0, min(starting_rank_offset, rank_count - 1))
+    
+    def get_rank_index_for_score(self, country: str, total_score: float) -> int:
+        """Index of the highest rank whose score requirement is met (0 if none is)"""
+        scores, ascending = self._rank_scores.get(country, ((), True))
+        if ascending:
+            return max(bisect_right(scores, total_score) - 1, 0)
+        
+        # Unordered config - last rank in config order whose score is reached
+        current_rank_idx = 0
+        for idx, score in enumerate(scores):
+            if total_score >= score:
+                current_rank_idx = idx
+        return current_rank_idx
+    
+    def _award_roll(self, campaign_name: str, mission_num: str, award_name: str) -> int:
+        """
+        Deterministic 0-999 roll for an award's random check on one mission
         
-        return None
+        Seeded with campaign + mission + award name, so results are repeatable
+        AND unique per award. Uses the generator's own Random instance (the
+        global random state is left alone) and remembers each roll, so
+        regenerating a campaign does not reseed for every award again.
+        """
+        key = (campaign_name, mission_num, award_name)
+        if key not in self._award_rolls:
+            self._rng.seed(f"{campaign_name}_{mission_num}_{award_name}")
+            self._award_rolls[key] = self._rng.randrange(1000)
+        return self._award_rolls[key]
     
     def check_awards(self, country: str, cumulative_stats: Dict,
                     per_mission_stats: Dict, completed_missions: List[str],
@@ -371,10 +1152,15 @@ class EventGenerator:
         if country not in self.config['awards']:
             return []
         
-        awards_config = self.config['awards'][country]
+        # Total wounds from debriefings (most accurate) - fixed for the whole
+        # campaign, used by 'deaths' conditions and the wound badges
+        cumulative_wounds = sum(1 for w in debriefing_wounds.values() if w)
+        
+        # Awards still worth checking in the mission loop (pruned once maxed out)
+        pending_awards = list(self._mission_awards.get(country, []))
         earned_awards = []
-        already_earned = []  # Track what's been earned so far
-        earned_this_mission = []  # Track what was just earned this mission
+        already_earned = Counter()  # Track what's been earned so far (name -> times)
+        earned_this_mission = []  # Award entries (with tier) earned this mission
         
         # Track running statistics
         running_stats = {
@@ -390,21 +1176,16 @@ class EventGenerator:
             'total_kills': 0  # air + ground + ship
         }
         
+        # Missions in play order - sorted once and reused below
+        sorted_missions = sorted(completed_missions, key=smart_mission_sort_key)
+        
         # Add starting rank (before first mission)
         ranks = self.config['ranks'].get(country, [])
         if ranks:
-            # Get starting rank offset from campaign_mission_dates.json
-            starting_rank_offset = 0
-            # New JSON structure: campaigns are at root level (no 'campaigns' wrapper)
-            if campaign_name in self.mission_dates and campaign_name != 'game_directory':
-                campaign_data = self.mission_dates[campaign_name]
-                starting_rank_offset = campaign_data.get('starting_rank_offset', 0)
-                # Clamp to valid range
-                starting_rank_offset = max(0, min(starting_rank_offset, len(ranks) - 1))
-            
+            starting_rank_offset = self.get_starting_rank_offset(campaign_name, len(ranks))
             starting_rank = ranks[starting_rank_offset]  # Use configured offset
             # Get date of first mission or use placeholder
-            first_mission = sorted(completed_missions, key=smart_mission_sort_key)[0]
+            first_mission = sorted_missions[0]
             first_mission_date = self.get_mission_date(campaign_name, first_mission)
             
             earned_awards.append({
@@ -417,61 +1198,37 @@ class EventGenerator:
         
         # Add Pilot's Badge/Emblem (before first mission)
         # For USSR: Choose between Badge (early) and Emblem (late) based on first mission date
-        first_mission = sorted(completed_missions, key=smart_mission_sort_key)[0]
+        first_mission = sorted_missions[0]
         first_mission_date = self.get_mission_date(campaign_name, first_mission)
         
-        for award in awards_config:
-            # Check if this is a pilot's badge/emblem
-            is_pilots_award = (
-                "Pilot's Badge" in award['name'] or 
-                "Aviation Badge" in award['name'] or
-                "Aviation Emblem" in award['name'] or
-                "pilots_badge" in award.get('image', '') or
-                "pilots_emblem" in award.get('image', '')
-            )
-            
-            if is_pilots_award:
-                # For Soviet Union, choose based on date
-                if country == 'Soviet Union':
-                    # Check if campaign starts before or after transition
-                    if first_mission_date and first_mission_date >= "1943-01-06":
-                        # Late period - use Aviation Emblem
-                        if "Emblem" in award['name'] or "emblem" in award.get('image', ''):
-                            earned_awards.append({
-                                'type': 'award',
-                                'name': award['name'],
-                                'image': award['image'],
-                                'mission': 'Initial',
-                                'date': first_mission_date
-                            })
-                            already_earned.append(award['name'])
-                            break
-                    else:
-                        # Early period - use Aviation Badge
-                        if "Badge" in award['name'] or "badge" in award.get('image', ''):
-                            earned_awards.append({
-                                'type': 'award',
-                                'name': award['name'],
-                                'image': award['image'],
-                                'mission': 'Initial',
-                                'date': first_mission_date
-                            })
-                            already_earned.append(award['name'])
-                            break
-                else:
-                    # For other countries, just use first match
-                    earned_awards.append({
-                        'type': 'award',
-                        'name': award['name'],
-                        'image': award['image'],
-                        'mission': 'Initial',
-                        'date': first_mission_date
-                    })
-                    already_earned.append(award['name'])
-                    break  # Only one pilot's badge
+        pilots_awards = self._pilots_awards.get(country, {})
+        if country == 'Soviet Union':
+            # Check if campaign starts before or after transition
+            if first_mission_date and first_mission_date >= "1943-01-06":
+                pilots_award = pilots_awards.get('emblem')  # Late period - Aviation Emblem
+            else:
+                pilots_award = pilots_awards.get('badge')  # Early period - Aviation Badge
+        else:
+            # For other countries, just use first match
+            pilots_award = pilots_awards.get('first')
+        
+        if pilots_award:
+            earned_awards.append({
+                'type': 'award',
+                'name': pilots_award['name'],
+                'image': pilots_award['image'],
+                'mission': 'Initial',
+                'date': first_mission_date
+            })
+            already_earned[pilots_award['name']] += 1  # Only one pilot's badge
         
         # Process missions in order
-        for mission_num in sorted(completed_missions, key=smart_mission_sort_key):
+        for mission_num in sorted_missions:
+            # Running stats only feed the award checks - once no award can be
+            # earned anymore (none configured or all maxed out) we are done
+            if not pending_awards:
+                break
+            
             if mission_num not in per_mission_stats:
                 continue
             
@@ -479,55 +1236,21 @@ class EventGenerator:
             earned_this_mission = []  # Reset for new mission
             
             # Update running statistics (static planes count as 0.5)
-            light = int(mission_stats.get('killLightPlane', 0))
-            medium = int(mission_stats.get('killMediumPlane', 0))
-            heavy = int(mission_stats.get('killHeavyPlane', 0))
-            static = int(mission_stats.get('killStaticPlane', 0))
+            totals = self._mission_totals(mission_stats)
+            light = totals['light']
+            medium = totals['medium']
+            heavy = totals['heavy']
+            static = totals['static']
             
             running_stats['air_combat_score'] += light + medium + (static * 0.5) + (heavy * 2)
             running_stats['total_air_kills'] += light + medium + heavy + (static * 0.5)
             running_stats['missions_completed'] += 1
-            running_stats['flight_time_hours'] += int(mission_stats.get('totalFlightTime', 0)) / 3600
-            running_stats['deaths'] += int(mission_stats.get('deaths', 0))
-            running_stats['total_score'] += int(mission_stats.get('score', 0))
-            
-            # Ground kills
-            ground = (
-                int(mission_stats.get('killTransportVehicle', 0)) +
-                int(mission_stats.get('killLightArmoredVehicle', 0)) +
-                int(mission_stats.get('killMediumArmoredVehicle', 0)) +
-                int(mission_stats.get('killHeavyArmoredVehicle', 0)) +
-                int(mission_stats.get('killCannon', 0)) +
-                int(mission_stats.get('killAAAGun', 0)) +
-                int(mission_stats.get('killMachinegun', 0)) +
-                int(mission_stats.get('killRocketLauncher', 0)) +
-                int(mission_stats.get('killRailroadCarriage', 0)) +
-                int(mission_stats.get('killLocomotive', 0)) +
-                int(mission_stats.get('killRailroadStation', 0)) +
-                int(mission_stats.get('killBridge', 0)) +
-                int(mission_stats.get('killFacility', 0)) +
-                int(mission_stats.get('killRadar', 0)) +
-                int(mission_stats.get('killSearchlight', 0)) +
-                int(mission_stats.get('killResidentalBuilding', 0))
-            )
-            running_stats['ground_kills'] += ground
-            
-            # Tank kills
-            tanks = (
-                int(mission_stats.get('killLightArmoredVehicle', 0)) +
-                int(mission_stats.get('killMediumArmoredVehicle', 0)) +
-                int(mission_stats.get('killHeavyArmoredVehicle', 0))
-            )
-            running_stats['tank_kills'] += tanks
-            
-            # Ship kills
-            ships = (
-                int(mission_stats.get('killLightShip', 0)) +
-                int(mission_stats.get('killLargeCargoShip', 0)) +
-                int(mission_stats.get('killDestroyerShip', 0)) +
-                int(mission_stats.get('killSubmarine', 0))
-            )
-            running_stats['ship_kills'] += ships
+            running_stats['flight_time_hours'] += totals['flight_time'] / 3600
+            running_stats['deaths'] += totals['deaths']
+            running_stats['total_score'] += totals['score']
+            running_stats['ground_kills'] += totals['ground']
+            running_stats['tank_kills'] += totals['tanks']
+            running_stats['ship_kills'] += totals['ships']
             
             # Total kills (air + ground + sea)
             running_stats['total_kills'] = (
@@ -536,15 +1259,22 @@ class EventGenerator:
                 running_stats['ship_kills']
             )
             
+            # Current rank based on score - fixed for the whole award loop
+            current_rank_idx = self.get_rank_index_for_score(country, running_stats['total_score'])
+            
+            # THIS mission's values for the per-sortie awards (static planes count as 0.5)
+            mission_kills = light + medium + heavy + (static * 0.5)
+            wounded = totals['deaths'] > 0
+            
             # Check each award
-            for award in awards_config:
+            for award in pending_awards:
                 award_name = award['name']
                 max_awards = award.get('max_awards', 1)
                 
                 # Handle unlimited awards (max_awards: null)
                 if max_awards is not None:
                     # Check if max awards already reached for this award
-                    award_count = already_earned.count(award_name)
+                    award_count = already_earned[award_name]
                     if award_count >= max_awards:
                         continue  # Already earned maximum times
                 
@@ -565,10 +1295,7 @@ class EventGenerator:
                 
                 # Check if per-sortie award
                 if award.get('per_sortie'):
-                    # Check THIS mission only (static planes count as 0.5)
-                    mission_kills = light + medium + heavy + (static * 0.5)
-                    wounded = int(mission_stats.get('deaths', 0)) > 0
-                    
+                    # Check THIS mission only (mission_kills / wounded from above)
                     award_earned = False
                     conditions = award.get('conditions', [])
                     
@@ -591,10 +1318,8 @@ class EventGenerator:
                     
                     # Check random threshold (if specified)
                     if award_earned and ('random_threshold' in award or 'random_threshold_min' in award):
-                        import random
-                        # Seed with campaign + mission + award name for deterministic AND unique results
-                        random.seed(f"{campaign_name}_{mission_num}_{award_name}")
-                        random_roll = random.randint(0, 999)
+                        # Seeded with campaign + mission + award name for deterministic AND unique results
+                        random_roll = self._award_roll(campaign_name, mission_num, award_name)
                         
                         # Standard threshold: RND < X (e.g., RND<800 = 80% chance)
                         if 'random_threshold' in award:
@@ -619,16 +1344,6 @@ class EventGenerator:
                         })
                 
                 else:
-                    # Check rank index requirements
-                    # Get ranks for this country
-                    current_rank_idx = 0
-                    if country in self.config.get('ranks', {}):
-                        ranks = self.config['ranks'][country]
-                        # Find current rank based on score
-                        for idx, rank in enumerate(ranks):
-                            if running_stats.get('total_score', 0) >= rank['score']:
-                                current_rank_idx = idx
-                    
                     # Check minimum rank requirement
                     if 'requires_rank_index' in award or 'min_rank_index' in award:
                         required_min = award.get('requires_rank_index', award.get('min_rank_index', 0))
@@ -644,35 +1359,38 @@ class EventGenerator:
                     # Check cumulative stats OR graduated random
                     award_granted = False
                     
+                    # One roll decides one award - rolled at most once here and
+                    # shared by the graduated and standard threshold checks
+                    random_roll = None
+                    
                     # First check graduated random kills (British DFM/DFC style)
                     if 'graduated_random_kills' in award:
-                        import random
-                        random.seed(f"{campaign_name}_{mission_num}_{award_name}")
-                        random_roll = random.randint(0, 999)
+                        random_roll = self._award_roll(campaign_name, mission_num, award_name)
                         
                         total_kills = running_stats.get('total_air_kills', 0)
-                        graduated_thresholds = award['graduated_random_kills']
                         
                         # Check if any kill threshold passes the random check
-                        for kill_count, rnd_threshold in sorted(graduated_thresholds.items(), reverse=True):
+                        graduated_thresholds = self._graduated_thresholds.get(id(award))
+                        if graduated_thresholds is None:
+                            graduated_thresholds = sorted(award['graduated_random_kills'].items(), reverse=True)
+                        for kill_count, rnd_threshold in graduated_thresholds:
                             if total_kills >= kill_count and random_roll < rnd_threshold:
                                 award_granted = True
                                 break
-                    
-                    # OR check normal conditions (missions/flight time)
-                    if not award_granted and self.check_award_conditions_with_stats(award, running_stats, debriefing_wounds):
-                        award_granted = True
+                        
+                        # OR check normal conditions (missions/flight time)
+                        if not award_granted:
+                            award_granted = self.check_award_conditions_with_stats(award, running_stats, debriefing_wounds, cumulative_wounds)
                     
                     # If no graduated_random_kills, just check normal conditions
-                    if 'graduated_random_kills' not in award:
-                        award_granted = self.check_award_conditions_with_stats(award, running_stats, debriefing_wounds)
+                    else:
+                        award_granted = self.check_award_conditions_with_stats(award, running_stats, debriefing_wounds, cumulative_wounds)
                     
                     if award_granted:
                         # Check standard random thresholds
                         if 'random_threshold' in award or 'random_threshold_min' in award:
-                            import random
-                            random.seed(f"{campaign_name}_{mission_num}_{award_name}")
-                            random_roll = random.randint(0, 999)
+                            if random_roll is None:
+                                random_roll = self._award_roll(campaign_name, mission_num, award_name)
                             
                             # Standard threshold: RND < X
                             if 'random_threshold' in award:
@@ -699,17 +1417,15 @@ class EventGenerator:
             
             # TIER FILTERING: Process ALL tiered awards (both per-sortie and cumulative)
             # Keep only highest tier per mission to prevent multiple awards for same achievement
-            tiered_awards_this_mission = [e for e in earned_this_mission if isinstance(e, dict) and 'tier' in e]
-            regular_awards_this_mission = [e for e in earned_this_mission if isinstance(e, str)]
-            
-            if tiered_awards_this_mission:
+            # (every entry in earned_this_mission carries a tier - 999 by default)
+            if earned_this_mission:
                 # Find highest tier (lowest number = highest priority)
                 # Tier 1 = Hero/Medal of Honor, Tier 2 = Red Banner/DSC, etc.
-                highest_tier = min(e['tier'] for e in tiered_awards_this_mission)
+                highest_tier = min(e['tier'] for e in earned_this_mission)
                 
                 # Keep only awards at highest tier
                 kept_award_names = []
-                for tiered_award in tiered_awards_this_mission:
+                for tiered_award in earned_this_mission:
                     if tiered_award['tier'] == highest_tier:
                         # Add to final list
                         earned_awards.append({
@@ -719,74 +1435,69 @@ class EventGenerator:
                             'mission': tiered_award['mission'],
                             'date': tiered_award['date']
                         })
-                        already_earned.append(tiered_award['name'])
+                        already_earned[tiered_award['name']] += 1
                         kept_award_names.append(tiered_award['name'])
                 
-                # Update earned_this_mission for prerequisite checking next mission
-                earned_this_mission = kept_award_names + regular_awards_this_mission
-            else:
-                # No tiered awards, process regular awards normally
-                for regular_award in regular_awards_this_mission:
-                    # These were already added to earned_awards in the loop above
-                    pass
+                # Drop awards that reached max_awards - they cannot be earned again
+                pending_awards = [
+                    award for award in pending_awards
+                    if award['name'] not in kept_award_names
+                    or award.get('max_awards', 1) is None
+                    or already_earned[award['name']] < award.get('max_awards', 1)
+                ]
                     
         # === 🩸 WOUND BADGE SYSTEM (Cumulative, YAML-driven) ===
                     
-        if country in self.config.get('awards', {}):
-            # Dynamisch: finde alle Awards, die Verwundungen als Bedingung haben
-            wound_awards = []
-            for a in self.config['awards'][country]:
-                for cond in a.get('conditions', []):
-                    if 'deaths' in cond or 'wounded_in_sortie' in cond or 'wounded_this_sortie' in cond:
-                        wound_awards.append(a)
-                        break
-
-            if wound_awards:
-                cumulative_wounds = sum(1 for w in debriefing_wounds.values() if w)
-
-                for award in wound_awards:
-                    for condition in award.get('conditions', []):
-                        if 'deaths' in condition or 'wounded_in_sortie' in condition:
-                            required_wounds = condition.get('deaths') or condition.get('wounded_in_sortie')
-                            if cumulative_wounds >= required_wounds and award['name'] not in already_earned:
-                                last_mission = sorted(completed_missions, key=smart_mission_sort_key)[-1]
-                                mission_date = self.get_mission_date(campaign_name, last_mission)
-
-                                earned_awards.append({
-                                    'type': 'award',
-                                    'name': award['name'],
-                                    'image': award['image'],
-                                    'mission': last_mission,
-                                    'date': mission_date
-                                })
-                                already_earned.append(award['name'])
-                                print(f"  ✓ Awarded {award['name']} after {cumulative_wounds} wounds")
+        wound_awards = self._wound_awards.get(country)
+        if wound_awards:
+            last_mission = sorted_missions[-1]
+
+            for award, required_wounds_list in wound_awards:
+                for required_wounds in required_wounds_list:
+                    if cumulative_wounds >= required_wounds and award['name'] not in already_earned:
+                        mission_date = self.get_mission_date(campaign_name, last_mission)
+
+                        earned_awards.append({
+                            'type': 'award',
+                            'name': award['name'],
+                            'image': award['image'],
+                            'mission': last_mission,
+                            'date': mission_date
+                        })
+                        already_earned[award['name']] += 1
+                        print(f"  ✓ Awarded {award['name']} after {cumulative_wounds} wounds")
 
         
         return earned_awards
     
-    def check_award_conditions_with_stats(self, award: Dict, stats: Dict, debriefing_wounds: Dict = None) -> bool:
+    def check_award_conditions_with_stats(self, award: Dict, stats: Dict, debriefing_wounds: Dict = None,
+                                          cumulative_wounds: int = None) -> bool:
         """
         Check if award conditions are met (OR logic) with specific stats dict.
         Supports 'deaths' in YAML as an alias for cumulative wounds from debriefings.
+        Pass cumulative_wounds if already counted from debriefing_wounds.
         """
-        conditions = award.get('conditions', [])
         if debriefing_wounds is None:
             debriefing_wounds = {}
-
-        # Count total wounds from debriefings (most accurate)
-        cumulative_wounds = sum(1 for w in debriefing_wounds.values() if w)
-
-        for condition in conditions:
-            for stat_name, threshold in condition.items():
-                # Treat 'deaths' as wounds (for legacy YAML)
-                if stat_name == 'deaths':
-                    if cumulative_wounds >= threshold:
-                        return True
-                else:
-                    stat_value = stats.get(stat_name, 0)
-                    if stat_value >= threshold:
-                        return True  # OR logic – any condition triggers
+        
+        # (stat_name, threshold) pairs in config order - precompiled for
+        # configured awards, walked lazily for anything else
+        condition_pairs = self._award_conditions.get(id(award))
+        if condition_pairs is None:
+            condition_pairs = (pair for condition in award.get('conditions', []) for pair in condition.items())
+        
+        for stat_name, threshold in condition_pairs:
+            # Treat 'deaths' as wounds (for legacy YAML)
+            if stat_name == 'deaths':
+                if cumulative_wounds is None:
+                    # Count total wounds from debriefings (most accurate)
+                    cumulative_wounds = sum(1 for w in debriefing_wounds.values() if w)
+                if cumulative_wounds >= threshold:
+                    return True
+            else:
+                stat_value = stats.get(stat_name, 0)
+                if stat_value >= threshold:
+                    return True  # OR logic – any condition triggers
 
         return False
     
@@ -795,7 +1506,9 @@ class EventGenerator:
         """Find which mission an award was earned on"""
         # Simplified: Use last mission for now
         # TODO: Implement proper tracking of when conditions were met
-        last_mission = sorted(missions, key=smart_mission_sort_key)[-1]
+        # Last mission in play order (reversed: max() keeps the first of equal
+        # keys, the sort used here before kept the last)
+        last_mission = max(reversed(missions), key=smart_mission_sort_key)
         mission_date = self.get_mission_date(campaign_name, last_mission)
         
         return {
@@ -803,6 +1516,43 @@ class EventGenerator:
             'date': mission_date
         }
     
+    def _mission_sort_key(self, campaign_name: str, mission_num: str) -> Tuple[str, str, str]:
+        """Date part of the chronological event sort key for a mission"""
+        # Initial events (starting rank, pilot's badge) come first
+        if mission_num == 'Initial':
+            mission_sort = ("0000-00-00", "0", "")  # Before all missions - all strings!
+        else:
+            # Try to get actual mission date for proper chronological order
+            mission_date = self.get_mission_date(campaign_name, mission_num)
+            if mission_date:
+                # Parse date for sorting (YYYY-MM-DD format)
+                try:
+                    # Handle both formats: "1941-06-22" and "22.6.1941"
+                    if '-' in mission_date and len(mission_date) == 10 and mission_date[0].isdigit():
+                        # ISO format YYYY-MM-DD
+                        mission_sort = (mission_date, "0", "")  # String "0" for priority
+                    else:
+                        # DD.MM.YYYY format or D.M.YYYY - convert to YYYY-MM-DD
+                        parts = mission_date.split('.')
+                        if len(parts) == 3:
+                            # Pad day and month with zeros
+                            date_str = f"{parts[2].zfill(4)}-{parts[1].zfill(2)}-{parts[0].zfill(2)}"
+                            mission_sort = (date_str, "0", "")
+                        else:
+                            # Fallback to mission number as string (padded)
+                            mission_num_str = mission_num.zfill(10)
+                            mission_sort = ("9999-99-99", "1", mission_num_str)
+                except:
+                    # Fallback to mission number as string
+                    mission_num_str = mission_num.zfill(10)
+                    mission_sort = ("9999-99-99", "1", mission_num_str)
+            else:
+                # No date available - use mission number as string
+                mission_num_str = mission_num.zfill(10)
+                mission_sort = ("9999-99-99", "1", mission_num_str)
+        
+        return mission_sort
+    
     def generate_events_for_campaign(self, campaign_name: str) -> List[Dict]:
         """Generate all events (promotions + awards) for a campaign"""
         
@@ -883,45 +1633,24 @@ class EventGenerator:
             events.extend(awards)
             
             # Sort chronologically by mission DATE (not just number)
+            # The date part of the key only depends on the mission, and most
+            # missions carry several events - work it out once per mission
+            mission_sorts = {}
+            
             def sort_key(event):
-                # Initial events (starting rank, pilot's badge) come first
-                if event['mission'] == 'Initial':
-                    mission_sort = ("0000-00-00", "0", "")  # Before all missions - all strings!
-                else:
-                    # Try to get actual mission date for proper chronological order
-                    mission_date = self.get_mission_date(campaign_name, event['mission'])
-                    if mission_date:
-                        # Parse date for sorting (YYYY-MM-DD format)
-                        try:
-                            # Handle both formats: "1941-06-22" and "22.6.1941"
-                            if '-' in mission_date and len(mission_date) == 10 and mission_date[0].isdigit():
-                                # ISO format YYYY-MM-DD
-                                mission_sort = (mission_date, "0", "")  # String "0" for priority
-                            else:
-                                # DD.MM.YYYY format or D.M.YYYY - convert to YYYY-MM-DD
-                                parts = mission_date.split('.')
-                                if len(parts) == 3:
-                                    # Pad day and month with zeros
-                                    date_str = f"{parts[2].zfill(4)}-{parts[1].zfill(2)}-{parts[0].zfill(2)}"
-                                    mission_sort = (date_str, "0", "")
-                                else:
-                                    # Fallback to mission number as string (padded)
-                                    mission_num_str = event['mission'].zfill(10)
-                                    mission_sort = ("9999-99-99", "1", mission_num_str)
-                        except:
-                            # Fallback to mission number as string
-                            mission_num_str = event['mission'].zfill(10)
-                            mission_sort = ("9999-99-99", "1", mission_num_str)
-                    else:
-                        # No date available - use mission number as string
-                        mission_num_str = event['mission'].zfill(10)
-                        mission_sort = ("9999-99-99", "1", mission_num_str)
+                mission_num = event['mission']
+                mission_sort = mission_sorts.get(mission_num)
+                if mission_sort is None:
+                    mission_sort = self._mission_sort_key(campaign_name, mission_num)
+                    mission_sorts[mission_num] = mission_sort
                 
                 # Type order: promotion=0, award=1 (promotions first on same day)
                 type_order = 0 if event['type'] == 'promotion' else 1
                 score = event.get('score', 0)
                 return (*mission_sort, type_order, score)
             
+            # sort_key runs once per event (Timsort keys are computed up front);
+            # the key is not stored on the event dicts as they are written out
             events.sort(key=sort_key)
             
             print(f"  Generated {len(events)} events ({len(promotions)} promotions, {len(awards)} awards)")
@@ -944,27 +1673,26 @@ class EventGenerator:
         Returns:
             Scaling factor (1.0 = no scaling, 2.0 = double requirements, etc.)
         """
-        # Check if scaling is enabled
-        rank_scaling = self.config.get('rank_scaling', {})
-        if not rank_scaling.get('enabled', True):
-            return 1.0  # Scaling disabled
-        
-        # Get total mission count for this campaign
+        # Depends only on the config and the campaign's mission count, and is
+        # asked for by every promotion check - work it out once per campaign
         campaign_name_lower = campaign_name.lower()
-        if campaign_name_lower not in self.mission_dates_lower:
-            return 1.0  # Unknown campaign, use default
-        
-        _, mission_data = self.mission_dates_lower[campaign_name_lower]
-        mission_count = mission_data.get('mission_count', 0)
-        
-        if mission_count == 0:
-            return 1.0  # No missions, use default
+        if campaign_name_lower not in self._rank_scaling_factors:
+            self._rank_scaling_factors[campaign_name_lower] = self._calculate_rank_scaling_factor(campaign_name_lower)
+        return self._rank_scaling_factors[campaign_name_lower]
+    
+    def _get_rank_scaling_brackets(self) -> List[Tuple]:
+        """
+        Parse the rank_scaling factor brackets once, in config order
         
-        # Get factors from config
-        factors = rank_scaling.get('factors', {})
+        Returns:
+            List of (min, max, factor, bracket_str) - max is None for "71+"
+            brackets, and min == max for exact "10" brackets
+        """
+        if self._rank_scaling_brackets is not None:
+            return self._rank_scaling_brackets
         
-        # Parse all brackets dynamically and find matching one
-        matching_factor = 1.0  # Default if no bracket matches
+        brackets = []
+        factors = self.config.get('rank_scaling', {}).get('factors', {})
         
         for bracket_str, factor in factors.items():
             # Parse bracket string (e.g., "11-20", "71+", "5")
@@ -974,9 +1702,7 @@ class EventGenerator:
                 if '+' in bracket_str:
                     # Format: "71+" means 71 and above
                     min_val = int(bracket_str.replace('+', '').strip())
-                    if mission_count >= min_val:
-                        matching_factor = float(factor)
-                        # Don't break - continue to find highest matching bracket
+                    brackets.append((min_val, None, factor, bracket_str))
                 
                 elif '-' in bracket_str:
                     # Format: "11-20" means 11 to 20 inclusive
@@ -984,22 +1710,59 @@ class EventGenerator:
                     if len(parts) == 2:
                         min_val = int(parts[0].strip())
                         max_val = int(parts[1].strip())
-                        if min_val <= mission_count <= max_val:
-                            matching_factor = float(factor)
-                            break  # Found exact match
+                        brackets.append((min_val, max_val, factor, bracket_str))
                 
                 else:
                     # Format: "10" means exactly 10
                     exact_val = int(bracket_str)
-                    if mission_count == exact_val:
-                        matching_factor = float(factor)
-                        break  # Found exact match
+                    brackets.append((exact_val, exact_val, factor, bracket_str))
             
             except (ValueError, TypeError):
                 # Invalid bracket format, skip it
                 print(f"  Warning: Invalid rank_scaling bracket format: '{bracket_str}'")
                 continue
         
+        self._rank_scaling_brackets = brackets
+        return brackets
+    
+    def _calculate_rank_scaling_factor(self, campaign_name_lower: str) -> float:
+        """Rank scaling factor for a campaign (uncached get_rank_scaling_factor)"""
+        # Check if scaling is enabled
+        rank_scaling = self.config.get('rank_scaling', {})
+        if not rank_scaling.get('enabled', True):
+            return 1.0  # Scaling disabled
+        
+        # Get total mission count for this campaign
+        if campaign_name_lower not in self.mission_dates_lower:
+            return 1.0  # Unknown campaign, use default
+        
+        _, mission_data = self.mission_dates_lower[campaign_name_lower]
+        mission_count = mission_data.get('mission_count', 0)
+        
+        if mission_count == 0:
+            return 1.0  # No missions, use default
+        
+        # Find matching bracket in the pre-parsed list
+        matching_factor = 1.0  # Default if no bracket matches
+        
+        for min_val, max_val, factor, bracket_str in self._get_rank_scaling_brackets():
+            try:
+                if max_val is None:
+                    # "71+" means 71 and above
+                    if mission_count >= min_val:
+                        matching_factor = float(factor)
+                        # Don't break - continue to find highest matching bracket
+                
+                elif min_val <= mission_count <= max_val:
+                    # "11-20" range or "10" exact value
+                    matching_factor = float(factor)
+                    break  # Found exact match
+            
+            except (ValueError, TypeError):
+                # Invalid factor value, skip it
+                print(f"  Warning: Invalid rank_scaling bracket format: '{bracket_str}'")
+                continue
+        
         return matching_factor
     
     def check_rank_promotions_v2(self, campaign_name: str, country: str,
@@ -1010,48 +1773,41 @@ class EventGenerator:
         
         ranks = self.config['ranks'][country]
         promotions = []
-        running_score = 0
         
-        # Get starting rank offset from campaign_mission_dates.json
-        starting_rank_offset = 0
-        # New JSON structure: campaigns are at root level (no 'campaigns' wrapper)
-        if hasattr(self, 'mission_dates') and campaign_name in self.mission_dates and campaign_name != 'game_directory':
-            campaign_data = self.mission_dates[campaign_name]
-            starting_rank_offset = campaign_data.get('starting_rank_offset', 0)
-            # Clamp to valid range
-            starting_rank_offset = max(0, min(starting_rank_offset, len(ranks) - 1))
-        
-        current_rank_index = starting_rank_offset  # Start at configured rank
+        # Start at configured rank
+        current_rank_index = self.get_starting_rank_offset(campaign_name, len(ranks))
         
         # Get rank scaling factor based on campaign length
         scale_factor = self.get_rank_scaling_factor(campaign_name)
         
-        for mission_num in sorted(missions, key=smart_mission_sort_key):
-            if mission_num not in per_mission_stats:
-                continue
-            
-            mission_score = int(per_mission_stats[mission_num].get('score', 0))
-            running_score += mission_score
-            
-            # Check if we've reached next rank (only ONE promotion per mission)
-            if current_rank_index < len(ranks) - 1:
-                next_rank = ranks[current_rank_index + 1]
-                # Apply scaling factor to FULL rank requirement (not reduced by starting rank)
-                required_score = int(next_rank['score'] * scale_factor)
-                
-                if running_score >= required_score:
-                    # Promotion!
-                    current_rank_index += 1
-                    mission_date = self.get_mission_date(campaign_name, mission_num)
-                    
-                    promotions.append({
-                        'type': 'promotion',
-                        'rank': next_rank['name'],
-                        'image': next_rank['image'],
-                        'mission': mission_num,
-                        'date': mission_date,
-                        'score': running_score
-                    })
+        # Apply scaling factor to FULL rank requirement (not reduced by starting rank).
+        # Scaled once here instead of once per mission.
+        required_scores = [int(rank['score'] * scale_factor) for rank in ranks]
+        
+        # Running score is a prefix sum over the flown missions in order.
+        # Mission scores can be negative so the sum is not monotonic and we
+        # still step through it, but the per-mission score comes from the
+        # cached totals instead of being re-read from the stats dict.
+        flown_missions = [mission_num for mission_num in sorted(missions, key=smart_mission_sort_key)
+                          if mission_num in per_mission_stats]
+        running_scores = accumulate(self._mission_totals(per_mission_stats[mission_num])['score']
+                                    for mission_num in flown_missions)
+        
+        for position, rank_index, running_score in _promotion_scan(running_scores, required_scores,
+                                                                   current_rank_index):
+            # Promotion!
+            mission_num = flown_missions[position]
+            next_rank = ranks[rank_index]
+            mission_date = self.get_mission_date(campaign_name, mission_num)
+            
+            promotions.append({
+                'type': 'promotion',
+                'rank': next_rank['name'],
+                'image': next_rank['image'],
+                'mission': mission_num,
+                'date': mission_date,
+                'score': running_score
+            })
         
         return promotions
     
@@ -1067,20 +1823,33 @@ class EventGenerator:
         Returns:
             Base64 data URI or original path if conversion fails
         """
-        import base64
-        
         if not self.game_directory:
             return image_path
         
+        # The same rank/award images appear in many events and campaigns -
+        # read, convert and encode each (image, rotation) only once per run.
+        # Misses are remembered too so the .dds fallback probe and its
+        # warning happen once.
+        cache_key = (image_path, rotate)
+        data_uri = self._image_data_uris.get(cache_key)
+        if data_uri is None:
+            data_uri = self._encode_image_base64(image_path, rotate)
+            self._image_data_uris[cache_key] = data_uri
+        return data_uri
+    
+    def _encode_image_base64(self, image_path: str, rotate: bool) -> str:
+        """Base64 data URI for an image (uncached image_to_base64)"""
+        import base64
+        
         # Construct full path - images are in data/swf/ directory!
         full_path = Path(self.game_directory) / "data" / "swf" / image_path
         
         # Check for both .png and .dds extensions
-        if not full_path.exists():
+        if not self._image_exists(full_path):
             # Try .dds if .png doesn't exist
             if full_path.suffix.lower() == '.png':
                 dds_path = full_path.with_suffix('.dds')
-                if dds_path.exists():
+                if self._image_exists(dds_path):
                     full_path = dds_path
                 else:
                     print(f"  ⚠️  Image not found: {full_path} (also tried .dds)")
@@ -1094,30 +1863,39 @@ class EventGenerator:
             
             # Handle DDS files - convert to PNG
             if ext == '.dds':
-                try:
-                    from PIL import Image
-                    
-                    # Open DDS file with PIL
-                    img = Image.open(full_path)
-                    
-                    # Rotate if requested (before converting to PNG)
-                    if rotate:
-                        img = img.rotate(90, expand=True)  # 90° counter-clockwise
-                    
-                    # Convert to PNG in memory
-                    from io import BytesIO
-                    png_buffer = BytesIO()
-                    img.save(png_buffer, format='PNG')
-                    img_data = png_buffer.getvalue()
-                    mime_type = 'image/png'
-                    
-                except ImportError:
-                    print(f"  ⚠️  PIL not available, cannot convert DDS: {full_path.name}")
-                    return image_path
-                except Exception as e:
-                    print(f"  ⚠️  Failed to convert DDS {full_path.name}: {e}")
-                    return image_path
-            
+                # Unrotated conversions are kept beside the DDS and reused
+                # while newer than it, so later runs skip the PIL decode
+                converted_path = full_path.with_suffix('.converted.png')
+                img_data = None if rotate else self._load_converted_dds(full_path, converted_path)
+                mime_type = 'image/png'
+                
+                if img_data is None:
+                    try:
+                        from PIL import Image
+                        
+                        # Open DDS file with PIL
+                        img = Image.open(full_path)
+                        
+                        # Rotate if requested (before converting to PNG)
+                        if rotate:
+                            img = img.rotate(90, expand=True)  # 90° counter-clockwise
+                        
+                        # Convert to PNG in memory
+                        from io import BytesIO
+                        png_buffer = BytesIO()
+                        img.save(png_buffer, format='PNG')
+                        img_data = png_buffer.getvalue()
+                        
+                        if not rotate:
+                            self._save_converted_dds(converted_path, img_data)
+                        
+                    except ImportError:
+                        print(f"  ⚠️  PIL not available, cannot convert DDS: {full_path.name}")
+                        return image_path
+                    except Exception as e:
+                        print(f"  ⚠️  Failed to convert DDS {full_path.name}: {e}")
+                        return image_path
+                
             # Handle regular image files (PNG, JPG, etc)
             else:
                 # If rotation needed, load with PIL
@@ -1181,6 +1959,45 @@ class EventGenerator:
             print(f"  ⚠️  Failed to convert image {image_path}: {e}")
             return image_path
     
+    @staticmethod
+    def _load_converted_dds(dds_path: Path, converted_path: Path) -> Optional[bytes]:
+        """PNG bytes converted from a DDS on an earlier run, if still up to date"""
+        try:
+            if converted_path.stat().st_mtime >= dds_path.stat().st_mtime:
+                return converted_path.read_bytes()
+        except OSError:
+            pass  # Not converted yet (or unreadable)
+        return None
+    
+    @staticmethod
+    def _save_converted_dds(converted_path: Path, png_data: bytes):
+        """Keep a DDS->PNG conversion for later runs (best effort)"""
+        temp_path = converted_path.with_suffix('.tmp')
+        try:
+            # Write then rename, so an interrupted run never leaves half a PNG
+            temp_path.write_bytes(png_data)
+            os.replace(temp_path, converted_path)
+        except OSError:
+            pass  # Read-only game folder - convert again next run
+    
+    def _image_exists(self, full_path: Path) -> bool:
+        """
+        Whether an image file exists, from a per-folder listing
+        
+        Rank and award images share a handful of folders, so each folder is
+        listed once per run instead of stat()ing every image path.
+        """
+        folder = str(full_path.parent)
+        names = self._image_folders.get(folder)
+        if names is None:
+            try:
+                with os.scandir(folder) as entries:
+                    names = {os.path.normcase(entry.name) for entry in entries}
+            except OSError:
+                names = set()  # Folder missing or unreadable
+            self._image_folders[folder] = names
+        return os.path.normcase(full_path.name) in names
+    
     def rank_needs_rotation(self, event: Dict, country: str, country_folder: str = None) -> bool:
         """
         Determine if a rank image needs to be rotated 90° counter-clockwise
@@ -1202,72 +2019,6 @@ class EventGenerator:
         # DEBUG: Print what we're checking
         # print(f"DEBUG: Checking rotation for {country}/{country_folder}/{image_name}")
         
-        # Define which ranks need rotation (based on user requirements)
-        ranks_to_rotate = {
-            'Germany': [
-                # ALL German ranks need rotation
-                'unteroffizier.png',
-                'oberstleutnant.png',
-                'oberleutnant.png',
-                'oberfeldwebel.png',
-                'major.png',
-                'leutnant.png',
-                'hauptmann.png',
-                'feldwebel.png',
-                'generalleutnant.png',
-                'generalmajor.png',
-                'generalfeldmarschall.png',
-                'generaloberst.png',
-                'oberst.png',
-                'stabsfeldwebel.png',
-                'gefreiter.png',
-            ],
-            'Britain': [
-                # Only these 5 British ranks
-                'flight_lieutenant.png',
-                'flying_officer.png',
-                'pilot_officer.png',
-                'squadron_leader.png',
-                'wing_commander.png',
-            ],
-            'US': [  # NOTE: Changed from 'USA' to 'US' to match country_folder!
-                # All US ranks EXCEPT first_sergeant.png
-                'second_lieutenant.png',
-                'major_usaaf.png',
-                'lt_colonel.png',
-                'flight_officer.png',
-                # 'first_sergeant.png',  # ← NOT rotated!
-                'first_lieutenant.png',
-                'chief_warrant_officer.png',
-                'captain_usaaf.png',
-                'brigadier_general.png',
-                'colonel.png',
-                'major_general.png',
-                'lieutenant_general.png',
-                'general.png',
-                'master_sergeant.png',
-                'technical_sergeant.png',
-                'staff_sergeant.png',
-            ],
-            'USSR/late': [
-                # ALL USSR/late ranks need rotation
-                'sub_colonel.png',
-                'sergeant_vvs.png',
-                'senior_sergeant.png',
-                'senior_lieutenant.png',
-                'major_vvs.png',
-                'lieutenant_vvs.png',
-                'junior_lieutenant.png',
-                'captain_vvs.png',
-                'colonel_vvs.png',
-                'major_general_vvs.png',
-                'lieutenant_general_vvs.png',
-                'general_vvs.png',
-                'marshal_vvs.png',
-            ],
-            # USSR/early: NONE - not in dictionary, so will return False
-        }
-        
         # For Soviet Union, use the country_folder to determine early/late
         if country == 'Soviet Union':
             if country_folder == 'USSR/late':
@@ -1279,8 +2030,7 @@ class EventGenerator:
             country_key = country_folder or country
         
         # Check if this rank should be rotated
-        country_ranks = ranks_to_rotate.get(country_key, [])
-        should_rotate = image_name in [r.lower() for r in country_ranks]
+        should_rotate = image_name in _RANKS_TO_ROTATE_SETS.get(country_key, frozenset())
         
         # DEBUG: Print result
         # print(f"DEBUG: country_key={country_key}, should_rotate={should_rotate}")
@@ -1295,86 +2045,104 @@ class EventGenerator:
             country: Country name
             for_pdf: If True, embed images as base64 for PDF compatibility
         """
+        return self.event_html_formatter(country, for_pdf)(event)
+    
+    def event_html_formatter(self, country: str, for_pdf: bool = False):
+        """Build an event -> HTML line formatter for one country and output
         
-        # Get image path with special handling for Soviet Union (early/late periods)
-        country_folder_map = {
-            'Germany': 'Germany',
-            'Britain': 'Britain',
-            'USA': 'US'
-        }
+        Country folder and output format (PDF vs in-game) are the same for
+        every event of a campaign, so they are decided here once and the
+        returned function only does the per-event work.
         
-        if country == 'Soviet Union':
-            # Determine early vs late based on event date
-            # Historical transition: 6 January 1943 (introduction of shoulder boards / погоны)
-            event_date = event.get('date')
+        Args:
+            country: Country name
+            for_pdf: If True, embed images as base64 for PDF compatibility
             
-            if event_date and event_date >= "1943-01-06":
-                country_folder = 'USSR/late'
-            else:
+        Returns:
+            Function taking an event dict and returning its HTML line
+        """
+        
+        # Get image path with special handling for Soviet Union (early/late periods)
+        if country == 'Soviet Union':
+            def get_country_folder(event):
+                # Determine early vs late based on event date
+                # Historical transition: 6 January 1943 (introduction of shoulder boards / погоны)
+                event_date = event.get('date')
+                
+                if event_date and event_date >= "1943-01-06":
+                    return 'USSR/late'
                 # Default to early if no date or before transition
-                country_folder = 'USSR/early'
+                return 'USSR/early'
         else:
-            country_folder = country_folder_map.get(country, country)
-        
-        image_path = f"CampaignRanksAwards/{country_folder}/{event['image']}"
+            fixed_folder = _RANK_COUNTRY_FOLDERS.get(country, country)
+            
+            def get_country_folder(event):
+                return fixed_folder
         
-        # Check if rank needs rotation
-        needs_rotation = self.rank_needs_rotation(event, country, country_folder)
+        rank_needs_rotation = self.rank_needs_rotation
+        image_to_base64 = self.image_to_base64
         
-        # Convert to base64 if generating for PDF, with rotation if needed
-        if for_pdf:
-            image_src = self.image_to_base64(image_path, rotate=needs_rotation)
-        else:
-            # For in-game: Use Windows-style backslashes (IL-2 expects this)
-            image_src = image_path.replace('/', '\\')
-        
-        # Format date
-        if event.get('mission') == 'Initial':
-            # Initial events (starting rank + pilot's badge)
-            # Show date of first mission if available
-            if event.get('date'):
+        def event_text(event):
+            # Format date
+            if event.get('mission') == 'Initial':
+                # Initial events (starting rank + pilot's badge)
+                # Show date of first mission if available
+                if event.get('date'):
+                    try:
+                        date_str = _format_event_date(event['date'])
+                    except:
+                        date_str = "Before First Mission"
+                else:
+                    date_str = "Before First Mission"
+            elif event.get('date'):
                 try:
-                    date_obj = datetime.strptime(event['date'], '%Y-%m-%d')
-                    date_str = date_obj.strftime('%d %B, %Y')
+                    date_str = _format_event_date(event['date'])
                 except:
-                    date_str = "Before First Mission"
-            else:
-                date_str = "Before First Mission"
-        elif event.get('date'):
-            try:
-                date_obj = datetime.strptime(event['date'], '%Y-%m-%d')
-                date_str = date_obj.strftime('%d %B, %Y')
-            except:
-                date_str = event['date']
-        else:
-            date_str = f"After Mission {event['mission']}"
-        
-        # Format description
-        if event['type'] == 'promotion':
-            if event.get('mission') == 'Initial':
-                description = f"Started as {event['rank']}"
+                    date_str = event['date']
             else:
-                description = f"Promoted to {event['rank']}"
-        else:
-            if event.get('mission') == 'Initial':
-                description = f"Awarded {event['name']}"
+                date_str = f"After Mission {event['mission']}"
+            
+            # Format description
+            if event['type'] == 'promotion':
+                if event.get('mission') == 'Initial':
+                    description = f"Started as {event['rank']}"
+                else:
+                    description = f"Promoted to {event['rank']}"
             else:
                 description = f"Awarded {event['name']}"
+            
+            return date_str, description
         
         # Apply rotation:
         # - For PDF: Image is rotated via PIL in image_to_base64()
         # - For in-game: NO rotation (IL-2's browser doesn't support it well)
-        
-        # DEBUG: Print what we're generating
         if for_pdf:
-            # PDF: Better formatting with text before image and proper alignment
-            result = f"• {date_str} - {description} <span style='display: inline-block; vertical-align: middle; margin-left: 5px;'><img src='{image_src}' style='vertical-align: middle;'></span><br>"
+            def format_event(event):
+                country_folder = get_country_folder(event)
+                image_path = f"CampaignRanksAwards/{country_folder}/{event['image']}"
+                
+                # Embed as base64, rotated if the rank needs it
+                needs_rotation = rank_needs_rotation(event, country, country_folder)
+                image_src = image_to_base64(image_path, rotate=needs_rotation)
+                
+                date_str, description = event_text(event)
+                # PDF: Better formatting with text before image and proper alignment
+                return f"• {date_str} - {description} <span style='display: inline-block; vertical-align: middle; margin-left: 5px;'><img src='{image_src}' style='vertical-align: middle;'></span><br>"
         else:
-            # In-game: IL-2 expects unquoted src, image after text
-            result = f"• {date_str} - {description} <img src={image_src}><br>"
-            print(f"DEBUG HTML: {result[:150]}")  # First 150 chars
-        
-        return result
+            def format_event(event):
+                country_folder = get_country_folder(event)
+                # For in-game: Use Windows-style backslashes (IL-2 expects this)
+                image_path = f"CampaignRanksAwards/{country_folder}/{event['image']}"
+                image_src = image_path.replace('/', '\\')
+                
+                date_str, description = event_text(event)
+                # In-game: IL-2 expects unquoted src, image after text
+                result = f"• {date_str} - {description} <img src={image_src}><br>"
+                if self._debug:
+                    print(f"DEBUG HTML: {result[:150]}")  # First 150 chars
+                return result
+        
+        return format_event
     
     
     def generate_debriefings_html(self, campaign_name: str, completed_missions: List[str]) -> tuple:
@@ -1406,11 +2174,16 @@ class EventGenerator:
             data = debriefings[mission_id]
             
             # DEBUG: Show which mission we're processing
-            print(f"  Processing debriefing for Mission {mission_id}...")
+            if self._debug:
+                print(f"  Processing debriefing for Mission {mission_id}...")
             
             # Extract mission date and start time from .eng file
             mission_date, mission_start_time = self.extract_mission_datetime(campaign_name, mission_id)
             
+            # Start time as seconds after midnight - parsed once per mission,
+            # not once per flight log event
+            start_seconds = _parse_start_time(mission_start_time)
+            
             # Use mission date from .eng if available, otherwise show "No date"
             if mission_date:
                 date_str = mission_date
@@ -1433,14 +2206,14 @@ class EventGenerator:
             naval_kills = data['summary']['naval_kills']
             
             # Mission header with box (wrapped in div to prevent page breaks)
-            html_lines.append(f'<div class="mission-box">')
-            html_lines.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━<br>")
+            html_lines.append(_DEBRIEF_BOX_OPEN)
+            html_lines.append(_DEBRIEF_RULE)
             # Only show date if available (from mission file)
             if date_str:
                 html_lines.append(f"<b>MISSION {mission_id} | {date_str}</b><br>")
             else:
                 html_lines.append(f"<b>MISSION {mission_id}</b><br>")
-            html_lines.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━<br>")
+            html_lines.append(_DEBRIEF_RULE)
             
             # Summary line with status and damage
             summary_parts = [f"Aircraft: {aircraft}", f"Duration: {duration}", f"Status: {status}"]
@@ -1449,24 +2222,29 @@ class EventGenerator:
             if pilot_dmg > 0:
                 summary_parts.append(f"Pilot Dmg: {pilot_dmg}%")
             html_lines.append(f"{' | '.join(summary_parts)}<br>")
-            html_lines.append(f"<br>")
             
             # Combat results - show parked separately if present
-            html_lines.append(f"<b>COMBAT RESULTS</b><br>")
+            html_lines.append(_DEBRIEF_COMBAT_HEADER)
             if air_kills_parked > 0:
                 html_lines.append(f"Air: {air_kills} ({air_kills_flying} flying, {air_kills_parked} parked)  |  Ground: {ground_kills}  |  Naval: {naval_kills}<br>")
             else:
                 html_lines.append(f"Air: {air_kills}  |  Ground: {ground_kills}  |  Naval: {naval_kills}<br>")
-            html_lines.append(f"<br>")
             
             # Flight log with detailed events
-            html_lines.append(f"<b>FLIGHT LOG</b><br>")
+            html_lines.append(_DEBRIEF_FLIGHT_LOG_HEADER)
             
             # Check if player bailed out - suppress damage events after bailout
             # Use final_state from summary instead of tracking during loop
             mission_ended_in_bailout = "Bailout" in status
             
-            for event in data.get('events', [])[:25]:  # Max 25 events
+            # Pick the time conversion once per mission - without a start
+            # time the flight log shows mission times unchanged
+            if start_seconds is None:
+                to_clock_time = _unconverted_time
+            else:
+                to_clock_time = partial(_mission_clock_time, start_seconds)
+            
+            for event in islice(data.get('events', ()), 25):  # Max 25 events
                 time = event.get('time', '')
                 event_type = event.get('type', event.get('event', ''))
                 target = event.get('target', '')
@@ -1475,27 +2253,7 @@ class EventGenerator:
                 damage = event.get('damage')
                 
                 # Convert mission time to real time if we have start time
-                display_time = time
-                if mission_start_time and time:
-                    try:
-                        # Parse mission time (e.g., "00:23:45")
-                        time_parts = time.split(':')
-                        if len(time_parts) == 3:
-                            hours, minutes, seconds = map(int, time_parts)
-                            mission_duration = timedelta(hours=hours, minutes=minutes, seconds=seconds)
-                            
-                            # Parse start time (e.g., "09:45")
-                            start_parts = mission_start_time.split(':')
-                            if len(start_parts) == 2:
-                                start_hour, start_min = map(int, start_parts)
-                                start_dt = datetime(2000, 1, 1, start_hour, start_min)
-                                
-                                # Add mission duration to start time
-                                real_time = start_dt + mission_duration
-                                display_time = real_time.strftime('%H:%M:%S')  # Include seconds
-                    except Exception:
-                        # Fallback to mission time if conversion fails
-                        pass
+                display_time = to_clock_time(time)
                 
                 # Format event based on type
                 if event_type == "Kill":
@@ -1536,7 +2294,7 @@ class EventGenerator:
                     detail_str = f" ({', '.join(details)})" if details else ""
                     html_lines.append(f"  {display_time}  Landing damage{detail_str}<br>")
                 
-                elif event_type in ["Takeoff", "Landing", "Crash", "Bailout"]:
+                elif event_type in _FLIGHT_LOG_MOVEMENTS:
                     # Takeoff/Landing/Crash/Bailout with altitude
                     # Check if it's a hard landing
                     hard_landing = event.get('hard_landing', False)
@@ -1549,9 +2307,10 @@ class EventGenerator:
                     # Other events
                     html_lines.append(f"  {display_time}  {event_type}<br>")
             
-            html_lines.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━<br>")
-            html_lines.append("</div>")  # Close mission-box
-            html_lines.append("<br>")  # Spacing between missions
+            html_lines.append(_DEBRIEF_BOX_CLOSE)
+        
+        # One summary line instead of a line per mission
+        print(f"  Processed debriefings for {len(sorted_missions)} missions")
         
         return ("\n".join(html_lines), debriefings)
     
@@ -1566,12 +2325,9 @@ class EventGenerator:
         if not events:
             return ""
         
-        html_lines = ["<u>Events</u><br>"]
-        
-        for event in events:
-            html_lines.append(self.format_event_html(event, country, for_pdf=for_pdf))
-        
-        return "\n".join(html_lines)
+        # Header + one line per event; map keeps the per-event loop in C
+        format_event = self.event_html_formatter(country, for_pdf=for_pdf)
+        return "\n".join(("<u>Events</u><br>", *map(format_event, events)))
     
     def update_campaign_info_file(self, campaign_name: str, events_html: str) -> bool:
         """
@@ -1608,18 +2364,25 @@ class EventGenerator:
                 print(f"  Created backup: {backup_file.name}")
             
             # Read existing content and detect encoding
-            # Try different encodings
+            # Read the file once and try different encodings on the bytes
+            raw = info_file.read_bytes()
+            encodings = ['utf-8', 'utf-16-le', 'utf-16-be', 'latin-1']
+            if raw[:2] in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE):
+                # 0xFF/0xFE never occur in UTF-8 - skip the doomed attempt
+                encodings.remove('utf-8')
+            
             content = None
             detected_encoding = None
-            for encoding in ['utf-8', 'utf-16-le', 'utf-16-be', 'latin-1']:
+            for encoding in encodings:
                 try:
-                    with open(info_file, 'r', encoding=encoding) as f:
-                        content = f.read()
-                    detected_encoding = encoding
-                    print(f"  Detected encoding: {encoding}")
-                    break
+                    text = raw.decode(encoding)
                 except UnicodeDecodeError:
                     continue
+                # Same newline handling as reading in text mode
+                content = text.replace('\r\n', '\n').replace('\r', '\n')
+                detected_encoding = encoding
+                print(f"  Detected encoding: {encoding}")
+                break
             
             if content is None:
                 print(f"  Error: Could not decode file with any encoding")
@@ -1637,66 +2400,67 @@ class EventGenerator:
             before_content = content
             after_events_content = ""
             
+            # Section headers are fixed strings - one str.find each, no regex
+            debriefings_start = content.find('<u>Mission Debriefings</u>')
+            
             # Step 1: Check for and remove Mission Debriefings section
-            if '<u>Mission Debriefings</u>' in content:
-                # Find where Mission Debriefings starts
-                match = re.search(r'<u>Mission Debriefings</u>', content)
-                if match:
-                    before_content = content[:match.start()]
-                    content_after_debriefings = content[match.start():]
-                    
-                    # Check if there's an Events section after Debriefings
-                    if '<u>Events</u>' in content_after_debriefings:
-                        # Find Events section
-                        events_match = re.search(r'<u>Events</u>', content_after_debriefings)
-                        if events_match:
-                            # Check if there's content after Events that's NOT part of Events
-                            content_after_events = content_after_debriefings[events_match.end():]
-                            
-                            # Look for next section marker (starts with <u>)
-                            next_section = re.search(r'<br><br><u>[^<]+</u>', content_after_events)
-                            if next_section:
-                                after_events_content = content_after_events[next_section.start():]
-                    else:
-                        # No Events section, check for content after Debriefings
-                        next_section = re.search(r'<br><br><u>[^<]+</u>', content_after_debriefings)
-                        if next_section:
-                            after_events_content = content_after_debriefings[next_section.start():]
+            if debriefings_start >= 0:
+                before_content = content[:debriefings_start]
+                content_after_debriefings = content[debriefings_start:]
+                
+                # Check if there's an Events section after Debriefings
+                events_start = content_after_debriefings.find('<u>Events</u>')
+                if events_start >= 0:
+                    # Check if there's content after Events that's NOT part of Events
+                    content_after_events = content_after_debriefings[events_start + len('<u>Events</u>'):]
                     
-                    print(f"  Removed old Mission Debriefings section")
+                    # Look for next section marker (starts with <u>)
+                    next_section = _INFO_NEXT_SECTION.search(content_after_events)
+                    if next_section:
+                        after_events_content = content_after_events[next_section.start():]
+                else:
+                    # No Events section, check for content after Debriefings
+                    next_section = _INFO_NEXT_SECTION.search(content_after_debriefings)
+                    if next_section:
+                        after_events_content = content_after_debriefings[next_section.start():]
+                
+                print(f"  Removed old Mission Debriefings section")
             
             # Step 2: Check for Events section (if no Debriefings section)
-            elif '<u>Events</u>' in content:
-                # Find where Events starts
-                match = re.search(r'<u>Events</u>', content)
-                if match:
-                    before_content = content[:match.start()]
-                    content_after_events = content[match.end():]
+            else:
+                events_start = content.find('<u>Events</u>')
+                if events_start >= 0:
+                    # Find where Events starts
+                    before_content = content[:events_start]
+                    content_after_events = content[events_start + len('<u>Events</u>'):]
                     
                     # Look for next section marker
-                    next_section = re.search(r'<br><br><u>[^<]+</u>', content_after_events)
+                    next_section = _INFO_NEXT_SECTION.search(content_after_events)
                     if next_section:
                         after_events_content = content_after_events[next_section.start():]
-                
-                print(f"  Removed old Events section")
+                    
+                    print(f"  Removed old Events section")
 
             # Cleanup trailing whitespace and <br> tags from before_content
             before_content = before_content.rstrip()
             while before_content.endswith('<br>'):
                 before_content = before_content[:-4].rstrip()
             
-            # Build new content: before + new events + after (if any)
-            updated_content = before_content + '<br><br>' + events_html
-            
+            # New content: before + new events + after (if any)
             if after_events_content:
                 # Preserve content that came after Events section
-                updated_content += after_events_content
                 print(f"  ✓ Preserved content after Events section")
             
             # Write updated content using SAME encoding as original
             # This prevents corruption of UTF-16 LE files (common in IL-2)
+            # The parts are written one after another rather than joined
+            # into one more copy of the whole file first
             with open(info_file, 'w', encoding=detected_encoding) as f:
-                f.write(updated_content)
+                f.write(before_content)
+                f.write('<br><br>')
+                f.write(events_html)
+                if after_events_content:
+                    f.write(after_events_content)
             
             print(f"  ✓ Updated: {info_file} (encoding: {detected_encoding})")
             return True
@@ -1718,6 +2482,13 @@ class EventGenerator:
         if not self.game_directory:
             return campaign_name
         
+        # Read once per campaign - the summary and the PDF export both ask
+        if campaign_name not in self._display_names:
+            self._display_names[campaign_name] = self._read_campaign_display_name(campaign_name)
+        return self._display_names[campaign_name]
+    
+    def _read_campaign_display_name(self, campaign_name: str) -> str:
+        """Campaign display name from info.locale=eng.txt (uncached get_campaign_display_name)"""
         campaign_path = Path(self.game_directory) / "data" / "Campaigns" / campaign_name
         info_file = campaign_path / "info.locale=eng.txt"
         
@@ -1731,12 +2502,12 @@ class EventGenerator:
             
             # Look for &name="Campaign Display Name"
             # Can be with or without quotes
-            match = re.search(r'&name\s*=\s*"([^"]+)"', content)
+            match = _INFO_NAME_QUOTED.search(content)
             if match:
                 return match.group(1)
             
             # Try without quotes
-            match = re.search(r'&name\s*=\s*([^\n&]+)', content)
+            match = _INFO_NAME_UNQUOTED.search(content)
             if match:
                 return match.group(1).strip()
             
@@ -1745,6 +2516,18 @@ class EventGenerator:
         
         return campaign_name
     
+    def format_date(self, date_value) -> str:
+        """
+        Format a mission date (YYYY-MM-DD or YYYY.MM.DD) as "06 January, 1943"
+        
+        Goes through the memoized _format_event_date, so each date string is
+        formatted once per run. Dates that can't be parsed are shown as-is.
+        """
+        try:
+            return _format_event_date(date_value.replace('.', '-'))
+        except (ValueError, TypeError, AttributeError):
+            return date_value
+    
     def generate_campaign_summary_html(self, campaign_name: str, events: List[Dict], 
                                        debriefings: Dict, country: str, cumulative_stats: Dict = None) -> str:
         """
@@ -1768,14 +2551,11 @@ class EventGenerator:
         total_ground = 0
         total_naval = 0
         total_flight_time_seconds = 0
-        aircraft_usage = {}
-        target_counts = {'air': {}, 'ground': {}, 'naval': {}}
+        aircraft_missions = Counter()  # aircraft -> missions flown
+        aircraft_kills = Counter()  # aircraft -> kills scored
+        target_counts = {'air': Counter(), 'ground': Counter(), 'naval': Counter()}
         mission_count = len(debriefings)
-        safe_landings = 0
-        hard_landings = 0
-        wounded_landings = 0
-        bailouts = 0
-        kia_mia = 0
+        landing_outcomes = Counter()  # bucket from _LANDING_PRIORITY -> missions
         
         # Initialize parked kills counter
         total_air_parked = 0
@@ -1785,15 +2565,23 @@ class EventGenerator:
         if cumulative_stats:
             total_air_parked += cumulative_stats.get('static_plane_kills', 0)
         
+        # Target tallies per category, bound once for the event loops below
+        air_target_counts = target_counts['air']
+        ground_target_counts = target_counts['ground']
+        naval_target_counts = target_counts['naval']
+        
         # Analyze all missions
         for mission_id, data in debriefings.items():
             summary = data.get('summary', {})
             player = data.get('player', {})
             
-            # Combat stats (from summary)
-            total_air += summary.get('air_kills', 0)
-            total_ground += summary.get('ground_kills', 0)
-            total_naval += summary.get('naval_kills', 0)
+            # Combat stats (from summary) - read once, used for totals and aircraft
+            air_kills = summary.get('air_kills', 0)
+            ground_kills = summary.get('ground_kills', 0)
+            naval_kills = summary.get('naval_kills', 0)
+            total_air += air_kills
+            total_ground += ground_kills
+            total_naval += naval_kills
             
             # Add parked kills from this mission's debriefing
             total_air_parked += summary.get('air_kills_parked', 0)
@@ -1811,24 +2599,16 @@ class EventGenerator:
             
             # Aircraft usage (from player)
             aircraft = player.get('aircraft', 'Unknown')
-            if aircraft not in aircraft_usage:
-                aircraft_usage[aircraft] = {'missions': 0, 'kills': 0}
-            aircraft_usage[aircraft]['missions'] += 1
-            aircraft_usage[aircraft]['kills'] += summary.get('air_kills', 0) + summary.get('ground_kills', 0) + summary.get('naval_kills', 0)
+            aircraft_missions[aircraft] += 1
+            aircraft_kills[aircraft] += air_kills + ground_kills + naval_kills
             
             # Landing status (from summary)
             status = summary.get('final_state', '').lower()
             # Priority: wounded > bailout > KIA/MIA > hard/crash > safe
-            if 'wounded' in status:
-                wounded_landings += 1
-            elif 'bail' in status or 'bailed' in status:
-                bailouts += 1
-            elif 'kia' in status or 'mia' in status or 'killed' in status:
-                kia_mia += 1
-            elif 'hard' in status or 'crash' in status:
-                hard_landings += 1
-            elif 'landed' in status:
-                safe_landings += 1
+            status_keywords = _LANDING_STATUS.findall(status)
+            if status_keywords:
+                best = min(_LANDING_RANK[keyword] for keyword in status_keywords)
+                landing_outcomes[_LANDING_PRIORITY[best]] += 1
             
             # Target breakdown (from events)
             events_list = data.get('events', [])
@@ -1842,21 +2622,21 @@ class EventGenerator:
                     target_lower = target.lower()
                     
                     # Naval targets
-                    if any(naval in target_lower for naval in ['boat', 'ship', 'vessel', 'torpedo']):
+                    if _NAVAL_TARGET.search(target_lower):
                         category = 'naval'
                     # Ground targets  
-                    elif any(ground in target_lower for ground in ['aa', 'gun', 'ml-20', 'dshk', '52-k', 'flak', 'tank', 'truck', 'artillery']):
+                    elif _GROUND_TARGET.search(target_lower):
                         category = 'ground'
                     # Air targets (default)
                     else:
                         category = 'air'
                     
                     if category == 'air':
-                        target_counts['air'][target] = target_counts['air'].get(target, 0) + 1
+                        air_target_counts[target] += 1
                     elif category == 'ground':
-                        target_counts['ground'][target] = target_counts['ground'].get(target, 0) + 1
+                        ground_target_counts[target] += 1
                     elif category == 'naval':
-                        target_counts['naval'][target] = target_counts['naval'].get(target, 0) + 1
+                        naval_target_counts[target] += 1
         
         # Format flight time
         total_hours = total_flight_time_seconds // 3600
@@ -1869,10 +2649,12 @@ class EventGenerator:
         last_mission_date = None
         if campaign_name in self.mission_dates:
             mission_dates_dict = self.mission_dates[campaign_name]
-            mission_ids = sorted(debriefings.keys(), key=smart_mission_sort_key)
+            # Only the first and last mission are needed - no full sort
+            # (max over the reversed list picks the same tie as sorted()[-1])
+            mission_ids = list(debriefings.keys())
             if mission_ids:
-                first_mission_id = mission_ids[0]
-                last_mission_id = mission_ids[-1]
+                first_mission_id = min(mission_ids, key=smart_mission_sort_key)
+                last_mission_id = max(reversed(mission_ids), key=smart_mission_sort_key)
                 first_mission_date = mission_dates_dict.get(first_mission_id, {}).get('date')
                 last_mission_date = mission_dates_dict.get(last_mission_id, {}).get('date')
         
@@ -1880,10 +2662,8 @@ class EventGenerator:
         campaign_duration_days = None
         if first_mission_date and last_mission_date:
             try:
-                from datetime import datetime
-                fmt = '%Y.%m.%d'
-                start = datetime.strptime(first_mission_date.replace('.', '-'), '%Y-%m-%d')
-                end = datetime.strptime(last_mission_date.replace('.', '-'), '%Y-%m-%d')
+                start = _parse_iso_date(first_mission_date.replace('.', '-'))
+                end = _parse_iso_date(last_mission_date.replace('.', '-'))
                 campaign_duration_days = (end - start).days
             except:
                 pass
@@ -1897,148 +2677,134 @@ class EventGenerator:
         
         # Generate HTML
         html = []
-        html.append('<div style="page-break-before: always;"></div>')
-        html.append('<div style="text-align: center; margin: 40px 0 30px 0;">')
-        html.append('<div style="border-top: 3px double #333; border-bottom: 3px double #333; padding: 20px 0; margin: 0 50px;">')
-        html.append('<h1 style="margin: 0; font-size: 24pt;">CAMPAIGN SUMMARY</h1>')
-        
         campaign_display_name = self.get_campaign_display_name(campaign_name)
-        html.append(f'<p style="margin: 10px 0 0 0; font-size: 14pt; font-style: italic;">{campaign_display_name}</p>')
-        html.append('</div>')
-        html.append('</div>')
+        html.append('\n'.join((
+            '<div style="page-break-before: always;"></div>',
+            '<div style="text-align: center; margin: 40px 0 30px 0;">',
+            '<div style="border-top: 3px double #333; border-bottom: 3px double #333; padding: 20px 0; margin: 0 50px;">',
+            '<h1 style="margin: 0; font-size: 24pt;">CAMPAIGN SUMMARY</h1>',
+            f'<p style="margin: 10px 0 0 0; font-size: 14pt; font-style: italic;">{campaign_display_name}</p>',
+            '</div>',
+            '</div>',
+        )))
         
         # Combat Results
-        html.append('<h2 style="border-bottom: 2px solid #333; padding-bottom: 5px; margin-top: 30px;">COMBAT RESULTS</h2>')
-        html.append(f'<table style="width: 100%; margin: 10px 0;">')
+        html.append(f'{_SUMMARY_H2}COMBAT RESULTS</h2>\n{_SUMMARY_TABLE}')
         
         # total_air already INCLUDES parked kills (it's air_kills from summary which = flying + parked)
         # So total_air_with_parked is just total_air
         total_air_with_parked = total_air
         total_air_flying = total_air - total_air_parked
         
-        html.append(f'<tr><td style="padding: 5px 0;"><b>Air Victories:</b></td><td style="text-align: right;">{total_air_with_parked}</td></tr>')
-        
-        # Show breakdown if there are parked kills
+        # Parked breakdown rows only if there are parked kills
         if total_air_parked > 0:
-            html.append(f'<tr><td style="padding: 5px 0 5px 20px; font-size: 10pt; color: #666;">Flying:</td><td style="text-align: right; font-size: 10pt; color: #666;">{total_air_flying}</td></tr>')
-            html.append(f'<tr><td style="padding: 5px 0 5px 20px; font-size: 10pt; color: #666;">Parked:</td><td style="text-align: right; font-size: 10pt; color: #666;">{total_air_parked}</td></tr>')
-        
-        html.append(f'<tr><td style="padding: 5px 0;"><b>Ground Targets:</b></td><td style="text-align: right;">{total_ground}</td></tr>')
-        html.append(f'<tr><td style="padding: 5px 0;"><b>Naval Targets:</b></td><td style="text-align: right;">{total_naval}</td></tr>')
-        html.append(f'<tr><td colspan="2" style="border-top: 1px solid #333; padding: 5px 0;"></td></tr>')
-        html.append(f'<tr><td style="padding: 5px 0;"><b>Total Kills:</b></td><td style="text-align: right;"><b>{total_air_with_parked + total_ground + total_naval}</b></td></tr>')
-        html.append('</table>')
+            parked_rows = (
+                f'<tr><td style="padding: 5px 0 5px 20px; font-size: 10pt; color: #666;">Flying:</td><td style="text-align: right; font-size: 10pt; color: #666;">{total_air_flying}</td></tr>',
+                f'<tr><td style="padding: 5px 0 5px 20px; font-size: 10pt; color: #666;">Parked:</td><td style="text-align: right; font-size: 10pt; color: #666;">{total_air_parked}</td></tr>',
+            )
+        else:
+            parked_rows = ()
+        
+        # Whole table as one block (same lines as appending row by row)
+        html.append('\n'.join((
+            _summary_row(('Air Victories', total_air_with_parked)),
+            *parked_rows,
+            _summary_row(('Ground Targets', total_ground)),
+            _summary_row(('Naval Targets', total_naval)),
+            '<tr><td colspan="2" style="border-top: 1px solid #333; padding: 5px 0;"></td></tr>',
+            _summary_row(('Total Kills', f'<b>{total_air_with_parked + total_ground + total_naval}</b>')),
+            '</table>',
+        )))
         
         # Missions Flown
-        html.append('<h2 style="border-bottom: 2px solid #333; padding-bottom: 5px; margin-top: 30px;">MISSIONS FLOWN</h2>')
-        html.append(f'<table style="width: 100%; margin: 10px 0;">')
-        html.append(f'<tr><td style="padding: 5px 0;"><b>Completed:</b></td><td style="text-align: right;">{mission_count} missions</td></tr>')
-        html.append(f'<tr><td style="padding: 5px 0;"><b>Total Flight Time:</b></td><td style="text-align: right;">{total_hours}h {total_minutes}m</td></tr>')
-        html.append(f'<tr><td style="padding: 5px 0;"><b>Average Duration:</b></td><td style="text-align: right;">{avg_minutes}m</td></tr>')
-        html.append(f'<tr><td colspan="2" style="padding: 10px 0 5px 0;"></td></tr>')
-        
-        total_outcomes = safe_landings + hard_landings + wounded_landings + bailouts + kia_mia
+        html.append(_SUMMARY_MISSIONS_BLOCK.format(
+            mission_count=mission_count, total_hours=total_hours,
+            total_minutes=total_minutes, avg_minutes=avg_minutes))
+        
+        total_outcomes = sum(landing_outcomes.values())
         if total_outcomes > 0:
-            safe_pct = int(safe_landings / total_outcomes * 100)
-            html.append(f'<tr><td style="padding: 5px 0;"><b>Safe Landings:</b></td><td style="text-align: right;">{safe_landings} ({safe_pct}%)</td></tr>')
-            
-            if hard_landings > 0:
-                hard_pct = int(hard_landings / total_outcomes * 100)
-                html.append(f'<tr><td style="padding: 5px 0;"><b>Hard Landings / Crashes:</b></td><td style="text-align: right;">{hard_landings} ({hard_pct}%)</td></tr>')
-            
-            if wounded_landings > 0:
-                wounded_pct = int(wounded_landings / total_outcomes * 100)
-                html.append(f'<tr><td style="padding: 5px 0;"><b>Wounded Landings:</b></td><td style="text-align: right;">{wounded_landings} ({wounded_pct}%)</td></tr>')
-            
-            if bailouts > 0:
-                bailout_pct = int(bailouts / total_outcomes * 100)
-                html.append(f'<tr><td style="padding: 5px 0;"><b>Bailouts:</b></td><td style="text-align: right;">{bailouts} ({bailout_pct}%)</td></tr>')
-            
-            if kia_mia > 0:
-                kia_pct = int(kia_mia / total_outcomes * 100)
-                html.append(f'<tr><td style="padding: 5px 0;"><b>KIA / MIA:</b></td><td style="text-align: right;">{kia_mia} ({kia_pct}%)</td></tr>')
+            # Safe landings always listed (first, starting the outcomes
+            # group), the other outcomes only if they happened
+            for bucket, label in _SUMMARY_OUTCOME_ROWS:
+                outcome_count = landing_outcomes[bucket]
+                if outcome_count > 0 or bucket == 'safe':
+                    outcome_pct = outcome_count * 100 // total_outcomes
+                    row = _summary_sep_row if bucket == 'safe' else _summary_row
+                    html.append(row((label, f'{outcome_count} ({outcome_pct}%)')))
         
         html.append('</table>')
         
         # Aircraft Flown
-        if aircraft_usage:
-            html.append('<h2 style="border-bottom: 2px solid #333; padding-bottom: 5px; margin-top: 30px;">AIRCRAFT FLOWN</h2>')
-            html.append(f'<table style="width: 100%; margin: 10px 0;">')
-            for aircraft, stats in sorted(aircraft_usage.items(), key=lambda x: x[1]['missions'], reverse=True):
-                html.append(f'<tr><td style="padding: 5px 0;"><b>{aircraft}:</b></td><td style="text-align: right;">{stats["missions"]} missions ({stats["kills"]} kills)</td></tr>')
-            html.append('</table>')
+        if aircraft_missions:
+            # Whole section as one block (same lines as appending row by row)
+            html.append('\n'.join((
+                f'{_SUMMARY_H2}AIRCRAFT FLOWN</h2>',
+                _SUMMARY_TABLE,
+                *(_summary_row((aircraft, f'{missions_flown} missions ({aircraft_kills[aircraft]} kills)'))
+                  for aircraft, missions_flown in aircraft_missions.most_common()),
+                '</table>',
+            )))
         
         # Career Progression
-        html.append('<h2 style="border-bottom: 2px solid #333; padding-bottom: 5px; margin-top: 30px;">CAREER PROGRESSION</h2>')
-        html.append(f'<table style="width: 100%; margin: 10px 0;">')
-        html.append(f'<tr><td style="padding: 5px 0;"><b>Starting Rank:</b></td><td style="text-align: right;">{starting_rank}</td></tr>')
-        html.append(f'<tr><td style="padding: 5px 0;"><b>Final Rank:</b></td><td style="text-align: right;">{final_rank}</td></tr>')
-        html.append(f'<tr><td style="padding: 5px 0;"><b>Promotions:</b></td><td style="text-align: right;">{len(promotions)}</td></tr>')
-        html.append(f'<tr><td colspan="2" style="padding: 10px 0 5px 0;"></td></tr>')
-        html.append(f'<tr><td style="padding: 5px 0;"><b>Awards Received:</b></td><td style="text-align: right;">{len(awards)}</td></tr>')
-        html.append('</table>')
+        html.append(_SUMMARY_CAREER_BLOCK.format(
+            starting_rank=starting_rank, final_rank=final_rank,
+            promotion_count=len(promotions), award_count=len(awards)))
         
         if awards:
-            html.append('<ul style="margin: 5px 0; padding-left: 20px;">')
-            for award in awards:
-                html.append(f'<li>{award["name"]}</li>')
-            html.append('</ul>')
+            html.append('\n'.join((
+                '<ul style="margin: 5px 0; padding-left: 20px;">',
+                *(f'<li>{award["name"]}</li>' for award in awards),
+                '</ul>',
+            )))
         
         # Top Targets
-        html.append('<h2 style="border-bottom: 2px solid #333; padding-bottom: 5px; margin-top: 30px;">TOP TARGETS DESTROYED</h2>')
-        
-        # Air targets
-        if target_counts['air']:
-            html.append('<p style="margin: 10px 0 5px 0;"><b>Air Targets:</b></p>')
-            html.append('<ol style="margin: 0; padding-left: 25px;">')
-            for target, count in sorted(target_counts['air'].items(), key=lambda x: x[1], reverse=True)[:5]:
-                html.append(f'<li>{target} (× {count})</li>')
-            html.append('</ol>')
-        
-        # Ground targets
-        if target_counts['ground']:
-            html.append('<p style="margin: 15px 0 5px 0;"><b>Ground Targets:</b></p>')
-            html.append('<ol style="margin: 0; padding-left: 25px;">')
-            for target, count in sorted(target_counts['ground'].items(), key=lambda x: x[1], reverse=True)[:5]:
-                html.append(f'<li>{target} (× {count})</li>')
-            html.append('</ol>')
-        
-        # Naval targets
-        if target_counts['naval']:
-            html.append('<p style="margin: 15px 0 5px 0;"><b>Naval Targets:</b></p>')
-            html.append('<ol style="margin: 0; padding-left: 25px;">')
-            for target, count in sorted(target_counts['naval'].items(), key=lambda x: x[1], reverse=True)[:5]:
-                html.append(f'<li>{target} (× {count})</li>')
-            html.append('</ol>')
+        html.append(f'{_SUMMARY_H2}TOP TARGETS DESTROYED</h2>')
+        
+        # Air, ground and naval targets - top 5 of each
+        # (most_common(5) is a heapq.nlargest selection - same order as a
+        # stable sort + [:5], without sorting every target type)
+        for category, heading in _SUMMARY_TARGET_SECTIONS:
+            if target_counts[category]:
+                html.append('\n'.join((
+                    heading,
+                    '<ol style="margin: 0; padding-left: 25px;">',
+                    *(f'<li>{target} (× {count})</li>'
+                      for target, count in target_counts[category].most_common(5)),
+                    '</ol>',
+                )))
         
         # Campaign Timeline
         if first_mission_date and last_mission_date:
-            html.append('<h2 style="border-bottom: 2px solid #333; padding-bottom: 5px; margin-top: 30px;">CAMPAIGN TIMELINE</h2>')
-            html.append(f'<table style="width: 100%; margin: 10px 0;">')
+            html.append(f'{_SUMMARY_H2}CAMPAIGN TIMELINE</h2>')
+            html.append(_SUMMARY_TABLE)
             
             # Format dates nicely
             start_date_formatted = self.format_date(first_mission_date)
             end_date_formatted = self.format_date(last_mission_date)
             
-            html.append(f'<tr><td style="padding: 5px 0;"><b>Start Date:</b></td><td style="text-align: right;">{start_date_formatted}</td></tr>')
-            html.append(f'<tr><td style="padding: 5px 0;"><b>End Date:</b></td><td style="text-align: right;">{end_date_formatted}</td></tr>')
+            html.append(_summary_row(('Start Date', start_date_formatted)))
+            html.append(_summary_row(('End Date', end_date_formatted)))
             if campaign_duration_days is not None:
-                html.append(f'<tr><td style="padding: 5px 0;"><b>Campaign Duration:</b></td><td style="text-align: right;">{campaign_duration_days} days</td></tr>')
+                html.append(_summary_row(('Campaign Duration', f'{campaign_duration_days} days')))
             html.append('</table>')
         
         return '\n'.join(html)
     
-    def export_campaign_to_pdf(self, campaign_name: str, html_content: str) -> bool:
+    def _load_pdfkit(self) -> bool:
         """
-        Export campaign report as PDF
+        Import pdfkit and locate wkhtmltopdf - once per run
+        
+        pdfkit.configuration() searches for the wkhtmltopdf executable, so
+        the result (or the reason it is unavailable) is kept for all
+        campaigns. The "skipped" message is printed only the first time.
         
-        Args:
-            campaign_name: Campaign folder name
-            html_content: Complete HTML content to export
-            
         Returns:
-            True if successful, False otherwise
+            True if PDF export is possible
         """
+        if self._pdfkit_loaded:
+            return self._pdfkit is not None
+        self._pdfkit_loaded = True
+        
         try:
             import pdfkit
         except ImportError:
@@ -2070,6 +2836,26 @@ class EventGenerator:
             print(f"      Download from: https://wkhtmltopdf.org/downloads.html")
             return False
         
+        self._pdfkit = pdfkit
+        self._pdfkit_config = config
+        return True
+    
+    def export_campaign_to_pdf(self, campaign_name: str, html_content: str) -> bool:
+        """
+        Export campaign report as PDF
+        
+        Args:
+            campaign_name: Campaign folder name
+            html_content: Complete HTML content to export
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._load_pdfkit():
+            return False
+        pdfkit = self._pdfkit
+        config = self._pdfkit_config
+        
         # Create reports directory if it doesn't exist
         reports_dir = Path('reports')
         reports_dir.mkdir(exist_ok=True)
@@ -2078,58 +2864,33 @@ class EventGenerator:
         campaign_display_name = self.get_campaign_display_name(campaign_name)
         
         # Clean campaign name for filename (remove special chars)
-        safe_name = re.sub(r'[^\w\s-]', '', campaign_name).strip().replace(' ', '_')
+        safe_name = _strip_unsafe_filename_chars(campaign_name).strip().replace(' ', '_')
         pdf_filename = reports_dir / f"{safe_name}_Report.pdf"
         
         try:
-            # Create complete HTML document
-            full_html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>{campaign_display_name} - Campaign Report</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            font-size: 10pt;
-        }}
-        h1 {{
-            text-align: center;
-            border-bottom: 2px solid #333;
-            padding-bottom: 10px;
-        }}
-        .mission-box {{
-            page-break-inside: avoid;
-            margin-bottom: 10px;
-        }}
-    </style>
-</head>
-<body>
-    <h1>{campaign_display_name}</h1>
-    <p><i>Campaign Report - Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</i></p>
-    <hr>
-    {html_content}
-</body>
-</html>
-"""
-            
-            # PDF options
-            options = {
-                'page-size': 'A4',
-                'margin-top': '15mm',
-                'margin-right': '15mm',
-                'margin-bottom': '15mm',
-                'margin-left': '15mm',
-                'encoding': 'UTF-8',
-                'no-outline': None,
-                'enable-local-file-access': None,
-                'quiet': ''  # Suppress wkhtmltopdf warnings
-            }
-            
-            # Convert HTML to PDF
-            pdfkit.from_string(full_html, str(pdf_filename), options=options, configuration=config)
+            # Write the complete HTML document as UTF-8 bytes - only the title,
+            # heading, timestamp and report body are encoded per campaign, and
+            # from_file hands the file straight to wkhtmltopdf (from_string
+            # would encode the whole document again)
+            generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            html_file = tempfile.NamedTemporaryFile(suffix='.html', delete=False)
+            try:
+                with html_file:
+                    html_file.write(_PDF_DOCUMENT_START_BYTES)
+                    html_file.write(f"    <title>{campaign_display_name} - Campaign Report</title>\n".encode('utf-8'))
+                    html_file.write(_PDF_DOCUMENT_STYLE_BYTES)
+                    html_file.write(
+                        f"    <h1>{campaign_display_name}</h1>\n"
+                        f"    <p><i>Campaign Report - Generated: {generated}</i></p>\n"
+                        f"    <hr>\n"
+                        f"    {html_content}".encode('utf-8')
+                    )
+                    html_file.write(_PDF_DOCUMENT_END_BYTES)
+                
+                # Convert HTML to PDF
+                pdfkit.from_file(html_file.name, str(pdf_filename), options=dict(_PDF_OPTIONS), configuration=config)
+            finally:
+                os.unlink(html_file.name)
             
             print(f"  ✓ PDF exported: {pdf_filename}")
             return True
@@ -2138,6 +2899,92 @@ class EventGenerator:
             print(f"  ⚠️  PDF export failed: {e}")
             return False
     
+    def _process_campaign(self, campaign_name: str, campaign_entry, events: List[Dict]) -> tuple:
+        """
+        Build and write everything for one campaign with events: Events and
+        Debriefings HTML, the info file update and the PDF report
+        
+        Args:
+            campaign_name: Campaign folder name
+            campaign_entry: (name, mission dates data) from mission_dates_lower, or None
+            events: Events from generate_events_for_campaign (not empty)
+            
+        Returns:
+            Tuple of (result dict for campaign_events.json, info file updated)
+        """
+        # Get country (case-insensitive)
+        if campaign_entry is not None:
+            _, mission_data = campaign_entry
+            country = mission_data.get('country')
+        else:
+            country = None
+        
+        # Generate Events HTML
+        events_html = self.generate_events_html(events, country)
+        
+        # This campaign's save data - looked up once for both the completed
+        # missions and the PDF's cumulative stats
+        campaign_save = self.save_data[campaign_name]
+        
+        # Generate Debriefings HTML (if available)
+        completed_missions = list(campaign_save.get('completedMissionsByFileName', {}))
+        debriefings_html = ""
+        debriefings = {}
+        
+        if self.log_processor and completed_missions:
+            print(f"  Generating debriefings for {len(completed_missions)} mission(s)...")
+            debriefings_html, debriefings = self.generate_debriefings_html(campaign_name, completed_missions)
+        
+        # Combine: Debriefings BEFORE Events
+        if debriefings_html:
+            combined_html = debriefings_html + "\n" + events_html
+        else:
+            combined_html = events_html
+        
+        result = {
+            'country': country,
+            'events': events,
+            'debriefings_html': debriefings_html,
+            'events_html': events_html,
+            'html': combined_html
+        }
+        
+        # Update the campaign info file
+        info_updated = self.update_campaign_info_file(campaign_name, combined_html)
+        
+        # Export to PDF (only if campaign has completed missions)
+        if completed_missions and not self.dry_run:
+            # Calculate cumulative stats from campaigns_decoded.json
+            # (already loaded as self.save_data in __init__ - no
+            # re-read and re-parse of the whole file per campaign)
+            cumulative_stats = None
+            stats = campaign_save.get('characterStatisticsByFileName', {})
+            # Get the latest mission stats (highest mission number)
+            if stats:
+                latest_mission = _latest_mission_key(stats)
+                cumulative_stats = stats.get(latest_mission, {})
+            
+            # Generate PDF-specific HTML with base64-embedded images
+            events_html_pdf = self.generate_events_html(events, country, for_pdf=True)
+            
+            # Combine debriefings + events
+            pdf_sections = [debriefings_html] if debriefings_html else []
+            pdf_sections.append(events_html_pdf)
+            
+            # Generate campaign summary (PDF only!)
+            # Use the debriefings we already loaded earlier
+            summary_html = self.generate_campaign_summary_html(campaign_name, events, debriefings, country, cumulative_stats)
+            
+            # Add summary at the end
+            if summary_html:
+                pdf_sections.append(summary_html)
+            
+            # One join for the whole PDF body - no intermediate
+            # debriefings + events copy that the summary is added to
+            self.export_campaign_to_pdf(campaign_name, "\n".join(pdf_sections))
+        
+        return result, info_updated
+    
     def process_all_campaigns(self):
         """Process all campaigns and generate events"""
         print("="*70)
@@ -2147,93 +2994,50 @@ class EventGenerator:
         results = {}
         files_updated = 0
         
-        for campaign_name in self.save_data.keys():
-            # Skip if excluded (WW1) - case-insensitive lookup
-            campaign_name_lower = campaign_name.lower()
-            if campaign_name_lower in self.mission_dates_lower:
-                _, mission_data = self.mission_dates_lower[campaign_name_lower]
-                if mission_data.get('excluded'):
-                    print(f"\nSkipping {campaign_name} (excluded: WW1)")
-                    continue
-            
-            events = self.generate_events_for_campaign(campaign_name)
-            
-            if events:
-                # Get country (case-insensitive)
-                if campaign_name_lower in self.mission_dates_lower:
-                    _, mission_data = self.mission_dates_lower[campaign_name_lower]
-                    country = mission_data.get('country')
-                else:
-                    country = None
-                
-                # Generate Events HTML
-                events_html = self.generate_events_html(events, country)
-                
-                # Generate Debriefings HTML (if available)
-                completed_missions = list(self.save_data[campaign_name].get('completedMissionsByFileName', {}).keys())
-                debriefings_html = ""
-                debriefings = {}
-                
-                if self.log_processor and completed_missions:
-                    print(f"  Generating debriefings for {len(completed_missions)} mission(s)...")
-                    debriefings_html, debriefings = self.generate_debriefings_html(campaign_name, completed_missions)
-                
-                # Combine: Debriefings BEFORE Events
-                if debriefings_html:
-                    combined_html = debriefings_html + "\n" + events_html
-                else:
-                    combined_html = events_html
-                
-                results[campaign_name] = {
-                    'country': country,
-                    'events': events,
-                    'debriefings_html': debriefings_html,
-                    'events_html': events_html,
-                    'html': combined_html
-                }
-                
-                # Update the campaign info file
-                if self.update_campaign_info_file(campaign_name, combined_html):
-                    files_updated += 1
+        # Save results as each campaign completes - the same indent=2 JSON
+        # as dumping the whole dict at the end, but only one campaign's
+        # entry (with all its HTML) is serialized in memory at a time.
+        # Written to a temp file so a failed run leaves the old file intact.
+        results_file = Path('campaign_events.json')
+        results_tmp = results_file.with_name(results_file.name + '.tmp')
+        try:
+            with open(results_tmp, 'wb') as results_out:
+                results_out.write(b'{')
                 
-                # Export to PDF (only if campaign has completed missions)
-                if completed_missions and not self.dry_run:
-                    # Calculate cumulative stats from campaigns_decoded.json
-                    cumulative_stats = None
-                    try:
-                        with open('campaigns_decoded.json', 'r', encoding='utf-8') as f:
-                            decoded_data = json.load(f)
-                            if campaign_name in decoded_data:
-                                stats = decoded_data[campaign_name].get('characterStatisticsByFileName', {})
-                                # Get the latest mission stats (highest mission number)
-                                if stats:
-                                    latest_mission = max(stats.keys(), key=lambda x: int(x) if x.isdigit() else 0)
-                                    cumulative_stats = stats.get(latest_mission, {})
-                    except (FileNotFoundError, json.JSONDecodeError, KeyError):
-                        cumulative_stats = None
-                    
-                    # Generate PDF-specific HTML with base64-embedded images
-                    events_html_pdf = self.generate_events_html(events, country, for_pdf=True)
-                    
-                    # Combine debriefings + events
-                    if debriefings_html:
-                        combined_html_pdf = debriefings_html + "\n" + events_html_pdf
-                    else:
-                        combined_html_pdf = events_html_pdf
-                    
-                    # Generate campaign summary (PDF only!)
-                    # Use the debriefings we already loaded earlier
-                    summary_html = self.generate_campaign_summary_html(campaign_name, events, debriefings, country, cumulative_stats)
+                for campaign_name in self.save_data.keys():
+                    # Skip if excluded (WW1) - case-insensitive lookup
+                    # One case-insensitive lookup, reused for the country below
+                    campaign_entry = self.mission_dates_lower.get(campaign_name.lower())
+                    if campaign_entry is not None:
+                        _, mission_data = campaign_entry
+                        if mission_data.get('excluded'):
+                            print(f"\nSkipping {campaign_name} (excluded: WW1)")
+                            continue
                     
-                    # Add summary at the end
-                    if summary_html:
-                        combined_html_pdf += "\n" + summary_html
+                    events = self.generate_events_for_campaign(campaign_name)
                     
-                    self.export_campaign_to_pdf(campaign_name, combined_html_pdf)
-        
-        # Save results
-        with open('campaign_events.json', 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+                    if events:
+                        result, info_updated = self._process_campaign(campaign_name, campaign_entry, events)
+                        if info_updated:
+                            files_updated += 1
+                        
+                        # Entry nested one level in: re-indent its lines by two
+                        # (JSON strings never contain a raw newline)
+                        results_out.write(b',\n  ' if results else b'\n  ')
+                        results_out.write(_indented_json(campaign_name))
+                        results_out.write(b': ')
+                        results_out.write(_indented_json(result).replace(b'\n', b'\n  '))
+                        results[campaign_name] = result
+                
+                results_out.write(b'\n}' if results else b'}')
+            os.replace(results_tmp, results_file)
+        except BaseException:
+            # Don't leave a half-written temp file behind (then re-raise)
+            try:
+                results_tmp.unlink()
+            except OSError:
+                pass
+            raise
         
         print(f"\n{'='*70}")
         print(f"COMPLETE!")
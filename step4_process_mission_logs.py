@@ -16,11 +16,104 @@ Usage:
 
 import re
 import json
+import mmap
+import os
+import subprocess
 import sys
+import urllib.parse
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Optional, Set, Tuple
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson is optional - it parses the .events.json files much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Timestamp in .mlg file names, e.g. missionReport(2025-12-22_15-47-53).mlg
+_MLG_TIMESTAMP = re.compile(r'(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})')
+_MLG_NAME_START = 'missionReport('
+
+# Characters urllib.parse.quote leaves as they are (with its default safe='/')
+_URL_SAFE_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~/')
+
+
+@lru_cache(maxsize=1024)
+def _mlg_name_timestamp(filename: str) -> Optional[str]:
+    """
+    Timestamp in an .mlg file name (MissionLogProcessor._extract_timestamp)
+    
+    Cached - the same names come up for every campaign scan and again for
+    the chosen file's debriefing metadata.
+    """
+    # Usual name: the timestamp can only start right after the (digit-free)
+    # "missionReport(" - match it there instead of searching the name
+    if filename.startswith(_MLG_NAME_START):
+        match = _MLG_TIMESTAMP.match(filename, len(_MLG_NAME_START))
+        if match:
+            return match.group(1)
+    
+    match = _MLG_TIMESTAMP.search(filename)
+    return match.group(1) if match else None
+
+
+# mmap access hint for the .mlg scan - only where madvise exists (not Windows)
+_MADV_SEQUENTIAL = getattr(mmap, 'MADV_SEQUENTIAL', None)
+
+
+def _referenced_missions(content, prefix: bytes, suffixes_by_mission: Dict[str, Tuple[bytes, ...]]) -> Set[str]:
+    """
+    Missions whose file name follows prefix somewhere in content (bytes or mmap)
+    
+    One pass over content for all missions: each occurrence of the shared
+    prefix is found with find, and the bytes after it are looked up in one
+    dict of all missions' file names - one lookup per distinct name length
+    (usually one or two) instead of a check per mission. Stops once every
+    mission has been found.
+    """
+    missions_by_name = {}
+    for mission_id, suffixes in suffixes_by_mission.items():
+        for suffix in suffixes:
+            missions_by_name.setdefault(suffix, []).append(mission_id)
+    lengths = sorted({len(suffix) for suffix in missions_by_name})
+    longest = lengths[-1] if lengths else 0
+    
+    found = set()
+    start = content.find(prefix)
+    while start != -1:
+        after = start + len(prefix)
+        following = content[after:after + longest]
+        for length in lengths:
+            missions = missions_by_name.get(following[:length])
+            if missions:
+                found.update(missions)
+        if len(found) == len(suffixes_by_mission):
+            break
+        start = content.find(prefix, start + 1)
+    return found
+
+
+def _file_referenced_missions(path: Path, prefix: bytes, suffixes_by_mission: Dict[str, Tuple[bytes, ...]]) -> Set[str]:
+    """
+    _referenced_missions over a memory-mapped file
+    
+    The search runs on the mapped page cache directly instead of on a copy
+    read into a bytes object.
+    """
+    with open(path, 'rb') as f:
+        # mmap can't map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return set()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            # Let the kernel read ahead in large batches (not on Windows)
+            if _MADV_SEQUENTIAL is not None:
+                content.madvise(_MADV_SEQUENTIAL)
+            return _referenced_missions(content, prefix, suffixes_by_mission)
 
 
 class MissionLogProcessor:
@@ -39,6 +132,10 @@ class MissionLogProcessor:
         # Working directory for temporary files
         self.work_dir = Path.cwd()
         
+        # Parsed .events.json files: path -> (mtime_ns, data), so repeated
+        # calls for the same campaign don't parse unchanged files again
+        self._debrief_cache = {}
+        
         # Import required modules
         self._import_modules()
         
@@ -89,10 +186,16 @@ class MissionLogProcessor:
         
         debriefings = {}
         
+        # Scan the .mlg files once for all missions instead of once per mission
+        mlg_index = self._build_mlg_index(campaign_name, completed_missions)
+        
+        # Convert all outdated .mlg files in one mlg2txt run up front
+        self._mlg_to_txt_batch(self._newest_mlg_files(mlg_index, completed_missions))
+        
         for mission_id in completed_missions:
             try:
                 print(f"  Looking for debriefing: {campaign_name}/{mission_id}")
-                debriefing = self.get_mission_debriefing(campaign_name, mission_id)
+                debriefing = self.get_mission_debriefing(campaign_name, mission_id, mlg_index)
                 if debriefing:
                     debriefings[mission_id] = debriefing
                     print(f"    ✓ Debriefing loaded for Mission {mission_id}")
@@ -107,19 +210,20 @@ class MissionLogProcessor:
         
         return debriefings
     
-    def get_mission_debriefing(self, campaign_name: str, mission_id: str) -> Optional[Dict]:
+    def get_mission_debriefing(self, campaign_name: str, mission_id: str, mlg_index: Optional[List] = None) -> Optional[Dict]:
         """
         Get debriefing data for a single mission
         
         Args:
             campaign_name: Campaign name (e.g., "kerch")
             mission_id: Mission ID (e.g., "08" or "1943-07-04a-FW190-A5U17-IISG1")
+            mlg_index: Result of _build_mlg_index for the campaign (scanned here if None)
         
         Returns:
             Debriefing data dict or None if not found/failed
         """
         # Find newest .mlg file for this mission
-        mlg_file = self._find_newest_mlg(campaign_name, mission_id)
+        mlg_file = self._find_newest_mlg(campaign_name, mission_id, mlg_index)
         
         if not mlg_file:
             if self.verbose:
@@ -145,11 +249,20 @@ class MissionLogProcessor:
                     print(f"  Failed to parse .txt to .json")
                 return None
             
-            # Step 3: Load and return JSON data
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Step 3: Load and return JSON data (parsed again only if changed)
+            json_mtime = json_file.stat().st_mtime_ns
+            cached = self._debrief_cache.get(str(json_file))
+            if cached and cached[0] == json_mtime:
+                parsed = cached[1]
+            else:
+                # Both parsers take the raw bytes (json.loads detects UTF-8),
+                # so the file is read in one call without a text decoder
+                raw = json_file.read_bytes()
+                parsed = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                self._debrief_cache[str(json_file)] = (json_mtime, parsed)
             
-            # Add metadata
+            # Add metadata (to a copy - the cached dict is shared between calls)
+            data = dict(parsed)
             timestamp = self._extract_timestamp(mlg_file.name)
             data['timestamp'] = timestamp
             data['mission_id'] = mission_id
@@ -166,7 +279,7 @@ class MissionLogProcessor:
                 traceback.print_exc()
             return None
     
-    def _find_newest_mlg(self, campaign_name: str, mission_id: str) -> Optional[Path]:
+    def _find_newest_mlg(self, campaign_name: str, mission_id: str, mlg_index: Optional[List] = None) -> Optional[Path]:
         """
         Find newest .mlg file for a specific mission
         
@@ -176,61 +289,131 @@ class MissionLogProcessor:
         Args:
             campaign_name: Campaign name (lowercase)
             mission_id: Mission ID (e.g., "08" or "1940-11-27a-BoB I JG51-BF109F1-fighter-sweep")
+            mlg_index: Result of _build_mlg_index for the campaign (scanned here if None)
         
         Returns:
             Path to newest .mlg file or None
         """
-        import urllib.parse
+        if mlg_index is None:
+            mlg_index = self._build_mlg_index(campaign_name, [mission_id])
         
-        # Pattern to search for in .mlg files
-        # Handle both .msnbin and .cmpbin
-        # Also handle URL-encoded variants (spaces as %20, etc.)
-        patterns = []
+        # The index is newest first, so the first file with our mission is
+        # the newest one
+        for mlg_file, timestamp, missions in mlg_index:
+            if isinstance(missions, Exception):
+                if self.verbose:
+                    print(f"    Error reading {mlg_file.name}: {missions}")
+                continue
+            
+            # Check if this .mlg contains our mission
+            if mission_id in missions:
+                if self.verbose:
+                    print(f"    Found: {mlg_file.name} ({timestamp})")
+                return mlg_file
         
-        # Normal version (decoded)
-        patterns.append(f"campaigns/{campaign_name}/{mission_id}.msnbin".encode('utf-8'))
-        patterns.append(f"campaigns/{campaign_name}/{mission_id}.cmpbin".encode('utf-8'))
+        return None
+    
+    def _newest_mlg_files(self, mlg_index: List, mission_ids: List[str]) -> List[Path]:
+        """
+        Newest .mlg file of each mission in mlg_index - the files
+        _find_newest_mlg will pick, without its logging
+        """
+        newest_files = []
+        for mission_id in mission_ids:
+            for mlg_file, timestamp, missions in mlg_index:
+                if not isinstance(missions, Exception) and mission_id in missions:
+                    newest_files.append(mlg_file)
+                    break
+        return newest_files
+    
+    def _build_mlg_index(self, campaign_name: str, mission_ids: List[str]) -> List[Tuple[Path, str, object]]:
+        """
+        Find the newest .mlg file referencing each of a campaign's missions
         
-        # URL-encoded version (if mission_id contains spaces or special chars)
-        mission_id_encoded = urllib.parse.quote(mission_id)
-        if mission_id_encoded != mission_id:
-            patterns.append(f"campaigns/{campaign_name}/{mission_id_encoded}.msnbin".encode('utf-8'))
-            patterns.append(f"campaigns/{campaign_name}/{mission_id_encoded}.cmpbin".encode('utf-8'))
+        Files are searched newest first (by the timestamp in their name) for
+        "campaigns/<campaign>/<mission>.msnbin" (or .cmpbin, also URL-encoded),
+        each file for all missions not found yet in one pass. Scanning stops
+        once every mission has been found, so older files are usually never
+        read. Files without a timestamp in their name are never picked and
+        not read.
         
-        matching_files = []
+        Args:
+            campaign_name: Campaign name (lowercase)
+            mission_ids: Mission IDs to look for
         
-        # Scan all .mlg files
-        for mlg_file in self.flight_logs_dir.glob("*.mlg"):
-            try:
-                # Read file and search for campaign mission pattern
-                with open(mlg_file, 'rb') as f:
-                    content = f.read()
+        Returns:
+            List of (mlg_file, timestamp, set of mission IDs first found in it)
+            for the scanned files, newest first (equal timestamps in directory
+            order) - with the exception instead of the set for files that
+            could not be read
+        """
+        prefix = f"campaigns/{campaign_name}/".encode('utf-8')
+        remaining = {mission_id: self._mission_file_names(mission_id) for mission_id in mission_ids}
+        
+        # os.scandir directly gives the same names and order as glob("*.mlg")
+        # without glob's per-entry pattern matching; like glob, a missing
+        # folder just means no files
+        try:
+            with os.scandir(self.flight_logs_dir) as entries:
+                mlg_files = [Path(entry.path) for entry in entries if os.path.normcase(entry.name).endswith('.mlg')]
+        except OSError:
+            mlg_files = []
+        
+        candidates = []
+        for mlg_file in mlg_files:
+            timestamp = self._extract_timestamp(mlg_file.name)
+            if timestamp:
+                candidates.append((mlg_file, timestamp))
+        candidates.sort(key=itemgetter(1), reverse=True)
+        
+        mlg_index = []
+        if not candidates or not remaining:
+            return mlg_index
+        
+        # Scan in a thread pool, one file per worker at a time, so reading one
+        # file overlaps with searching others; results are taken in order
+        workers = min(len(candidates), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for start in range(0, len(candidates), workers):
+                batch = candidates[start:start + workers]
+                scans = [executor.submit(_file_referenced_missions, mlg_file, prefix, dict(remaining))
+                         for mlg_file, timestamp in batch]
                 
-                # Check if this .mlg contains our mission
-                if any(pattern in content for pattern in patterns):
-                    # Extract timestamp from filename
-                    timestamp = self._extract_timestamp(mlg_file.name)
-                    if timestamp:
-                        matching_files.append((mlg_file, timestamp))
-                        if self.verbose:
-                            print(f"    Found: {mlg_file.name} ({timestamp})")
-            
-            except Exception as e:
-                if self.verbose:
-                    print(f"    Error reading {mlg_file.name}: {e}")
-                continue
+                for (mlg_file, timestamp), scan in zip(batch, scans):
+                    try:
+                        missions = scan.result() & remaining.keys()
+                    except Exception as e:
+                        mlg_index.append((mlg_file, timestamp, e))
+                        continue
+                    mlg_index.append((mlg_file, timestamp, missions))
+                    for mission_id in missions:
+                        del remaining[mission_id]
+                
+                if not remaining:
+                    break
         
-        if not matching_files:
-            return None
+        return mlg_index
+    
+    def _mission_file_names(self, mission_id: str) -> Tuple[bytes, ...]:
+        """
+        Names a mission's file can have after "campaigns/<campaign>/" in a .mlg
         
-        # Return newest (sort by timestamp, descending)
-        matching_files.sort(key=lambda x: x[1], reverse=True)
-        newest = matching_files[0][0]
+        Handles both .msnbin and .cmpbin, and URL-encoded variants (spaces as
+        %20, etc.)
+        """
+        # Normal version (decoded)
+        names = [f"{mission_id}.msnbin".encode('utf-8'), f"{mission_id}.cmpbin".encode('utf-8')]
         
-        if self.verbose and len(matching_files) > 1:
-            print(f"    Multiple versions found, using newest: {newest.name}")
+        # URL-encoded version (if mission_id contains spaces or special chars -
+        # IDs like "08" only have characters quote keeps, so skip it for them)
+        if _URL_SAFE_CHARS.issuperset(mission_id):
+            return tuple(names)
+        mission_id_encoded = urllib.parse.quote(mission_id)
+        if mission_id_encoded != mission_id:
+            names.append(f"{mission_id_encoded}.msnbin".encode('utf-8'))
+            names.append(f"{mission_id_encoded}.cmpbin".encode('utf-8'))
         
-        return newest
+        return tuple(names)
     
     def _extract_timestamp(self, filename: str) -> Optional[str]:
         """
@@ -241,8 +424,71 @@ class MissionLogProcessor:
         Returns:
             Timestamp string or None if pattern doesn't match
         """
-        match = re.search(r'(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})', filename)
-        return match.group(1) if match else None
+        return _mlg_name_timestamp(filename)
+    
+    def _mlg_to_txt_batch(self, mlg_files: List[Path]):
+        """
+        Convert several .mlg files to .txt with a single mlg2txt run
+        
+        Only files without an up-to-date [0].txt are converted, and only when
+        there are at least two (one is left to _mlg_to_txt). This saves the
+        process start per mission. If the single run fails (e.g. an mlg2txt
+        that takes one input), the files are converted by one mlg2txt process
+        each, running side by side on the available cores. Anything still not
+        converted is retried one by one by _mlg_to_txt.
+        
+        Args:
+            mlg_files: Paths to .mlg files (all in FlightLogs)
+        """
+        outdated = []
+        for mlg_file in dict.fromkeys(mlg_files):
+            txt_file = mlg_file.parent / f"{mlg_file.stem}[0].txt"
+            try:
+                if txt_file.stat().st_mtime >= mlg_file.stat().st_mtime:
+                    continue
+            except OSError:
+                pass
+            outdated.append(mlg_file)
+        
+        if len(outdated) < 2:
+            return
+        
+        if getattr(sys, 'frozen', False):
+            # Running as EXE - mlg2txt.exe is in the same folder
+            mlg2txt_cmd = [str(Path(sys.executable).parent / 'mlg2txt.exe')]
+        else:
+            # Running as script - call mlg2txt.py with Python
+            mlg2txt_cmd = [sys.executable, str(Path(__file__).parent / 'mlg2txt.py')]
+        if not Path(mlg2txt_cmd[-1]).exists():
+            return
+        
+        def convert(files: List[Path]) -> bool:
+            try:
+                result = subprocess.run(
+                    [*mlg2txt_cmd, '--output', str(self.flight_logs_dir), *map(str, files)],
+                    stdout=subprocess.DEVNULL,  # only stderr is ever read
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    timeout=30 * len(files),
+                    creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+                )
+            except Exception as e:
+                if self.verbose:
+                    print(f"    Error in mlg2txt batch conversion: {e}")
+                return False
+            if result.returncode != 0 and self.verbose:
+                print(f"    mlg2txt batch conversion failed: {result.stderr}")
+            return result.returncode == 0
+        
+        if self.verbose:
+            print(f"    Converting {len(outdated)} .mlg files to .txt...")
+        
+        if convert(outdated):
+            return
+        
+        # One process per file - the threads only wait for the processes
+        with ThreadPoolExecutor(max_workers=min(len(outdated), os.cpu_count() or 1)) as executor:
+            list(executor.map(convert, ([mlg_file] for mlg_file in outdated)))
     
     def _mlg_to_txt(self, mlg_file: Path) -> Optional[Path]:
         """
@@ -283,8 +529,6 @@ class MissionLogProcessor:
                 print(f"    Converting .mlg to .txt...")
             
             # Find mlg2txt executable
-            import sys
-            
             if getattr(sys, 'frozen', False):
                 # Running as compiled EXE
                 # mlg2txt.exe should be in same directory as the EXE
@@ -305,9 +549,6 @@ class MissionLogProcessor:
                     return None
             
             # Use subprocess to run mlg2txt
-            import subprocess
-            import sys
-            
             # Determine command based on whether we're running as EXE or script
             if getattr(sys, 'frozen', False):
                 # Running as EXE - call mlg2txt.exe directly
@@ -319,7 +560,8 @@ class MissionLogProcessor:
             # Run conversion
             result = subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,  # only stderr is ever read
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=30,
                 creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
@@ -363,8 +605,15 @@ class MissionLogProcessor:
             # Expected output: same name with .events.json
             json_file = txt_file.with_suffix('.events.json')
             
-            # ALWAYS regenerate JSON to ensure it reflects the latest mission report
-            # This is important when user re-flies missions (e.g., after being shot down)
+            # Reuse the JSON only if nothing it is built from changed since:
+            # the .txt, the parser itself and the object categories. A re-flown
+            # mission (e.g., after being shot down) has a new .mlg/.txt name,
+            # so it always gets a fresh JSON
+            if self._json_is_current(txt_file, json_file):
+                if self.verbose:
+                    print(f"    Using existing .json: {json_file.name}")
+                return json_file
+            
             if self.verbose:
                 if json_file.exists():
                     print(f"    Regenerating .json from latest report...")
@@ -391,6 +640,30 @@ class MissionLogProcessor:
                 traceback.print_exc()
             return None
 
+    def _json_is_current(self, txt_file: Path, json_file: Path) -> bool:
+        """
+        True if json_file is newer than txt_file, il2_mission_debrief and
+        object_categories.yaml (the inputs of _txt_to_json)
+        
+        In the EXE the parser is packed inside the executable (no file of its
+        own) and the bundled YAML is re-extracted on every launch, so there
+        the EXE itself and a user-edited YAML next to it are compared instead.
+        """
+        try:
+            json_mtime = json_file.stat().st_mtime
+            if getattr(sys, 'frozen', False):
+                exe_path = Path(sys.executable)
+                sources = [txt_file, exe_path]
+                config_path = exe_path.parent / "object_categories.yaml"
+            else:
+                sources = [txt_file, Path(self.debrief_parser.__file__)]
+                config_path = self.debrief_parser.GameObject.config_path()
+            if config_path.exists():
+                sources.append(config_path)
+            return all(source.stat().st_mtime <= json_mtime for source in sources)
+        except (OSError, AttributeError, TypeError):
+            return False
+
 
 def main():
     """Test/demo function"""